@@ -6,12 +6,14 @@ from fastapi import Depends
 from app.services.recommend_service import RecommendationService
 from app.services.geo_service import GeoService
 from app.services.report_service import LLMReportService
+from app.services.kakao_local_client import KakaoLocalClient
 
 
 # 싱글톤 인스턴스 저장
 _recommendation_service_instance = None
 _geo_service_instance = None
 _report_service_instance = None
+_kakao_local_client_instance = None
 
 
 def get_recommendation_service() -> RecommendationService:
@@ -49,3 +51,21 @@ def get_report_service() -> LLMReportService:
         print("✅ LLMReportService 초기화 완료")
 
     return _report_service_instance
+
+
+def get_kakao_local_client() -> KakaoLocalClient:
+    """Kakao Local 검색 클라이언트 의존성 (싱글톤, 커넥션 풀 공유)"""
+    global _kakao_local_client_instance
+
+    if _kakao_local_client_instance is None:
+        _kakao_local_client_instance = KakaoLocalClient()
+
+    return _kakao_local_client_instance
+
+
+async def close_shared_clients() -> None:
+    """앱 종료 시 공유 HTTP 클라이언트 정리"""
+    if _kakao_local_client_instance is not None:
+        await _kakao_local_client_instance.aclose()
+    if _report_service_instance is not None:
+        await _report_service_instance.aclose()
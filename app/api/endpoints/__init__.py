@@ -2,6 +2,6 @@
 API 엔드포인트 초기화
 """
 
-from app.api.endpoints import stations, usage_types, ml_recommend
+from app.api.endpoints import stations, usage_types, ml_recommend, recommend, tiles
 
-__all__ = ["stations", "usage_types", "ml_recommend"]
\ No newline at end of file
+__all__ = ["stations", "usage_types", "ml_recommend", "recommend", "tiles"]
\ No newline at end of file
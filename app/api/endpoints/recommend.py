@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, Body, HTTPException
 from typing import Dict, Any, Optional
 
 from app.api.dependencies import get_recommendation_service
-from app.services.recommend_service import RecommendationService
+from app.services.recommend_service import RecommendationService, RecommendationUnavailable
 
 
 # 라우터 생성
@@ -31,7 +31,7 @@ async def recommend_usage(
     
     - **location**: 위치 정보 (필수)
       - address: 주소
-      - coordinates: 좌표 (위도, 경도)
+      - coordinates: 좌표 {lat, lng} (주소가 없을 때 사용, 행정동 특징 기반 추천)
     - **options**: 추가 옵션 (선택)
       - region: 특정 권역 필터
       - algorithm: 추천 알고리즘 유형
@@ -39,6 +39,7 @@ async def recommend_usage(
     
     **Response**:
     - count: 추천 결과 수
+    - location: 좌표 요청일 때 해석된 행정동 (adm_cd2, adm_nm, sido, source, feature_source)
     - items: 추천 결과 목록
       - type: 활용 유형 (대분류)
       - score: 추천 점수 (0~1)
@@ -75,47 +76,26 @@ async def recommend_usage(
         
         # 주소 기반 추천 (기본)
         if address:
-            result = service.recommend_by_query(address, algorithm, top_k, region)
-            return result
+            try:
+                return service.recommend_by_query(address, algorithm, top_k, region)
+            except RecommendationUnavailable as e:
+                raise HTTPException(status_code=503, detail=str(e))
         
         # 좌표 기반 추천 (주소가 없고 좌표가 있는 경우)
+        # 좌표 → 행정동 (경계 인덱스, 없으면 최근접 주유소) → 행정동 특징 → 알고리즘
         elif lat is not None and lng is not None:
-            # 여기에 좌표 기반 추천 로직 구현 (현재는 더미 데이터)
-            # 실제 구현에서는 좌표에 가장 가까운 주유소를 찾아서 해당 주소로 추천 필요
-            dummy_result = {
-                "query": f"{lat},{lng}",
-                "timestamp": "2025-10-28T12:00:00Z",
-                "algorithm": algorithm_name,
-                "count": 5,
-                "items": [
-                    {
-                        "type": "근린생활시설",
-                        "score": 0.95,
-                        "description": "주변 상권과 인구 밀도를 고려할 때 근린생활시설로 활용하는 것이 가장 적합합니다."
-                    },
-                    {
-                        "type": "자동차관련시설",
-                        "score": 0.85,
-                        "description": "교통량이 많은 지역으로 자동차 관련 시설로 활용할 수 있습니다."
-                    },
-                    {
-                        "type": "판매시설",
-                        "score": 0.75,
-                        "description": "판매시설로 활용하여 지역 상권 활성화에 기여할 수 있습니다."
-                    },
-                    {
-                        "type": "업무시설",
-                        "score": 0.65,
-                        "description": "업무시설로 활용하여 지역 일자리 창출에 기여할 수 있습니다."
-                    },
-                    {
-                        "type": "공동주택",
-                        "score": 0.55,
-                        "description": "주거 공간으로 활용하여 주택 공급에 기여할 수 있습니다."
-                    }
-                ]
-            }
-            return dummy_result
+            try:
+                lat, lng = float(lat), float(lng)
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="좌표 형식 오류 (lat, lng 는 숫자)")
+            
+            if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+                raise HTTPException(status_code=400, detail="좌표 범위 오류")
+            
+            try:
+                return service.recommend_by_coordinates(lat, lng, algorithm, top_k, region)
+            except RecommendationUnavailable as e:
+                raise HTTPException(status_code=503, detail=str(e))
         
         # 주소와 좌표 모두 없는 경우
         else:
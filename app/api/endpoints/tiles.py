@@ -0,0 +1,61 @@
+"""
+벡터 타일(MVT) API 엔드포인트
+"""
+
+import asyncio
+import traceback
+
+from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi.responses import Response
+
+from app.api.dependencies import get_geo_service
+from app.services.geo_service import GeoService
+from app.services.vector_tiles import LAYER_ZOOMS, get_vector_tile_service, validate_tile
+
+
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+router = APIRouter(
+    prefix="/tiles",
+    tags=["tiles"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.get("/{layer}/{z}/{x}/{y}.pbf")
+async def get_vector_tile(
+    layer: str = Path(..., description=f"레이어 ({', '.join(LAYER_ZOOMS)})"),
+    z: int = Path(..., ge=0, le=22),
+    x: int = Path(..., ge=0),
+    y: int = Path(..., ge=0),
+    service: GeoService = Depends(get_geo_service),
+):
+    """
+    Mapbox Vector Tile
+    - stations: 폐·휴업 주유소 point (zoom 5~20)
+    - parcels: 필지 + 용도지역 polygon (zoom 14~20, PostGIS)
+    - 범위 밖 zoom / 데이터 없는 영역은 204 (빈 타일)
+    - 잘못된 요청(레이어 / 좌표)은 서비스 호출 전에 404 / 400,
+      그 이후 오류(PostGIS DSN 미설정, 풀 / 쿼리 실패 등)는 서버 측 문제이므로 503
+    """
+    if layer not in LAYER_ZOOMS:
+        raise HTTPException(status_code=404, detail=f"알 수 없는 레이어: {layer}")
+    try:
+        validate_tile(layer, z, x, y)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        # 캐시 파일 I/O / 인코딩 / PostGIS 조회는 스레드에서
+        content = await asyncio.to_thread(
+            get_vector_tile_service().get_tile, layer, z, x, y, service.stations
+        )
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=503, detail=f"타일 생성 오류: {str(e)}")
+
+    headers = {"Cache-Control": "public, max-age=86400"}
+    if not content:
+        return Response(status_code=204, headers=headers)
+
+    return Response(content=content, media_type=MVT_MEDIA_TYPE, headers=headers)
@@ -0,0 +1,198 @@
+"""
+지형도 필지 오버레이 벤치마크
+- 기존 필지 loop(wkb.loads + shp_transform 콜백) vs 배열 일괄 처리(TerrainMapService.draw_overlay)
+- 합성 필지 데이터(기본 5,000개, EPSG:5186 WKB)로 DB / VWorld 없이 측정
+- 두 결과 PNG의 픽셀 차이 비율도 함께 출력
+
+사용법:
+    python -m app.comparison.terrain_overlay_benchmark
+    python -m app.comparison.terrain_overlay_benchmark --parcels 5000 --repeat 5
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Dict, List
+
+import numpy as np
+import shapely
+from PIL import Image, ImageDraw
+from pyproj import Transformer
+from shapely import wkb
+from shapely.geometry import MultiPolygon, Polygon
+from shapely.ops import transform as shp_transform
+
+from app.services.terrain_service import TerrainMapService, _zoning_color
+
+
+# 강남역 부근
+CENTER_LON, CENTER_LAT = 127.0276, 37.4979
+
+ZONING_NAMES = [
+    "일반상업지역",
+    "제2종일반주거지역",
+    "제3종일반주거지역",
+    "준공업지역",
+    "자연녹지지역",
+    "유통상업지역",
+    None,
+]
+
+
+def make_parcels(n: int, radius: float = 500, seed: int = 42) -> List[Dict]:
+    """
+    중심점 반경 내 합성 필지 n개 (EPSG:5186 WKB)
+    - 8~40m 크기의 찌그러진 사각형, 약 5%는 MultiPolygon
+    """
+    rng = random.Random(seed)
+    cx, cy = Transformer.from_crs(4326, 5186, always_xy=True).transform(CENTER_LON, CENTER_LAT)
+
+    parcels = []
+    for i in range(n):
+        r = radius * rng.random() ** 0.5
+        theta = rng.uniform(0, 2 * np.pi)
+        x0, y0 = cx + r * np.cos(theta), cy + r * np.sin(theta)
+
+        def quad(x, y):
+            w, h = rng.uniform(8, 40), rng.uniform(8, 40)
+            return Polygon([
+                (x + rng.uniform(-2, 2), y + rng.uniform(-2, 2)),
+                (x + w + rng.uniform(-2, 2), y + rng.uniform(-2, 2)),
+                (x + w + rng.uniform(-2, 2), y + h + rng.uniform(-2, 2)),
+                (x + rng.uniform(-2, 2), y + h + rng.uniform(-2, 2)),
+            ])
+
+        geom = quad(x0, y0)
+        if rng.random() < 0.05:
+            geom = MultiPolygon([geom, quad(x0 + 50, y0 + 50)])
+
+        parcels.append({
+            "geom": shapely.to_wkb(geom),
+            "pnu": f"11680101{i:011d}",
+            "jibun": f"{rng.randint(1, 999)}-{rng.randint(1, 50)}" if rng.random() < 0.9 else None,
+            "zoning_name": rng.choice(ZONING_NAMES),
+            "zoning_lclass": None,
+        })
+    return parcels
+
+
+def legacy_draw_parcels(service: TerrainMapService, base_img, bbox, parcels):
+    """배열 처리 이전의 필지 loop (비교 기준)"""
+    minx, miny, maxx, maxy = bbox
+    draw = ImageDraw.Draw(base_img, "RGBA")
+
+    def proj_3857_to_px(x, y):
+        return (
+            int((x - minx) / (maxx - minx) * base_img.width),
+            int((maxy - y) / (maxy - miny) * base_img.height),
+        )
+
+    for row in parcels:
+        try:
+            geom_bytes = row.get("geom")
+            if geom_bytes is None:
+                continue
+            g5186 = wkb.loads(geom_bytes)
+        except Exception as e:
+            print(f"[WKB ERROR] {e}")
+            continue
+
+        g3857 = shp_transform(service.tr_5186_to_3857.transform, g5186)
+        if g3857.is_empty:
+            continue
+
+        if g3857.geom_type == "Polygon":
+            polys = [g3857]
+        elif g3857.geom_type == "MultiPolygon":
+            polys = list(g3857.geoms)
+        else:
+            continue
+
+        pnu = row.get("pnu")
+        jibun = row.get("jibun")
+        fill_color = _zoning_color(row.get("zoning_name"), row.get("zoning_lclass"))
+
+        for poly in polys:
+            coords = [proj_3857_to_px(x, y) for x, y in poly.exterior.coords]
+
+            shadow = [(x + 1, y + 1) for x, y in coords]
+            draw.polygon(shadow, fill=(0, 0, 0, 40))
+            draw.polygon(coords, fill=fill_color, outline=(255, 255, 255, 180))
+            draw.line(coords, fill=(80, 80, 80, 160), width=1)
+
+            centroid = poly.centroid
+            cx_px, cy_px = proj_3857_to_px(centroid.x, centroid.y)
+            label = jibun or (pnu[-4:] if pnu else None)
+
+            xs = [p[0] for p in coords]
+            ys = [p[1] for p in coords]
+            if (max(xs) - min(xs)) < 25 or (max(ys) - min(ys)) < 18:
+                label = None
+
+            if label:
+                draw.text((cx_px, cy_px), str(label), fill=(30, 30, 30, 220))
+
+    return base_img
+
+
+def legacy_draw_overlay(service: TerrainMapService, base_img, bbox, parcels):
+    """기존 필지 loop + 버퍼 / 중심점 (필지 없이 draw_overlay 호출)"""
+    legacy_draw_parcels(service, base_img, bbox, parcels)
+    return service.draw_overlay(base_img, bbox, CENTER_LON, CENTER_LAT, [])
+
+
+def vectorized_draw_overlay(service: TerrainMapService, base_img, bbox, parcels):
+    """draw_overlay (필지 + 버퍼 + 중심점)"""
+    return service.draw_overlay(base_img, bbox, CENTER_LON, CENTER_LAT, parcels)
+
+
+def measure(func, service, bbox, parcels, repeat: int, size: int):
+    times = []
+    img = None
+    for _ in range(repeat):
+        img = Image.new("RGBA", (size, size), (160, 160, 160, 255))
+        start = time.perf_counter()
+        func(service, img, bbox, parcels)
+        times.append((time.perf_counter() - start) * 1000)
+    return times, img
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지형도 필지 오버레이 벤치마크")
+    parser.add_argument("--parcels", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--size", type=int, default=768)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print(f"🗺️  필지 오버레이 벤치마크 (필지 {args.parcels}개, {args.size}px, {args.repeat}회)")
+    print("=" * 80 + "\n")
+
+    # tile_cache / pool 은 사용하지 않음 (네트워크 / DB 없이 실행)
+    service = TerrainMapService(tile_cache=object(), pool=object())
+    bbox = service.compute_bbox_around(CENTER_LON, CENTER_LAT, meter=500)
+    parcels = make_parcels(args.parcels)
+
+    legacy_times, legacy_img = measure(legacy_draw_overlay, service, bbox, parcels, args.repeat, args.size)
+    fast_times, fast_img = measure(vectorized_draw_overlay, service, bbox, parcels, args.repeat, args.size)
+
+    diff = np.any(np.asarray(legacy_img) != np.asarray(fast_img), axis=-1)
+
+    for name, times in (("기존 loop", legacy_times), ("배열 일괄", fast_times)):
+        print(
+            f"{name:8s}  median {statistics.median(times):8.1f}ms  "
+            f"min {min(times):8.1f}ms  max {max(times):8.1f}ms"
+        )
+
+    speedup = statistics.median(legacy_times) / statistics.median(fast_times)
+    print(f"\n⚡ 속도 향상: {speedup:.2f}배")
+    print(f"🔍 픽셀 차이: {diff.mean() * 100:.3f}% ({int(diff.sum())}px)")
+    print("   (캔버스 밖 중심점 라벨 생략분만큼 차이가 날 수 있음)")
+
+    print("\n✅ 벤치마크 완료!")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    main()
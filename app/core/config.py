@@ -28,6 +28,10 @@ class Settings(BaseSettings):
 
     # Kakao REST API 키 추가
     KAKAO_REST_API_KEY: Optional[str] = None
+    KAKAO_LOCAL_API_URL: str = "https://dapi.kakao.com/v2/local/search/keyword.json"
+
+    # /{id}/report?refresh=true 허용 여부 (캐시 무시 = 유료 LLM 재호출, 운영에서는 끔)
+    REPORT_REFRESH_ENABLED: bool = False
     
     # CORS
     CORS_ORIGINS: List[str] = ["*"]
@@ -40,6 +44,9 @@ class Settings(BaseSettings):
     postgres_password: Optional[str] = None
 
     POSTGRES_DSN: Optional[str] = None
+    POSTGRES_POOL_MIN: int = 1
+    POSTGRES_POOL_MAX: int = 10
+    POSTGRES_POOL_TIMEOUT: float = 10.0
     
     class Config:
         env_file = ".env"
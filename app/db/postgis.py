@@ -0,0 +1,282 @@
+"""
+PostGIS 공용 접근 계층
+- Settings.POSTGRES_DSN (없으면 postgres_* 필드)로 연결 정보 구성
+- psycopg2 ThreadedConnectionPool + 세마포어: 풀이 가득 차면 에러 대신 대기 (타임아웃)
+- 커넥션별 PREPARE 1회 → 이후 EXECUTE (반경 필지 조회 등 반복 쿼리)
+- 헬스 체크 / 풀 포화 지표
+- FastAPI 핸들러용 async 래퍼 (스레드에서 실행)
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set
+
+import psycopg2
+from psycopg2 import extensions, pool as pg_pool
+
+from app.core.config import get_settings
+
+
+class PoolTimeoutError(RuntimeError):
+    """커넥션 대기 시간 초과"""
+
+
+class _PoolConnection(extensions.connection):
+    """PREPARE 된 statement 이름을 기억하는 커넥션"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: Set[str] = set()
+
+
+def build_dsn(settings=None) -> Optional[str]:
+    """POSTGRES_DSN 우선, 없으면 postgres_* 필드로 DSN 구성 (둘 다 없으면 None)"""
+    settings = settings or get_settings()
+
+    if settings.POSTGRES_DSN:
+        return settings.POSTGRES_DSN
+
+    if not settings.postgres_host or not settings.postgres_db:
+        return None
+
+    parts = {
+        "host": settings.postgres_host,
+        "port": settings.postgres_port,
+        "dbname": settings.postgres_db,
+        "user": settings.postgres_user,
+        "password": settings.postgres_password,
+    }
+    return " ".join(f"{key}={value}" for key, value in parts.items() if value not in (None, ""))
+
+
+class PostGISPool:
+    """동기 커넥션 풀 + 대기 제한 + 지표"""
+
+    def __init__(
+        self,
+        dsn: str,
+        minconn: int = 1,
+        maxconn: int = 10,
+        acquire_timeout: float = 10.0,
+    ) -> None:
+        if not dsn:
+            raise ValueError("PostGIS DSN이 설정되지 않았습니다 (POSTGRES_DSN 또는 POSTGRES_HOST/DB).")
+
+        self.dsn = dsn
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.acquire_timeout = acquire_timeout
+        self._pool: Optional[pg_pool.ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(maxconn)
+
+        # 지표
+        self._metrics_lock = threading.Lock()
+        self.in_use = 0
+        self.waiting = 0
+        self.acquired_total = 0
+        self.timeouts_total = 0
+        self.discarded_total = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    # ------------------------------------------------------------------
+    # 커넥션 획득 / 반환
+    # ------------------------------------------------------------------
+    def _get_pool(self) -> pg_pool.ThreadedConnectionPool:
+        # 첫 사용 시점에 연결 (DB 없이도 앱 기동 가능)
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = pg_pool.ThreadedConnectionPool(
+                        self.minconn,
+                        self.maxconn,
+                        self.dsn,
+                        connection_factory=_PoolConnection,
+                    )
+        return self._pool
+
+    def _update(self, **deltas: float) -> None:
+        with self._metrics_lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    @contextmanager
+    def connection(self) -> Iterator[_PoolConnection]:
+        """
+        풀에서 커넥션 대여
+        - 정상 종료: commit, 예외: rollback
+        - 끊어진 커넥션은 반환 시 폐기
+        """
+        self._update(waiting=1)
+        started = time.perf_counter()
+        acquired = self._slots.acquire(timeout=self.acquire_timeout)
+        wait_ms = (time.perf_counter() - started) * 1000
+        self._update(waiting=-1)
+
+        if not acquired:
+            self._update(timeouts_total=1)
+            raise PoolTimeoutError(f"PostGIS 커넥션 대기 시간 초과 ({self.acquire_timeout}s)")
+
+        with self._metrics_lock:
+            self.in_use += 1
+            self.acquired_total += 1
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+
+        conn = None
+        broken = False
+        try:
+            pool = self._get_pool()
+            conn = pool.getconn()
+            if conn.closed:
+                pool.putconn(conn, close=True)
+                self._update(discarded_total=1)
+                conn = pool.getconn()
+
+            try:
+                yield conn
+                conn.commit()
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                broken = True
+                raise
+            except Exception:
+                if not conn.closed:
+                    conn.rollback()
+                raise
+        finally:
+            if conn is not None:
+                close = broken or bool(conn.closed)
+                if close:
+                    self._update(discarded_total=1)
+                self._get_pool().putconn(conn, close=close)
+            self._update(in_use=-1)
+            self._slots.release()
+
+    @contextmanager
+    def cursor(self, cursor_factory=None) -> Iterator[Any]:
+        with self.connection() as conn:
+            with conn.cursor(cursor_factory=cursor_factory) as cur:
+                yield cur
+
+    # ------------------------------------------------------------------
+    # 조회 유틸
+    # ------------------------------------------------------------------
+    def fetchall(self, sql: str, params: Optional[Sequence[Any]] = None, cursor_factory=None) -> List[Any]:
+        with self.cursor(cursor_factory=cursor_factory) as cur:
+            cur.execute(sql, params)
+            return cur.fetchall()
+
+    def fetch_prepared(
+        self,
+        name: str,
+        sql: str,
+        arg_types: Sequence[str],
+        params: Sequence[Any],
+        cursor_factory=None,
+    ) -> List[Any]:
+        """
+        서버측 prepared statement 실행
+        - sql 의 파라미터는 $1, $2 ... 형식
+        - 커넥션마다 최초 1회만 PREPARE
+        """
+        with self.connection() as conn:
+            with conn.cursor(cursor_factory=cursor_factory) as cur:
+                if name not in conn.prepared:
+                    cur.execute(f"PREPARE {name} ({', '.join(arg_types)}) AS {sql}")
+                    conn.prepared.add(name)
+                placeholders = ", ".join(["%s"] * len(params))
+                cur.execute(f"EXECUTE {name} ({placeholders})", tuple(params))
+                return cur.fetchall()
+
+    async def run_async(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """블로킹 DB 작업을 스레드에서 실행 (이벤트 루프 비차단)"""
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def fetchall_async(self, sql: str, params: Optional[Sequence[Any]] = None, cursor_factory=None) -> List[Any]:
+        return await self.run_async(self.fetchall, sql, params, cursor_factory)
+
+    # ------------------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------------------
+    def health_check(self) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            with self.cursor() as cur:
+                cur.execute("SELECT postgis_lib_version()")
+                version = cur.fetchone()[0]
+            return {
+                "ok": True,
+                "postgis": version,
+                "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
+        except Exception as e:
+            return {
+                "ok": False,
+                "error": str(e),
+                "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._metrics_lock:
+            return {
+                "maxconn": self.maxconn,
+                "in_use": self.in_use,
+                "waiting": self.waiting,
+                "saturation": round(self.in_use / self.maxconn, 3),
+                "acquired_total": self.acquired_total,
+                "timeouts_total": self.timeouts_total,
+                "discarded_total": self.discarded_total,
+                "wait_ms_avg": round(self.wait_ms_total / self.acquired_total, 2) if self.acquired_total else None,
+                "wait_ms_max": round(self.wait_ms_max, 2),
+            }
+
+    def close(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+
+
+_postgis_pools: Dict[str, PostGISPool] = {}
+_postgis_pools_lock = threading.Lock()
+
+
+def get_postgis_pool(dsn: Optional[str] = None) -> PostGISPool:
+    """DSN별 PostGISPool 싱글톤 (dsn 미지정 시 Settings 기준)"""
+
+    dsn = dsn or build_dsn()
+    if not dsn:
+        raise ValueError("PostGIS DSN이 설정되지 않았습니다 (POSTGRES_DSN 또는 POSTGRES_HOST/DB).")
+
+    with _postgis_pools_lock:
+        pool = _postgis_pools.get(dsn)
+        if pool is None:
+            settings = get_settings()
+            pool = _postgis_pools[dsn] = PostGISPool(
+                dsn,
+                minconn=settings.POSTGRES_POOL_MIN,
+                maxconn=settings.POSTGRES_POOL_MAX,
+                acquire_timeout=settings.POSTGRES_POOL_TIMEOUT,
+            )
+    return pool
+
+
+def postgis_status() -> Dict[str, Any]:
+    """생성된 풀들의 헬스 체크 + 지표 (DSN은 노출하지 않음)"""
+    if not _postgis_pools and build_dsn():
+        get_postgis_pool()
+
+    return {
+        f"pool{i}": {"health": pool.health_check(), "metrics": pool.metrics()}
+        for i, pool in enumerate(list(_postgis_pools.values()))
+    }
+
+
+def close_postgis_pools() -> None:
+    with _postgis_pools_lock:
+        for pool in _postgis_pools.values():
+            pool.close()
+        _postgis_pools.clear()
@@ -0,0 +1,92 @@
+"""
+법정동 코드 레지스트리
+- 법정동_코드_전체자료.csv를 1회만 파싱 (벡터화 정규화)
+- 10자리 코드 → 이름, 시도/시군구 prefix → 이름, 이름 → 코드 를 dict로 O(1) 조회
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from app.core.config import DATA_DIR
+from app.utils.address_utils import normalize_adm_code, normalize_adm_code_series
+
+
+BJD_PATH = DATA_DIR / "법정동_코드_전체자료.csv"
+
+
+class AdmCodeRegistry:
+    """정규화된 10자리 법정동 코드 기준 이름 조회"""
+
+    def __init__(self, df: pd.DataFrame):
+        codes = normalize_adm_code_series(df["법정동코드"])
+        names = df["법정동명"].astype(str).str.strip()
+
+        # 같은 코드가 여러 번 나오면 첫 번째 행 우선 (기존 iloc[0] 조회와 동일)
+        name_by_code = pd.Series(names.to_numpy(), index=codes.to_numpy())
+        name_by_code = name_by_code[~name_by_code.index.duplicated(keep="first")]
+        self._name_by_code: Dict[str, str] = name_by_code.to_dict()
+
+        # 이름 → 코드: 폐지되지 않은 코드 우선
+        if "폐지여부" in df.columns:
+            order = (df["폐지여부"].astype(str).str.strip() == "폐지").to_numpy().argsort(kind="stable")
+        else:
+            order = range(len(df))
+        self._code_by_name: Dict[str, str] = {}
+        code_values = codes.to_numpy()
+        name_values = names.to_numpy()
+        for i in order:
+            self._code_by_name.setdefault(name_values[i], code_values[i])
+
+    @classmethod
+    def from_csv(cls, path: Path = BJD_PATH) -> "AdmCodeRegistry":
+        return cls(pd.read_csv(path, dtype=str))
+
+    def __len__(self) -> int:
+        return len(self._name_by_code)
+
+    def name_of(self, code: Any) -> Optional[str]:
+        """adm_cd2 / 법정동코드 → 정규화 → 법정동명"""
+        normalized = normalize_adm_code(code)
+        if normalized is None:
+            return None
+        return self._name_by_code.get(normalized)
+
+    def names_of(self, codes: pd.Series) -> pd.Series:
+        """코드 Series → 법정동명 Series (없는 코드는 NaN)"""
+        return normalize_adm_code_series(codes).map(self._name_by_code)
+
+    def sido_name(self, code: Any) -> Optional[str]:
+        """코드 앞 2자리(시도) → 시도명"""
+        normalized = normalize_adm_code(code)
+        if normalized is None:
+            return None
+        return self._name_by_code.get(normalized[:2] + "00000000")
+
+    def sigungu_name(self, code: Any) -> Optional[str]:
+        """코드 앞 5자리(시군구) → '시도 시군구' 이름"""
+        normalized = normalize_adm_code(code)
+        if normalized is None:
+            return None
+        return self._name_by_code.get(normalized[:5] + "00000")
+
+    def code_of(self, name: str) -> Optional[str]:
+        """법정동명(전체 이름) → 10자리 코드"""
+        if not name:
+            return None
+        return self._code_by_name.get(str(name).strip())
+
+
+_adm_code_registry_instance: Optional[AdmCodeRegistry] = None
+
+
+def get_adm_code_registry() -> AdmCodeRegistry:
+    """AdmCodeRegistry 싱글톤 (최초 호출 시 CSV 1회 로드)"""
+
+    global _adm_code_registry_instance
+
+    if _adm_code_registry_instance is None:
+        _adm_code_registry_instance = AdmCodeRegistry.from_csv()
+
+    return _adm_code_registry_instance
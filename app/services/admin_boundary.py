@@ -0,0 +1,127 @@
+"""
+행정동 경계 point-in-polygon 인덱스
+- HangJeongDong_ver20250401_simplified.json (행정동 경계, CRS84) 을 1회만 로드해 STRtree 구축
+- 좌표 배열 → 행정동 배치 할당: shapely 2.0 벡터화 STRtree.query(predicate="within")
+  (폴리곤이 점을 contains 하는 쌍만, 경계선 위 점은 앞 feature 우선)
+- 단순화된 경계라 해안선 / 경계 틈에 떨어진 점은 가까운 행정동으로 보정 (NEAREST_MAX_DEG 이내)
+- adm_cd2 가 없는 station 행, /recommend 좌표 입력 등에서 코드 보완용
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+from app.core.config import DATA_DIR
+from app.utils.address_utils import normalize_adm_code
+
+
+HJD_BOUNDARY_PATH = DATA_DIR / "HangJeongDong_ver20250401_simplified.json"
+
+# 경계 밖 점을 가장 가까운 행정동으로 보정할 최대 거리 (도 단위, 약 1km)
+NEAREST_MAX_DEG = 0.01
+
+# 조회 결과에 포함할 feature 속성
+BOUNDARY_PROPERTIES = ("adm_cd2", "adm_nm", "sido", "sidonm", "sgg", "sggnm", "adm_cd")
+
+
+class AdminBoundaryIndex:
+    """행정동 폴리곤 STRtree + 좌표 → 행정동 조회"""
+
+    def __init__(self, geometries: List[Any], properties: List[Dict[str, Any]]):
+        self.geometries = np.asarray(geometries, dtype=object)
+        self.properties = [
+            {key: props.get(key) for key in BOUNDARY_PROPERTIES} for props in properties
+        ]
+        # adm_cd2 는 station 법정동코드와 같은 10자리 정규화 형식으로
+        for props in self.properties:
+            props["adm_cd2"] = normalize_adm_code(props["adm_cd2"])
+        self.codes = np.asarray([props["adm_cd2"] for props in self.properties], dtype=object)
+        self._name_by_code: Dict[str, str] = {}
+        for props in self.properties:
+            if props["adm_cd2"] and props["adm_nm"]:
+                self._name_by_code.setdefault(props["adm_cd2"], props["adm_nm"])
+        self.tree = shapely.STRtree(self.geometries)
+
+    @classmethod
+    def from_geojson(cls, path: Path = HJD_BOUNDARY_PATH) -> "AdminBoundaryIndex":
+        with open(path, encoding="utf-8") as f:
+            collection = json.load(f)
+
+        geometries, properties = [], []
+        for feature in collection.get("features", []):
+            if not feature.get("geometry"):
+                continue
+            geometries.append(shape(feature["geometry"]))
+            properties.append(feature.get("properties") or {})
+        return cls(geometries, properties)
+
+    def __len__(self) -> int:
+        return len(self.geometries)
+
+    def name_of(self, code: Any) -> Optional[str]:
+        """10자리 행정동 코드 → 행정동 전체 이름 (예: 서울특별시 중구 명동)"""
+        normalized = normalize_adm_code(code)
+        if normalized is None:
+            return None
+        return self._name_by_code.get(normalized)
+
+    def locate(self, lngs, lats, nearest: bool = True) -> np.ndarray:
+        """
+        좌표 배열 → 행정동 feature 위치 배열 (찾지 못하면 -1)
+        - nearest=True 면 어느 폴리곤에도 속하지 않는 점은 NEAREST_MAX_DEG 이내 최근접 행정동
+        """
+        lngs = np.asarray(lngs, dtype=float)
+        lats = np.asarray(lats, dtype=float)
+        result = np.full(len(lngs), -1, dtype=np.int64)
+
+        valid = np.flatnonzero(np.isfinite(lngs) & np.isfinite(lats))
+        if not len(valid) or not len(self):
+            return result
+
+        points = shapely.points(lngs[valid], lats[valid])
+        point_idx, tree_idx = self.tree.query(points, predicate="within")
+
+        # 같은 점이 여러 폴리곤 경계에 걸치면 feature 순서가 앞선 것
+        order = np.lexsort((tree_idx, point_idx))
+        first_point, first = np.unique(point_idx[order], return_index=True)
+        result[valid[first_point]] = tree_idx[order][first]
+
+        if nearest:
+            missing = np.flatnonzero(result[valid] < 0)
+            if len(missing):
+                near_point, near_tree = self.tree.query_nearest(
+                    points[missing], max_distance=NEAREST_MAX_DEG, all_matches=False
+                )
+                result[valid[missing[near_point]]] = near_tree
+
+        return result
+
+    def codes_at(self, lngs, lats, nearest: bool = True) -> List[Optional[str]]:
+        """좌표 배열 → 10자리 행정동 코드(adm_cd2) 목록 (없으면 None)"""
+        idx = self.locate(lngs, lats, nearest=nearest)
+        return [self.codes[i] if i >= 0 else None for i in idx]
+
+    def lookup(self, lng: float, lat: float, nearest: bool = True) -> Optional[Dict[str, Any]]:
+        """단일 좌표 → 행정동 속성 (adm_cd2, adm_nm, sido, sgg, ...)"""
+        idx = int(self.locate([lng], [lat], nearest=nearest)[0])
+        if idx < 0:
+            return None
+        return dict(self.properties[idx])
+
+
+_admin_boundary_index_instance: Optional[AdminBoundaryIndex] = None
+
+
+def get_admin_boundary_index() -> AdminBoundaryIndex:
+    """AdminBoundaryIndex 싱글톤 (최초 호출 시 GeoJSON 1회 로드)"""
+
+    global _admin_boundary_index_instance
+
+    if _admin_boundary_index_instance is None:
+        _admin_boundary_index_instance = AdminBoundaryIndex.from_geojson()
+
+    return _admin_boundary_index_instance
@@ -0,0 +1,121 @@
+"""
+행정동별 추천 특징 테이블 (좌표 기반 추천용)
+- dong_stats.csv (행정동 코드별 인구 / 교통량 / 관광지수 / 상권밀집도) 를 1회만 로드
+- 행정동 값이 없으면 같은 시군구(앞 5자리) → 시도(앞 2자리) → 전체 평균 순으로 컬럼별 보완
+  (prefix 별 평균을 로드 시 미리 계산 → 조회는 dict 3회)
+- 센트로이드와 같은 기준(추천결과_행단위 raw 컬럼 평균 / 표준편차)으로 z-score → *_norm 특징
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import DATA_DIR
+from app.utils.address_utils import normalize_adm_code, normalize_adm_code_series
+
+
+DONG_STATS_PATH = DATA_DIR / "dong_stats.csv"
+
+# dong_stats 컬럼 → 추천결과 / 센트로이드 특징 이름
+DONG_FEATURE_COLUMNS = {
+    "population": "인구[명]",
+    "traffic": "교통량(AADT)",
+    "tourism": "숙박업소(관광지수)",
+    "commercial_density": "상권밀집도(비율)",
+}
+
+# 조회 순서 (코드 prefix 길이, 출처 이름)
+_LEVELS = ((10, "emd"), (5, "sigungu"), (2, "sido"))
+
+
+def zscore_stats(df: pd.DataFrame, columns: Sequence[str]) -> Dict[str, Tuple[float, float]]:
+    """컬럼별 (평균, 표준편차) — normalize_features / 센트로이드 생성과 같은 표본 표준편차"""
+    stats = {}
+    for col in columns:
+        if col not in df.columns:
+            continue
+        values = pd.to_numeric(df[col], errors="coerce")
+        std = values.std()
+        stats[col] = (float(values.mean()), float(std) if std and np.isfinite(std) else 1e-9)
+    return stats
+
+
+class DongFeatureTable:
+    """행정동 코드 → raw / 정규화 특징"""
+
+    def __init__(self, df: pd.DataFrame):
+        codes = normalize_adm_code_series(df["adm_cd"])
+        values = df[list(DONG_FEATURE_COLUMNS)].apply(pd.to_numeric, errors="coerce")
+        values.columns = [DONG_FEATURE_COLUMNS[col] for col in values.columns]
+
+        self.columns = list(values.columns)
+        self._by_prefix: Dict[int, Dict[str, np.ndarray]] = {}
+        for length, _ in _LEVELS:
+            grouped = values.groupby(codes.str[:length].to_numpy()).mean()
+            self._by_prefix[length] = {
+                str(code): row.to_numpy(dtype=float) for code, row in grouped.iterrows()
+            }
+        self._overall = values.mean().to_numpy(dtype=float)
+        self.stats = zscore_stats(values, self.columns)
+
+    @classmethod
+    def from_csv(cls, path: Path = DONG_STATS_PATH) -> "DongFeatureTable":
+        return cls(pd.read_csv(path, dtype={"adm_cd": str}, encoding="utf-8-sig"))
+
+    def __len__(self) -> int:
+        return len(self._by_prefix[10])
+
+    def raw_features(self, code: Any) -> Tuple[Dict[str, float], str]:
+        """
+        행정동 코드 → (raw 특징, 출처)
+        - 출처: 행정동 값이 그대로 있으면 "emd", 상위 평균으로 보완했으면 가장 넓은 보완 단계
+        """
+        normalized = normalize_adm_code(code) or ""
+        result = np.full(len(self.columns), np.nan)
+        source = "overall"
+
+        for length, level in _LEVELS:
+            vec = self._by_prefix[length].get(normalized[:length]) if normalized else None
+            if vec is None:
+                continue
+            fill = np.isnan(result) & np.isfinite(vec)
+            if fill.any():
+                result[fill] = vec[fill]
+                source = level
+            if np.isfinite(result).all():
+                break
+
+        missing = ~np.isfinite(result)
+        if missing.any():
+            result[missing] = self._overall[missing]
+            source = "overall"
+
+        return dict(zip(self.columns, result.tolist())), source
+
+    def features(
+        self, code: Any, stats: Optional[Dict[str, Tuple[float, float]]] = None
+    ) -> Tuple[Dict[str, float], str]:
+        """raw 특징 + {컬럼}_norm (stats 미지정 시 dong_stats 자체 기준)"""
+        stats = stats or self.stats
+        raw, source = self.raw_features(code)
+        features = dict(raw)
+        for col, value in raw.items():
+            mean, std = stats.get(col, self.stats[col])
+            features[f"{col}_norm"] = (value - mean) / std
+        return features, source
+
+
+_dong_feature_table_instance: Optional[DongFeatureTable] = None
+
+
+def get_dong_feature_table() -> DongFeatureTable:
+    """DongFeatureTable 싱글톤 (최초 호출 시 CSV 1회 로드)"""
+
+    global _dong_feature_table_instance
+
+    if _dong_feature_table_instance is None:
+        _dong_feature_table_instance = DongFeatureTable.from_csv()
+
+    return _dong_feature_table_instance
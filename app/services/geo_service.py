@@ -9,6 +9,23 @@ import re
 
 from app.utils.data_loader import load_all_data
 from app.utils.preprocessing import preprocess_gas_station_data, extract_admin_region, extract_province, normalize_region
+from app.services.adm_code_registry import get_adm_code_registry
+from app.services.admin_boundary import get_admin_boundary_index
+from app.services.region_index import RegionTree
+from app.services.station_clusters import StationClusterIndex
+from app.services.station_index import StationGridIndex, StationResolver
+from app.services.station_payload import LEAN_STATION_FIELDS, encode_json, station_feature
+from app.services.station_table import StationTable
+from app.services.text_index import NgramTextIndex
+
+
+# station_features 캐시에 보관할 필드 조합 수 (기본 필드 + 자주 쓰는 조합)
+FEATURE_CACHE_LIMIT = 8
+
+
+def _encode_feature(record: Dict[str, Any], fields: Optional[List[str]]) -> Optional[bytes]:
+    feature = station_feature(record, fields)
+    return None if feature is None else encode_json(feature)
 
 
 class GeoService:
@@ -16,6 +33,14 @@ class GeoService:
     
     def __init__(self):
         self.data = None
+        self.stations: Optional[StationTable] = None
+        self.station_resolver: Optional[StationResolver] = None
+        self.station_grid: Optional[StationGridIndex] = None
+        self.station_clusters: Optional[StationClusterIndex] = None
+        self.text_index: Optional[NgramTextIndex] = None
+        self.region_tree: Optional[RegionTree] = None
+        # 응답 필드 조합별 인코딩된 station GeoJSON feature (행 위치 순, 좌표 없으면 None)
+        self._feature_cache: Dict[Optional[Tuple[str, ...]], List[Optional[bytes]]] = {}
         self.initialize_data()
     
     def initialize_data(self):
@@ -35,6 +60,42 @@ class GeoService:
                     .str.strip()
             )
             self.data["gas_station"] = preprocess_gas_station_data(self.data["gas_station"])        
+
+            # 중복 컬럼은 로드 시 1회만 정리 (요청마다 전체 테이블 복사 방지)
+            gas_df = self.data["gas_station"]
+            self.data["gas_station"] = gas_df.loc[:, ~gas_df.columns.duplicated()]
+
+            # 요청 처리용 읽기 전용 스냅샷 + 좌표 기반 ID 공간 인덱스 (로드 시 1회 구축)
+            self.stations = StationTable(self.data["gas_station"])
+            self.station_resolver = StationResolver(
+                self.stations.column("위도"),
+                self.stations.column("경도"),
+            )
+            # 지도 범위 조회용 격자 인덱스 + JSON 응답용 레코드 (NaN 정리 1회)
+            self.station_grid = StationGridIndex(
+                self.stations.column("위도"),
+                self.stations.column("경도"),
+            )
+            self.stations.json_records()
+            # 상호 / 주소 / 행정구역 / 권역 / 상태 부분 문자열 검색용 n-gram 역색인
+            self.text_index = NgramTextIndex({
+                col: self.stations.column(col)
+                for col in ("상호", "주소", "행정구역", "권역", "상태")
+                if col in self.stations
+            })
+            # 저 zoom 지도용 계층 클러스터 (recommend1 히스토그램 포함)
+            self.station_clusters = StationClusterIndex(
+                self.stations.column("위도"),
+                self.stations.column("경도"),
+                self.stations.column("recommend1") if "recommend1" in self.stations else [None] * len(self.stations),
+            )
+            # 시도 → 시군구 → 읍면동 지역 트리 (법정동코드 prefix) + 기본 필드 GeoJSON feature
+            self.region_tree = self._build_region_tree()
+            self._feature_cache = {}
+            self.station_features(
+                range(len(self.stations)),
+                [col for col in LEAN_STATION_FIELDS if col in self.stations],
+            )
         
             print(f"🔧 주유소 데이터 로드 완료: {len(self.data['gas_station'])}개 행")
             print("✅ 지리 정보 서비스 초기화 완료")
@@ -49,109 +110,138 @@ class GeoService:
             print(f"⚠️ 지리 정보 서비스 초기화 실패: {str(e)}")
     
 
-    def search_by_name(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """상호(주유소 이름)로 주유소 검색"""
-        if not query or not self.data or "gas_station" not in self.data:
-            return []
-        
-        gas_df = self.data["gas_station"]
+    def _build_region_tree(self) -> Optional[RegionTree]:
+        if "법정동코드" not in self.stations:
+            return None
+        lookups = []
+        try:
+            lookups.append(get_adm_code_registry().name_of)
+        except Exception as e:
+            print(f"⚠️ 법정동 코드 레지스트리 로드 실패: {e}")
+        try:
+            # 법정동 목록에 없는 행정동 코드(읍면동)는 행정동 경계 이름으로 보완
+            lookups.append(get_admin_boundary_index().name_of)
+        except Exception as e:
+            print(f"⚠️ 행정동 경계 로드 실패: {e}")
 
-        # '상호' 컬럼이 있는지 확인
-        if "상호" not in gas_df.columns:
-            return []
-        
-        # 검색어가 포함된 상호만 필터링 (대소문자 무시)
-        filtered_df = gas_df[gas_df["상호"].astype(str).str.contains(query, case=False, na=False)]
-        
-        # 상위 limit개만 반환
-        result = filtered_df.head(limit).to_dict('records')
-        
-        return result
+        def name_of(code: str) -> Optional[str]:
+            for lookup in lookups:
+                name = lookup(code)
+                if name:
+                    return name
+            return None
+
+        return RegionTree(
+            self.stations.column("법정동코드"),
+            name_of,
+            self.stations.column("권역") if "권역" in self.stations else None,
+        )
+
+
+    def station_features(self, positions, fields: Optional[List[str]]) -> List[bytes]:
+        """
+        행 위치 → 인코딩된 GeoJSON feature 조각
+        (필드 조합별로 전체 행을 1회 인코딩해 재사용, 요청마다 dict 생성 없음)
+        """
+        key = None if fields is None else tuple(fields)
+        fragments = self._feature_cache.get(key)
+        if fragments is None:
+            records = self.stations.json_records()
+            if len(self._feature_cache) >= FEATURE_CACHE_LIMIT:
+                # 임의 필드 조합으로 캐시가 커지지 않게 요청 범위만 인코딩
+                features = (station_feature(records[pos], fields) for pos in positions)
+                return [encode_json(feature) for feature in features if feature is not None]
+            fragments = [_encode_feature(record, fields) for record in records]
+            self._feature_cache[key] = fragments
+        return [fragments[pos] for pos in positions if fragments[pos] is not None]
+
+
+    def find_name_positions(self, query: str, limit: int = 10) -> np.ndarray:
+        """상호 검색 결과 행 위치 (대소문자 무시, 완전/접두 일치 우선)"""
+        if not query or self.text_index is None or "상호" not in self.text_index:
+            return np.empty(0, dtype=np.int64)
+        return self.text_index.search(query, ["상호"], limit=limit, rank=True, case=False)
+
+
+    def find_region_positions(self, region: str, limit: Optional[int] = None) -> Optional[np.ndarray]:
+        """지역 코드 / 이름 → 지역 트리 노드의 station 행 위치 (해석 실패면 None)"""
+        if self.region_tree is None:
+            return None
+        positions = self.region_tree.positions(region)
+        if positions is None:
+            return None
+        return positions if limit is None else positions[:limit]
+
+
+    def _records(self, positions) -> List[Dict[str, Any]]:
+        """행 위치 → JSON 직렬화 가능 레코드 (NaN → None, 공유 dict 이므로 수정 금지)"""
+        records = self.stations.json_records()
+        return [records[int(pos)] for pos in positions]
+
+
+    def json_records_at(self, positions) -> List[Dict[str, Any]]:
+        """응답용 레코드 (find_*_positions 결과 → station_list_response)"""
+        return self._records(positions)
+
+
+    def search_by_name(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """상호(주유소 이름)로 주유소 검색 (대소문자 무시, 완전/접두 일치 우선)"""
+        return self._records(self.find_name_positions(query, limit))
 
 
     def search_by_address(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """주소로 주유소 검색"""
-        if not query or not self.data or "gas_station" not in self.data:
+        if not query or self.text_index is None:
             return []
         
-        gas_df = self.data["gas_station"]
-        
         parts = query.replace(",", " ").split()
         parts = [p.strip() for p in parts if p.strip()]
 
-        sido = parts[0] if len(parts) > 0 else None
-        sig = parts[1] if len(parts) > 1 else None
-        emd = parts[2] if len(parts) > 2 else None
-
-        if "주소" not in gas_df.columns:
+        if "주소" not in self.text_index:
             return []
 
-    # 1️⃣ 시도만 있는 경우 — 예: '광주광역시'
-        if sido and not sig:
-            filtered = gas_df[gas_df["주소"].str.contains(sido, na=False)]
-
-        # 2️⃣ 시도 + 시군구 — 예: '광주광역시 북구'
-        elif sido and sig and not emd:
-            filtered = gas_df[
-                gas_df["주소"].str.contains(sido, na=False)
-                & gas_df["주소"].str.contains(sig, na=False)
-            ]
-
-        # 3️⃣ 시도 + 시군구 + 읍면동 — 예: '광주광역시 북구 양산동'
-        elif sido and sig and emd:
-            filtered = gas_df[
-                gas_df["주소"].str.contains(sido, na=False)
-                & gas_df["주소"].str.contains(sig, na=False)
-                & gas_df["주소"].str.contains(emd, na=False)
-            ]
-
-        else:
-            filtered = gas_df
-
-        # 상위 limit 개수 반환
-        return filtered.head(limit).to_dict("records")
+        # 시도 / 시군구 / 읍면동 (최대 3개 토큰) 을 모두 포함하는 주소
+        # 예: '광주광역시', '광주광역시 북구', '광주광역시 북구 양산동'
+        terms = parts[:3]
+        if not terms:
+            return self._records(range(min(limit, len(self.stations))))
+
+        positions = self.text_index.contains_all(terms, ["주소"])
+        return self._records(positions[:limit])
     
 
     def search_by_region(self, region: str, limit: int = 10) -> List[Dict[str, Any]]:
         """행정구역으로 주유소 검색"""
-        if not region or not self.data or "gas_station" not in self.data:
+        if not region or self.text_index is None:
             return []
         
-        gas_df = self.data["gas_station"]
-        
         # 행정구역 추출 (없으면 그대로 사용)
         normalized_region = normalize_region(region)
         
         # 행정구역 검색 (권역 또는 시/군/구)
-        filtered_df = gas_df[
-            (gas_df["행정구역"].astype(str).str.contains(region, na=False)) |
-            (gas_df["권역"].astype(str).str.contains(normalized_region, na=False))
-        ]
+        positions = np.union1d(
+            self.text_index.contains(region, ["행정구역"]),
+            self.text_index.contains(normalized_region, ["권역"]),
+        )
         
         # 상위 limit개만 반환
-        result = filtered_df.head(limit).to_dict('records')
-        
-        return result
+        return self._records(positions[:limit])
     
 
     def search_by_status(self, status: str, limit: int = 10) -> List[Dict[str, Any]]:
         """상태로 주유소 검색"""
-        if not status or not self.data or "gas_station" not in self.data:
+        if not status or self.text_index is None:
             return []
         
-        gas_df = self.data["gas_station"]
-        
         # 상태 컬럼이 있는지 확인
-        if "상태" not in gas_df.columns:
+        if "상태" not in self.text_index:
             return []
         
         # 상태 검색
-        filtered_df = gas_df[gas_df["상태"].astype(str).str.contains(status, na=False)]
+        positions = self.text_index.contains(status, ["상태"])
         
         # 상위 limit개만 반환
-        result = filtered_df.head(limit).to_dict('records')
-        
-        return result
+        return self._records(positions[:limit])
     
 
     def get_all_regions(self) -> List[str]:
@@ -173,25 +263,57 @@ class GeoService:
 
     def get_station_by_id(self, station_id: int) -> Optional[Dict[str, Any]]:
         """ID로 주유소 조회"""
-        if not self.data or "gas_station" not in self.data:
+        if self.stations is None:
             return None
         
-        gas_df = self.data["gas_station"]
-        
         # ID 컬럼이 있는지 확인
-        if "id" not in gas_df.columns:
+        if "id" not in self.stations:
             return None
         
-        # ID로 검색
-        filtered_df = gas_df[gas_df["id"] == station_id]
+        # ID로 검색 (스냅샷 배열 비교 → 해당 행만 레코드화)
+        matches = np.flatnonzero(self.stations.column("id") == station_id)
         
-        if len(filtered_df) == 0:
+        if len(matches) == 0:
             return None
         
         # 첫 번째 결과 반환
-        return filtered_df.iloc[0].to_dict()
+        return self.stations.record(int(matches[0]))
     
     
+    def find_station_by_coord_id(self, station_id: str) -> Optional[Dict[str, Any]]:
+        """좌표 기반 ID로 주유소 조회 (정확 일치 → 최근접 순, ID 형식 오류 시 ValueError)"""
+        if self.station_resolver is None or self.stations is None:
+            return None
+
+        pos = self.station_resolver.resolve(station_id)
+        if pos is None:
+            return None
+
+        return self.stations.record(pos)
+
+
+    def find_stations_in_bbox(
+        self, lat1: float, lng1: float, lat2: float, lng2: float, limit: int = 10000
+    ) -> List[Dict[str, Any]]:
+        """지도 범위 내 주유소 (격자 인덱스 조회 → 미리 정리된 JSON 레코드, 원본 행 순서)"""
+        if self.station_grid is None or self.stations is None:
+            return []
+
+        positions = self.station_grid.query(lat1, lng1, lat2, lng2, limit=limit)
+        records = self.stations.json_records()
+        return [records[pos] for pos in positions]
+
+
+    def find_station_clusters_in_bbox(
+        self, lat1: float, lng1: float, lat2: float, lng2: float, zoom: int
+    ) -> List[Dict[str, Any]]:
+        """지도 범위 내 클러스터 (zoom 단계별 사전 계산 결과)"""
+        if self.station_clusters is None:
+            return []
+
+        return self.station_clusters.query(lat1, lng1, lat2, lng2, zoom)
+
+
     def get_station_stats(self) -> Dict[str, Any]:
         """주유소 통계 정보"""
         if not self.data or "gas_station" not in self.data:
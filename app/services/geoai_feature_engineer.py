@@ -5,11 +5,10 @@ from typing import Dict, List
 
 import pandas as pd
 from tqdm import tqdm
-import psycopg2
 from psycopg2.extras import DictCursor
 from dotenv import load_dotenv
-import os
 
+from app.db.postgis import get_postgis_pool
 from app.services.geoai_config import GeoAIConfig
 
 
@@ -40,17 +39,9 @@ class GeoAIFeatureEngineer:
             print("🚀 GeoAI FeatureEngineer (축소버전) 활성화")
 
         load_dotenv()  # .env 자동 로드
-        
-        # DB 연결 (필요하면 여기만 수정)
-        self.conn = psycopg2.connect(
-            host=os.getenv("POSTGRES_HOST"),
-            port=os.getenv("POSTGRES_PORT"),
-            dbname=os.getenv("POSTGRES_DB"),
-            user=os.getenv("POSTGRES_USER"),
-            password=os.getenv("POSTGRES_PASSWORD")
-        )
-        self.conn.autocommit = False
-        self.cur = self.conn.cursor(cursor_factory=DictCursor)
+
+        # DB 연결: 공용 PostGIS 커넥션 풀 (POSTGRES_DSN 또는 POSTGRES_HOST/PORT/DB/USER/PASSWORD)
+        self.pool = get_postgis_pool()
 
     # -------------------------------------------------------------------------
     # 핵심: df(Point 목록)에 대해 parcel/poi 피처를 1개의 PostGIS 쿼리로 배치 계산
@@ -173,8 +164,7 @@ class GeoAIFeatureEngineer:
         if self.debug:
             print("🧾 GeoAI 배치 SQL 실행 중...")
 
-        self.cur.execute(sql, params)
-        rows = self.cur.fetchall()
+        rows = self.pool.fetchall(sql, params, cursor_factory=DictCursor)
 
         feat_map: Dict[int, Dict] = {}
         for r in rows:
@@ -249,12 +239,3 @@ class GeoAIFeatureEngineer:
         print("✅ Test FeatureEngineering 완료")
         print("📊 test result shape:", result.shape)
         return result
-
-    def __del__(self):
-        try:
-            if self.cur:
-                self.cur.close()
-            if self.conn:
-                self.conn.close()
-        except Exception:
-            pass
@@ -0,0 +1,243 @@
+"""
+VWorld Hillshade XYZ 타일 디스크 캐시
+- 타일 키: lonlat_to_tile / tile_to_lonlat_bounds (WebMercator XYZ)
+- 저장: {tile_dir}/{z}/{x}/{y}.png 디렉터리 트리
+- bbox 요청은 캐시 타일을 이어 붙인(mosaic) 뒤 잘라서 반환 → 반복 렌더는 로컬 I/O만 사용
+- 없는 타일만 WMS로 받아 저장 (HILLSHADE_OFFLINE=true면 네트워크 호출 없이 회색으로 채움)
+"""
+
+import io
+import math
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+import requests
+from PIL import Image
+
+from app.core.config import BASE_DIR
+from app.services.terrain_utils import (
+    TILE_SIZE,
+    lonlat_to_tile,
+    lonlat_to_webmerc,
+    tile_to_lonlat_bounds,
+    webmerc_to_global_px,
+    webmerc_to_lonlat,
+)
+
+
+VWORLD_API_KEY = os.getenv("VWORLD_API_KEY")
+
+# VWorld WMS DEM/Hillshade
+VWORLD_WMS = (
+    "https://xdworld.vworld.kr/xdworld/wms?"
+    "SERVICE=WMS&VERSION=1.1.1&REQUEST=GetMap"
+    "&LAYERS=dem"
+    "&STYLES=hillshade"
+    "&FORMAT=image/png"
+    "&SRS=EPSG:3857"
+    "&WIDTH={width}&HEIGHT={height}"
+    "&BBOX={minx},{miny},{maxx},{maxy}"
+    "&apiKey={apiKey}"
+)
+
+HILLSHADE_TILE_DIR = BASE_DIR / "generated_maps" / "hillshade_tiles"
+
+# 1km bbox를 768px로 그릴 때(≈1.3m/px)보다 조금 더 촘촘한 해상도 (512px 타일 기준 ≈1.2m/px)
+DEFAULT_TILE_ZOOM = 16
+
+FALLBACK_COLOR = (160, 160, 160, 255)
+
+Tile = Tuple[int, int, int]   # (z, x, y)
+
+
+class HillshadeTileCache:
+    """XYZ 타일 단위 hillshade 캐시 + bbox mosaic"""
+
+    def __init__(
+        self,
+        tile_dir: Path = HILLSHADE_TILE_DIR,
+        zoom: int = DEFAULT_TILE_ZOOM,
+        tile_size: int = TILE_SIZE,
+        api_key: Optional[str] = None,
+        timeout: float = 5.0,
+        max_workers: int = 4,
+        offline: Optional[bool] = None,
+    ) -> None:
+        self.tile_dir = Path(tile_dir)
+        self.zoom = zoom
+        self.tile_size = tile_size
+        self.api_key = api_key if api_key is not None else (VWORLD_API_KEY or "")
+        self.timeout = timeout
+        self.max_workers = max_workers
+        if offline is None:
+            offline = os.getenv("HILLSHADE_OFFLINE", "false").lower() == "true"
+        self.offline = offline
+        # keep-alive 재사용 (requests.Session 은 스레드 안전하지 않으므로 스레드별 1개)
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # 타일 좌표
+    # ------------------------------------------------------------------
+    def tile_path(self, tile: Tile) -> Path:
+        z, x, y = tile
+        return self.tile_dir / str(z) / str(x) / f"{y}.png"
+
+    def tile_bbox_3857(self, tile: Tile) -> Tuple[float, float, float, float]:
+        z, x, y = tile
+        min_lon, min_lat, max_lon, max_lat = tile_to_lonlat_bounds(x, y, z)
+        minx, miny = lonlat_to_webmerc(min_lon, min_lat)
+        maxx, maxy = lonlat_to_webmerc(max_lon, max_lat)
+        return minx, miny, maxx, maxy
+
+    def tiles_for_bbox(self, bbox, zoom: Optional[int] = None) -> List[Tile]:
+        """EPSG:3857 bbox를 덮는 타일 목록"""
+        z = self.zoom if zoom is None else zoom
+        minx, miny, maxx, maxy = bbox
+        # 좌상단 / 우하단 모서리 → 타일
+        x0, y0 = lonlat_to_tile(*webmerc_to_lonlat(minx, maxy), z)
+        x1, y1 = lonlat_to_tile(*webmerc_to_lonlat(maxx, miny), z)
+        return [(z, x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+    def tiles_around(self, lon: float, lat: float, meter: int = 500) -> List[Tile]:
+        cx, cy = lonlat_to_webmerc(lon, lat)
+        return self.tiles_for_bbox((cx - meter, cy - meter, cx + meter, cy + meter))
+
+    # ------------------------------------------------------------------
+    # 타일 읽기 / 받기
+    # ------------------------------------------------------------------
+    def has_tile(self, tile: Tile) -> bool:
+        return self.tile_path(tile).exists()
+
+    def read_tile(self, tile: Tile) -> Optional[Image.Image]:
+        path = self.tile_path(tile)
+        try:
+            with Image.open(path) as img:
+                return img.convert("RGBA")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # 손상된 파일은 지우고 다시 받도록
+            print(f"[HILLSHADE TILE] 읽기 실패 {tile}: {e}")
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            return None
+
+    @property
+    def session(self) -> requests.Session:
+        """현재 스레드 전용 Session"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def fetch_tile(self, tile: Tile) -> Optional[Image.Image]:
+        """WMS로 타일 1장 받아 저장"""
+        minx, miny, maxx, maxy = self.tile_bbox_3857(tile)
+        url = VWORLD_WMS.format(
+            width=self.tile_size,
+            height=self.tile_size,
+            minx=minx,
+            miny=miny,
+            maxx=maxx,
+            maxy=maxy,
+            apiKey=self.api_key,
+        )
+
+        try:
+            r = self.session.get(url, timeout=self.timeout)
+            r.raise_for_status()
+            img = Image.open(io.BytesIO(r.content)).convert("RGBA")
+        except Exception as e:
+            print(f"[HILLSHADE ERROR] {tile}: {e}")
+            return None
+
+        path = self.tile_path(tile)
+        # 같은 타일을 여러 스레드 / 프로세스가 받아도 임시 파일이 겹치지 않게 uuid
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            img.save(tmp_path, format="PNG")
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[HILLSHADE TILE] 저장 실패 {tile}: {e}")
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        return img
+
+    def ensure_tiles(self, tiles: Iterable[Tile]) -> Tuple[int, int]:
+        """없는 타일만 병렬로 받기 → (받은 수, 실패 수)"""
+        missing = [tile for tile in tiles if not self.has_tile(tile)]
+        if not missing:
+            return 0, 0
+        if self.offline:
+            return 0, len(missing)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(self.fetch_tile, missing))
+
+        fetched = sum(1 for img in results if img is not None)
+        return fetched, len(missing) - fetched
+
+    # ------------------------------------------------------------------
+    # mosaic
+    # ------------------------------------------------------------------
+    def mosaic(self, bbox, width: int = 768, height: int = 768) -> Tuple[Image.Image, int]:
+        """
+        bbox(EPSG:3857) 영역 이미지 → (이미지, 비어 있는 타일 수)
+        - 캐시 타일을 이어 붙여 bbox 만큼 자른 뒤 (width, height)로 리샘플
+        """
+        tiles = self.tiles_for_bbox(bbox)
+        images = {tile: self.read_tile(tile) for tile in tiles}
+
+        missing = [tile for tile, img in images.items() if img is None]
+        if missing and not self.offline:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for tile, img in zip(missing, pool.map(self.fetch_tile, missing)):
+                    images[tile] = img
+
+        z = tiles[0][0]
+        xs = [x for _, x, _ in tiles]
+        ys = [y for _, _, y in tiles]
+        origin_x, origin_y = min(xs) * self.tile_size, min(ys) * self.tile_size
+
+        canvas = Image.new(
+            "RGBA",
+            ((max(xs) - min(xs) + 1) * self.tile_size, (max(ys) - min(ys) + 1) * self.tile_size),
+            FALLBACK_COLOR,
+        )
+        empty = 0
+        for (_, x, y), img in images.items():
+            if img is None:
+                empty += 1
+                continue
+            if img.size != (self.tile_size, self.tile_size):
+                img = img.resize((self.tile_size, self.tile_size))
+            canvas.paste(img, (x * self.tile_size - origin_x, y * self.tile_size - origin_y))
+
+        minx, miny, maxx, maxy = bbox
+        left, top = webmerc_to_global_px(minx, maxy, z, self.tile_size)
+        right, bottom = webmerc_to_global_px(maxx, miny, z, self.tile_size)
+        crop_box = (
+            int(math.floor(left - origin_x)),
+            int(math.floor(top - origin_y)),
+            int(math.ceil(right - origin_x)),
+            int(math.ceil(bottom - origin_y)),
+        )
+
+        return canvas.crop(crop_box).resize((width, height), Image.BILINEAR), empty
+
+
+def collect_tiles(cache: HillshadeTileCache, points: Iterable[Tuple[float, float]], meter: int = 500) -> Set[Tile]:
+    """(lon, lat) 목록 → 렌더에 필요한 전체 타일 집합"""
+    tiles: Set[Tile] = set()
+    for lon, lat in points:
+        tiles.update(cache.tiles_around(lon, lat, meter))
+    return tiles
@@ -0,0 +1,378 @@
+"""
+보고서용 위성사진 / 로드뷰 이미지 수집 서비스
+- Google Static Maps / Street View 비동기 호출 (공유 httpx 커넥션 풀)
+- 위성사진 ‖ (로드뷰 metadata 1회 → heading별 이미지) 동시 실행
+- (lat, lng, 종류, heading, 크기) 단위 디스크 캐시
+  (요청별 임시 파일 → os.replace, 용량 상한 초과 시 오래 안 쓴 것부터 삭제)
+- 다운스케일 + JPEG 재압축 후 Base64 → LLM 요청/HTML 크기 절감
+- 로드뷰가 없는 좌표는 negative cache로 metadata 재조회 방지 (파일 저장은 스레드에서)
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import math
+import os
+import re
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import httpx
+from PIL import Image
+
+from app.core.config import BASE_DIR
+
+
+IMAGERY_CACHE_DIR = BASE_DIR / "generated_maps" / "imagery"
+
+STATIC_MAP_URL = "https://maps.googleapis.com/maps/api/staticmap"
+STREETVIEW_URL = "https://maps.googleapis.com/maps/api/streetview"
+STREETVIEW_META_URL = "https://maps.googleapis.com/maps/api/streetview/metadata"
+
+# metadata 상태 중 "해당 좌표에 로드뷰 없음"으로 확정되는 값
+NO_IMAGERY_STATUSES = {"ZERO_RESULTS", "NOT_FOUND"}
+
+# 캐시가 만든 이미지 파일만 (sha1 앞 20자리)
+_CACHE_FILE = re.compile(r"(satellite|streetview)_[0-9a-f]{20}\.jpg")
+
+
+def compute_heading(src_lat: float, src_lng: float, dst_lat: float, dst_lng: float) -> int:
+    """pano 위치 → 대상 좌표 방향(0~359도)"""
+    phi1 = math.radians(src_lat)
+    phi2 = math.radians(dst_lat)
+    d_lambda = math.radians(dst_lng - src_lng)
+
+    y = math.sin(d_lambda) * math.cos(phi2)
+    x = math.cos(phi1) * math.sin(phi2) - math.sin(phi1) * math.cos(phi2) * math.cos(d_lambda)
+
+    bearing = math.degrees(math.atan2(y, x))
+    return int(round((bearing + 360.0) % 360.0))
+
+
+class ImageryService:
+    """위성사진 / 로드뷰 Base64 묶음 생성"""
+
+    def __init__(
+        self,
+        api_key: str,
+        cache_dir: Path = IMAGERY_CACHE_DIR,
+        max_width: int = 480,
+        jpeg_quality: int = 70,
+        cache_ttl: float = 30 * 24 * 60 * 60,
+        negative_ttl: float = 7 * 24 * 60 * 60,
+        timeout: float = 10.0,
+        max_connections: int = 10,
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.api_key = api_key
+        self.cache_dir = Path(cache_dir)
+        self.max_width = max_width
+        self.jpeg_quality = jpeg_quality
+        self.cache_ttl = cache_ttl
+        self.negative_ttl = negative_ttl
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        self._no_imagery_path = self.cache_dir / "no_streetview.json"
+        self._no_imagery: Dict[str, float] = self._load_no_imagery()
+
+    # ------------------------------------------------------------------
+    # 공통 유틸
+    # ------------------------------------------------------------------
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+        return self._client
+
+    @staticmethod
+    def _location_key(lat: float, lng: float) -> str:
+        return f"{lat:.6f},{lng:.6f}"
+
+    def _cache_path(self, lat: float, lng: float, kind: str, heading: Any, size: str) -> Path:
+        raw = f"{self._location_key(lat, lng)}|{kind}|{heading}|{size}|{self.max_width}|{self.jpeg_quality}"
+        digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+        return self.cache_dir / f"{kind}_{digest}.jpg"
+
+    @staticmethod
+    def _tmp_path(path: Path) -> Path:
+        # 같은 좌표 보고서 동시 생성 시에도 임시 파일이 겹치지 않게 uuid
+        return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+    def _read_cache(self, path: Path) -> Optional[str]:
+        try:
+            st = path.stat()
+            if time.time() - st.st_mtime > self.cache_ttl:
+                return None
+            content = path.read_bytes()
+            # LRU 기준이 되도록 접근 시각만 갱신 (mtime = TTL 기준 유지)
+            os.utime(path, (time.time(), st.st_mtime))
+            return base64.b64encode(content).decode("utf-8")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[Imagery] 캐시 읽기 실패({path.name}): {e}")
+            return None
+
+    def _write_cache(self, path: Path, content: bytes) -> None:
+        tmp_path = self._tmp_path(path)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[Imagery] 캐시 저장 실패({path.name}): {e}")
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        self.evict()
+
+    def evict(self) -> int:
+        """TTL 지난 이미지 삭제 + 용량 상한 초과 시 마지막 접근(atime)이 오래된 것부터 삭제 → 삭제 개수"""
+        now = time.time()
+        files = []
+        for p in self.cache_dir.glob("*.jpg"):
+            if not _CACHE_FILE.fullmatch(p.name):
+                continue
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            files.append((now - st.st_mtime > self.cache_ttl, st.st_atime, st.st_size, p))
+
+        total = sum(size for _, _, size, _ in files)
+        removed = 0
+        # 만료된 것 먼저, 그다음 오래 안 쓴 순
+        for expired, _, size, p in sorted(files, key=lambda f: (not f[0], f[1])):
+            if not expired and total <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def _optimize(self, content: bytes) -> bytes:
+        """다운스케일(최대 폭) + JPEG 재압축. 실패하면 원본 유지"""
+        try:
+            with Image.open(io.BytesIO(content)) as img:
+                img = img.convert("RGB")
+                if img.width > self.max_width:
+                    ratio = self.max_width / img.width
+                    img = img.resize((self.max_width, max(1, int(img.height * ratio))), Image.LANCZOS)
+                out = io.BytesIO()
+                img.save(out, format="JPEG", quality=self.jpeg_quality, optimize=True, progressive=True)
+            optimized = out.getvalue()
+            return optimized if len(optimized) < len(content) else content
+        except Exception as e:
+            print(f"[Imagery] 이미지 최적화 실패, 원본 사용: {e}")
+            return content
+
+    async def _fetch_image(self, url: str, params: Dict[str, str], cache_path: Path, label: str) -> Optional[str]:
+        """디스크 캐시 → 없으면 호출 → 최적화 → 캐시 저장 → Base64"""
+        cached = await asyncio.to_thread(self._read_cache, cache_path)
+        if cached:
+            return cached
+
+        try:
+            r = await self._get_client().get(url, params=params)
+            r.raise_for_status()
+        except httpx.HTTPError as e:
+            print(f"[{label}] 호출 실패: {e}")
+            return None
+
+        content = await asyncio.to_thread(self._optimize, r.content)
+        await asyncio.to_thread(self._write_cache, cache_path, content)
+        return base64.b64encode(content).decode("utf-8")
+
+    # ------------------------------------------------------------------
+    # negative cache (로드뷰 없음)
+    # ------------------------------------------------------------------
+    def _load_no_imagery(self) -> Dict[str, float]:
+        try:
+            with self._no_imagery_path.open("r", encoding="utf-8") as fp:
+                data = json.load(fp)
+            return {str(k): float(v) for k, v in data.items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[Imagery] negative cache 로드 실패: {e}")
+            return {}
+
+    def _is_known_no_imagery(self, lat: float, lng: float) -> bool:
+        marked_at = self._no_imagery.get(self._location_key(lat, lng))
+        return marked_at is not None and time.time() - marked_at <= self.negative_ttl
+
+    def _mark_no_imagery(self, lat: float, lng: float) -> Dict[str, float]:
+        """메모리 기록 + 만료 항목 정리 → 저장할 스냅샷 (파일 저장은 _save_no_imagery)"""
+        now = time.time()
+        self._no_imagery[self._location_key(lat, lng)] = now
+        self._no_imagery = {
+            key: marked_at for key, marked_at in self._no_imagery.items()
+            if now - marked_at <= self.negative_ttl
+        }
+        return dict(self._no_imagery)
+
+    def _save_no_imagery(self, snapshot: Dict[str, float]) -> None:
+        tmp_path = self._tmp_path(self._no_imagery_path)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("w", encoding="utf-8") as fp:
+                json.dump(snapshot, fp)
+            os.replace(tmp_path, self._no_imagery_path)
+        except Exception as e:
+            print(f"[Imagery] negative cache 저장 실패: {e}")
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    # ------------------------------------------------------------------
+    # 위성사진 / 로드뷰
+    # ------------------------------------------------------------------
+    async def fetch_satellite(
+        self, lat: float, lng: float, width: int = 640, height: int = 480, zoom: int = 18
+    ) -> Optional[str]:
+        """Google Maps Static API 위성사진 → Base64"""
+        size = f"{width}x{height}"
+        params = {
+            "center": f"{lat},{lng}",
+            "zoom": str(zoom),
+            "size": size,
+            "maptype": "satellite",
+            "key": self.api_key,
+        }
+        cache_path = self._cache_path(lat, lng, "satellite", zoom, size)
+        return await self._fetch_image(STATIC_MAP_URL, params, cache_path, "StaticMap")
+
+    async def streetview_location(self, lat: float, lng: float) -> Optional[Dict[str, Any]]:
+        """
+        metadata 1회 조회 → 사용할 pano 정보
+        - OK: pano_id / pano 좌표
+        - ZERO_RESULTS 등: None (negative cache 기록)
+        - 호출 실패: 원좌표로 직접 조회하도록 좌표만 반환 (캐시하지 않음)
+        """
+        if self._is_known_no_imagery(lat, lng):
+            return None
+
+        meta_params = {
+            "location": f"{lat},{lng}",
+            "radius": "120",
+            "source": "outdoor",   # 실외 이미지 우선
+            "key": self.api_key,
+        }
+        try:
+            r = await self._get_client().get(STREETVIEW_META_URL, params=meta_params, timeout=5)
+            r.raise_for_status()
+            meta = r.json()
+        except Exception as e:
+            print(f"[StreetView metadata] 조회 실패, 원좌표로 fallback: {e}")
+            return {"pano_id": None, "lat": lat, "lng": lng}
+
+        status = meta.get("status")
+        if status == "OK":
+            loc = meta.get("location") or {}
+            return {
+                "pano_id": meta.get("pano_id"),
+                "lat": float(loc.get("lat", lat)),
+                "lng": float(loc.get("lng", lng)),
+            }
+
+        if status in NO_IMAGERY_STATUSES:
+            snapshot = self._mark_no_imagery(lat, lng)
+            await asyncio.to_thread(self._save_no_imagery, snapshot)
+            return None
+
+        print(f"[StreetView metadata] status={status}, 원좌표로 직접 조회 시도")
+        return {"pano_id": None, "lat": lat, "lng": lng}
+
+    async def fetch_streetview(
+        self,
+        lat: float,
+        lng: float,
+        pano: Dict[str, Any],
+        heading: Optional[int] = 0,
+        pitch: int = 0,
+        width: int = 640,
+        height: int = 480,
+        fov: int = 90,
+    ) -> Optional[str]:
+        """Street View Static API 로드뷰 → Base64 (heading=None이면 pano→대상 방향 자동 계산)"""
+        if heading is None:
+            heading = compute_heading(pano["lat"], pano["lng"], lat, lng)
+
+        size = f"{width}x{height}"
+        params = {
+            "size": size,
+            "heading": str(heading),
+            "pitch": str(pitch),
+            "fov": str(fov),
+            "key": self.api_key,
+        }
+        if pano.get("pano_id"):
+            params["pano"] = pano["pano_id"]
+        else:
+            params["location"] = f"{pano['lat']},{pano['lng']}"
+
+        cache_path = self._cache_path(lat, lng, "streetview", f"{heading}/{pitch}/{fov}", size)
+        return await self._fetch_image(STREETVIEW_URL, params, cache_path, f"StreetView heading={heading}")
+
+    async def _streetviews(
+        self, lat: float, lng: float, headings: Sequence[int], width: int, height: int
+    ) -> Tuple[Optional[str], ...]:
+        size = f"{width}x{height}"
+
+        # 모든 heading이 디스크 캐시에 있으면 metadata 호출 생략
+        cached = [
+            await asyncio.to_thread(
+                self._read_cache,
+                self._cache_path(lat, lng, "streetview", f"{heading}/0/90", size),
+            )
+            for heading in headings
+        ]
+        if all(cached):
+            return tuple(cached)
+
+        pano = await self.streetview_location(lat, lng)
+        if pano is None:
+            return tuple(None for _ in headings)
+
+        return tuple(
+            await asyncio.gather(
+                *(
+                    self.fetch_streetview(lat, lng, pano, heading=heading, width=width, height=height)
+                    for heading in headings
+                )
+            )
+        )
+
+    async def prepare(
+        self, lat: float, lng: float, width: int = 600, height: int = 450
+    ) -> Dict[str, str]:
+        """satellite / streetview1(heading 0) / streetview2(heading 180) Base64 묶음"""
+        satellite, (rv1, rv2) = await asyncio.gather(
+            self.fetch_satellite(lat, lng, width=width, height=height, zoom=18),
+            self._streetviews(lat, lng, (0, 180), width, height),
+        )
+
+        images: Dict[str, str] = {}
+        if satellite:
+            images["satellite"] = satellite
+        if rv1:
+            images["streetview1"] = rv1
+        if rv2:
+            images["streetview2"] = rv2
+        return images
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
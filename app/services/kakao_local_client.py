@@ -0,0 +1,101 @@
+"""
+Kakao Local 키워드 검색 비동기 클라이언트
+- 공유 httpx.AsyncClient (커넥션 풀 / keep-alive)
+- (카테고리, 지역) 단위 TTL 캐시 → 같은 동을 반복 조회해도 API 재호출 없음
+- 여러 카테고리는 asyncio.gather로 동시 조회
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+from app.core.config import get_settings
+from app.utils.ttl_cache import TTLCache
+
+
+class KakaoLocalClient:
+    """Kakao Local API — 반경 검색 없이 query 기반 검색"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: float = 5.0,
+        max_connections: int = 20,
+        cache_ttl: float = 6 * 60 * 60,
+        cache_size: int = 2048,
+    ) -> None:
+        settings = get_settings()
+        self.api_key = api_key or settings.KAKAO_REST_API_KEY
+        # 로컬 stub 서버로 교체할 수 있도록 설정값으로 분리
+        self.base_url = base_url or settings.KAKAO_LOCAL_API_URL
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self.cache = TTLCache(ttl=cache_ttl, maxsize=cache_size)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={"Authorization": f"KakaoAK {self.api_key}"},
+                timeout=self.timeout,
+                limits=self.limits,
+            )
+        return self._client
+
+    async def search(self, category: str, region: str) -> List[Dict[str, Any]]:
+        """'{category} {region}' 키워드 검색 (성공 응답만 캐시)"""
+        cache_key = (category, region)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        params = {
+            "query": f"{category} {region}",
+            "size": 15
+        }
+
+        try:
+            r = await self._get_client().get(self.base_url, params=params)
+        except httpx.HTTPError as e:
+            print(f"[Kakao Local] 호출 실패({category} {region}): {e}")
+            return []
+
+        if r.status_code != 200:
+            return []
+
+        docs = r.json().get("documents", [])
+        results = []
+
+        for d in docs:
+            try:
+                results.append({
+                    "name": d.get("place_name"),
+                    "lat": float(d.get("y")),
+                    "lng": float(d.get("x")),
+                    "address": d.get("address_name"),
+                    "road_address": d.get("road_address_name")
+                })
+            except (TypeError, ValueError):
+                continue
+
+        self.cache.set(cache_key, results)
+        return results
+
+    async def search_categories(
+        self, categories: Sequence[str], region: str
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """여러 카테고리를 동시에 검색 → {카테고리: 결과}"""
+        results = await asyncio.gather(
+            *(self.search(category, region) for category in categories)
+        )
+        return dict(zip(categories, results))
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,200 @@
+"""
+PNU 기준 필지(개별공시지가 + 토지이용계획) 레지스트리
+- station_with_landprice.csv / station_with_landuse.csv를 시작 시 1회만 로드
+- PNU별 최신 공시지가 1건 + 중복 제거·분류가 끝난 토지이용 버킷을 dict로 보관
+- /{id}/land (및 이를 사용하는 보고서) 요청 시 파일 I/O 없이 O(1) 조회
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from app.core.config import DATA_DIR
+
+
+LAND_PRICE_PATH = DATA_DIR / "station_with_landprice.csv"
+LAND_USE_PATH = DATA_DIR / "station_with_landuse.csv"
+
+LAND_USE_CATEGORIES = ["zoning", "infra", "environment", "development", "other"]
+
+
+def classify_landuse(code: str, name: str) -> str:
+    """
+    용도지역지구코드 → 대분류 카테고리 분류
+    - 'zoning'       : 용도지역/지구 (주거·상업·공업·녹지, 관리지역 등)
+    - 'infra'        : 도로·철도·주차장·하천 등 기반시설
+    - 'environment'  : 환경·보전·규제 권역
+    - 'development'  : 개발행위·지구단위·도시관리계획 등
+    - 'other'        : 위에 안 걸리는 나머지
+    """
+    code = (code or "").upper()
+
+    # 용도지역·용도지구
+    if code.startswith(("UQA", "UQB", "UQC", "UQD")):
+        return "zoning"
+
+    # 도로, 철도, 주차장, 하천 등 기반시설
+    if code.startswith(("UIA", "UIK", "UQS", "UJB", "UQW")) or code in {
+        "UQS200", "UQS210", "UQS510"
+    }:
+        return "infra"
+
+    # 환경·보전·규제 권역
+    if code.startswith(("UMZ", "UMN", "UMX", "UG", "UOC")) or code in {
+        "UBA100", "UBA200", "UBA300", "UDV100"
+    }:
+        return "environment"
+
+    # 개발 관련(지구단위, 개발제한구역, 성장/개발지구 등)
+    if code.startswith(("UQQ", "UQN", "UQM", "UHA", "UHG", "UHJ", "UM2", "UFM", "UHB", "UHD")):
+        return "development"
+
+    return "other"
+
+
+def _load_csv(path: Path, label: str) -> Optional[pd.DataFrame]:
+    try:
+        return pd.read_csv(path, dtype=str)
+    except Exception as e:
+        print(f"⚠ {label} csv 로딩 오류:", e)
+        return None
+
+
+class LandRegistry:
+    """PNU → 공시지가 / 토지이용계획"""
+
+    def __init__(self, df_price: Optional[pd.DataFrame], df_use: Optional[pd.DataFrame]):
+        self._price_by_pnu: Dict[str, Dict[str, Any]] = {}
+        self._use_by_pnu: Dict[str, Dict[str, Any]] = {}
+
+        if df_price is not None and not df_price.empty:
+            self._build_price_index(df_price)
+        if df_use is not None and not df_use.empty:
+            self._build_use_index(df_use)
+
+    @classmethod
+    def from_csv(
+        cls, price_path: Path = LAND_PRICE_PATH, use_path: Path = LAND_USE_PATH
+    ) -> "LandRegistry":
+        return cls(_load_csv(price_path, "land price"), _load_csv(use_path, "land use"))
+
+    # ------------------------------------------------------------------
+    # 인덱스 구축 (1회)
+    # ------------------------------------------------------------------
+    def _build_price_index(self, df_price: pd.DataFrame) -> None:
+        df = df_price.copy()
+        # 데이터기준일자 기준 최신 1건 사용
+        try:
+            df["데이터기준일자_norm"] = pd.to_datetime(df["데이터기준일자"], errors="coerce")
+            df = df.sort_values("데이터기준일자_norm", ascending=False, kind="stable")
+        except Exception:
+            pass
+        df = df.drop_duplicates(subset="_PNU", keep="first")
+
+        for row_p in df.to_dict("records"):
+            raw_price = row_p.get("공시지가", "")
+            # 숫자화 (없으면 0)
+            try:
+                price_num = int(float(raw_price or 0))
+            except Exception:
+                price_num = 0
+
+            self._price_by_pnu[row_p.get("_PNU")] = {
+                "price": price_num,
+                "price_str": f"{raw_price}원/㎡" if raw_price != "" else None,
+                "announce_date": str(row_p.get("공시일자", "")),
+                "type": (str(row_p.get("특수지구분명", "")) or None),
+                "data_date": str(row_p.get("데이터기준일자", "")),
+            }
+
+    def _build_use_index(self, df_use: pd.DataFrame) -> None:
+        seen_pairs: Dict[str, set] = {}
+
+        for row_u in df_use.to_dict("records"):
+            pnu = row_u.get("_PNU")
+            code = str(row_u.get("용도지역지구코드", "")).strip()
+            name = str(row_u.get("용도지역지구명", "")).strip()
+            base_date = str(row_u.get("데이터기준일자", "")).strip()
+
+            if not code and not name:
+                continue
+
+            # 중복 제거 (code + name + date 기준)
+            key = (code, name, base_date)
+            seen = seen_pairs.setdefault(pnu, set())
+            if key in seen:
+                continue
+            seen.add(key)
+
+            entry = self._use_by_pnu.setdefault(pnu, {"summary": {}, "raw": []})
+            item = {
+                "code": code,
+                "name": name,
+                "data_date": base_date,
+            }
+            entry["summary"].setdefault(classify_landuse(code, name), []).append(item)
+            entry["raw"].append(item)
+
+        # 카테고리 순서를 기존 응답과 동일하게 정렬 (빈 카테고리는 없음)
+        for entry in self._use_by_pnu.values():
+            entry["summary"] = {
+                cat: entry["summary"][cat]
+                for cat in LAND_USE_CATEGORIES
+                if cat in entry["summary"]
+            }
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def land_price(self, pnu: str) -> Optional[Dict[str, Any]]:
+        return self._price_by_pnu.get(pnu)
+
+    def land_use(self, pnu: str) -> Dict[str, Any]:
+        return self._use_by_pnu.get(pnu) or {"summary": {}, "raw": []}
+
+    def build_payload(self, station_id: str, station_row: Dict[str, Any]) -> Dict[str, Any]:
+        """station 행 → /{id}/land 응답 본문 (PNU 누락 시 ValueError)"""
+        if "PNU" not in station_row:
+            raise ValueError("PNU 컬럼이 station.csv 에 없습니다.")
+
+        pnu = str(station_row.get("PNU", "")).strip()
+        if not pnu:
+            raise ValueError("_PNU 값이 비어 있습니다.")
+
+        land_use = self.land_use(pnu)
+
+        return {
+            "id": station_id,
+            "name": station_row.get("field5")
+                    or station_row.get("상호")
+                    or station_row.get("name"),
+            "address": station_row.get("field6")
+                       or station_row.get("주소")
+                       or station_row.get("address"),
+            "clean_address": station_row.get("_CLEANADDR"),
+            "pnu": pnu,
+            "location": {
+                "lat": float(station_row.get("위도", 0) or 0),
+                "lng": float(station_row.get("경도", 0) or 0),
+            },
+            "land_price": self.land_price(pnu),
+            "land_use": {
+                "summary": land_use["summary"],
+                "raw": land_use["raw"],
+            },
+        }
+
+
+_land_registry_instance: Optional[LandRegistry] = None
+
+
+def get_land_registry() -> LandRegistry:
+    """LandRegistry 싱글톤 (최초 호출 시 CSV 1회 로드)"""
+
+    global _land_registry_instance
+
+    if _land_registry_instance is None:
+        _land_registry_instance = LandRegistry.from_csv()
+
+    return _land_registry_instance
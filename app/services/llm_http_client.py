@@ -0,0 +1,184 @@
+"""
+LLM API 공용 HTTP 클라이언트
+- 라우트(엔드포인트 URL)별 장기 httpx.AsyncClient → keep-alive로 TCP/TLS 재사용
+- 동시 LLM 호출 수 상한 (세마포어)
+- 429 / 5xx / 네트워크 오류 시 지터 포함 지수 백오프 재시도 (Retry-After 우선)
+- 라우트별 지연 시간 히스토그램
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+
+# 지연 시간 히스토그램 구간 상한(ms)
+LATENCY_BUCKETS_MS: List[float] = [250, 500, 1000, 2500, 5000, 10000, 20000, 30000, 60000]
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class LatencyHistogram:
+    """누적 구간 카운트 + 합계/개수 (Prometheus histogram 형태)"""
+
+    def __init__(self, buckets: List[float] = LATENCY_BUCKETS_MS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)   # 마지막은 +Inf
+        self.count = 0
+        self.sum_ms = 0.0
+        self.status: Dict[str, int] = {}
+
+    def observe(self, elapsed_ms: float, status: str) -> None:
+        index = len(self.buckets)
+        for i, upper in enumerate(self.buckets):
+            if elapsed_ms <= upper:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.sum_ms += elapsed_ms
+        self.status[status] = self.status.get(status, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets: Dict[str, int] = {}
+        for upper, bucket_count in zip(self.buckets + [float("inf")], self.counts):
+            cumulative += bucket_count
+            label = "+Inf" if upper == float("inf") else f"{upper:g}"
+            buckets[label] = cumulative
+
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 1),
+            "avg_ms": round(self.sum_ms / self.count, 1) if self.count else None,
+            "buckets_ms": buckets,
+            "status": dict(self.status),
+        }
+
+
+def route_label(url: str, model: Optional[str]) -> str:
+    """히스토그램 라벨: '모델@호스트'"""
+    host = urlparse(url).netloc or url
+    return f"{model or '-'}@{host}"
+
+
+class LLMHttpClient:
+    """라우트별 커넥션 풀 + 동시성 제한 + 재시도"""
+
+    def __init__(
+        self,
+        max_in_flight: int = 8,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        max_connections: int = 10,
+    ) -> None:
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=60.0,
+        )
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self.in_flight = 0
+
+    # ------------------------------------------------------------------
+    # 내부 유틸
+    # ------------------------------------------------------------------
+    def _get_client(self, url: str) -> httpx.AsyncClient:
+        parsed = urlparse(url)
+        pool_key = f"{parsed.scheme}://{parsed.netloc}"
+
+        client = self._clients.get(pool_key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=self.limits)
+            self._clients[pool_key] = client
+        return client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._semaphore
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), self.backoff_max)
+                except ValueError:
+                    pass
+        # full jitter: 0 ~ min(max, base * 2^attempt)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _observe(self, label: str, elapsed_ms: float, status: str) -> None:
+        histogram = self._histograms.get(label)
+        if histogram is None:
+            histogram = self._histograms[label] = LatencyHistogram()
+        histogram.observe(elapsed_ms, status)
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    async def post_json(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        timeout: float,
+        label: Optional[str] = None,
+    ) -> httpx.Response:
+        """
+        POST 요청 (재시도 포함)
+        - 최종 응답이 오류면 raise_for_status 예외, 네트워크 오류면 마지막 예외를 그대로 전달
+        """
+        label = label or route_label(url, payload.get("model"))
+        client = self._get_client(url)
+
+        async with self._get_semaphore():
+            self.in_flight += 1
+            try:
+                for attempt in range(self.max_retries + 1):
+                    started = time.perf_counter()
+                    response: Optional[httpx.Response] = None
+                    try:
+                        response = await client.post(url, headers=headers, json=payload, timeout=timeout)
+                    except (httpx.TimeoutException, httpx.TransportError) as exc:
+                        self._observe(label, (time.perf_counter() - started) * 1000, type(exc).__name__)
+                        if attempt >= self.max_retries:
+                            raise
+                    else:
+                        self._observe(label, (time.perf_counter() - started) * 1000, str(response.status_code))
+                        if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                            response.raise_for_status()
+                            return response
+
+                    delay = self._retry_delay(attempt, response)
+                    print(f"[LLM] {label} 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}s 후)")
+                    await asyncio.sleep(delay)
+            finally:
+                self.in_flight -= 1
+
+        raise RuntimeError("unreachable")
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "pools": sorted(self._clients),
+            "routes": {label: hist.snapshot() for label, hist in self._histograms.items()},
+        }
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
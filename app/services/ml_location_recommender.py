@@ -16,6 +16,8 @@ from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
+from app.services.text_index import NgramTextIndex
+
 
 class MLLocationRecommender:
     DATA_DIR_NAME = "data"
@@ -25,6 +27,9 @@ class MLLocationRecommender:
     FEATURE_COLS = ["인구[명]", "교통량(AADT)", "숙박업소(관광지수)", "상권밀집도(비율)"]
     TARGET_COL = "대분류"
 
+    NAME_CANDIDATES = ["상호명", "업체명", "상호", "주유소명"]
+    ADDR_CANDIDATES = ["주소", "소재지", "관할주소"]
+
     def __init__(self) -> None:
         self.base_dir = Path(__file__).resolve().parents[2]
         self.data_dir = self.base_dir / self.DATA_DIR_NAME
@@ -32,6 +37,7 @@ class MLLocationRecommender:
         self.pipeline: Optional[Pipeline] = None
         self.classes_: Optional[np.ndarray] = None
         self.station_df: Optional[pd.DataFrame] = None
+        self.station_text_index: Optional[NgramTextIndex] = None
 
     # ========== 내부 유틸 ==========
 
@@ -82,6 +88,10 @@ class MLLocationRecommender:
             df = pd.read_excel(path)
 
         self.station_df = df
+        # 이름 / 주소 컬럼 n-gram 역색인 (행 위치 = iloc)
+        self.station_text_index = NgramTextIndex.from_frame(
+            df, self.NAME_CANDIDATES + self.ADDR_CANDIDATES
+        )
 
     # ========== 학습 ==========
 
@@ -160,29 +170,15 @@ class MLLocationRecommender:
         df = self.station_df
 
         # 1) 실제 존재하는 이름/주소 컬럼 자동 감지
-        name_candidates = ["상호명", "업체명", "상호", "주유소명"]
-        addr_candidates = ["주소", "소재지", "관할주소"]
-
-        name_cols = [c for c in name_candidates if c in df.columns]
-        addr_cols = [c for c in addr_candidates if c in df.columns]
+        name_cols = [c for c in self.NAME_CANDIDATES if c in df.columns]
+        addr_cols = [c for c in self.ADDR_CANDIDATES if c in df.columns]
 
         if not name_cols and not addr_cols:
             raise ValueError("gas_station_features에서 주유소 이름/주소 컬럼을 찾을 수 없습니다.")
 
-        # 2) 검색 마스크 생성
-        masks = []
-
-        for c in name_cols:
-            masks.append(df[c].astype(str).str.contains(keyword, na=False))
-
-        for c in addr_cols:
-            masks.append(df[c].astype(str).str.contains(keyword, na=False))
-
-        mask = masks[0]
-        for m in masks[1:]:
-            mask = mask | m
-
-        candidates = df[mask]
+        # 2) 이름/주소 중 하나라도 keyword 를 포함하는 행 (역색인 조회)
+        positions = self.station_text_index.search(keyword, name_cols + addr_cols, limit=1)
+        candidates = df.iloc[positions]
 
         if candidates.empty:
             return {
@@ -0,0 +1,122 @@
+"""
+Mapbox Vector Tile(MVT v2) 최소 인코더
+- 외부 protobuf 의존성 없이 point 레이어만 직접 인코딩 (주유소 레이어용)
+- 폴리곤(필지) 레이어는 PostGIS ST_AsMVT 를 사용
+- 스펙: https://github.com/mapbox/vector-tile-spec/tree/master/2.1
+"""
+
+import math
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_EXTENT = 4096
+
+# protobuf wire type
+_VARINT = 0
+_FIXED64 = 1
+_BYTES = 2
+
+# Feature.GeomType
+GEOM_POINT = 1
+
+# geometry command
+_CMD_MOVE_TO = 1
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _key(field: int, wire_type: int) -> bytes:
+    return _varint((field << 3) | wire_type)
+
+
+def _bytes_field(field: int, payload: bytes) -> bytes:
+    return _key(field, _BYTES) + _varint(len(payload)) + payload
+
+
+def _packed_field(field: int, values: Iterable[int]) -> bytes:
+    return _bytes_field(field, b"".join(_varint(v) for v in values))
+
+
+def _encode_value(value: Any) -> bytes:
+    """Layer.Value 메시지 (string / double / int / bool)"""
+    if isinstance(value, bool):
+        return _key(7, _VARINT) + _varint(int(value))
+    if isinstance(value, int):
+        if value >= 0:
+            return _key(5, _VARINT) + _varint(value)          # uint_value
+        return _key(6, _VARINT) + _varint(_zigzag(value))     # sint_value
+    if isinstance(value, float):
+        return _key(3, _FIXED64) + struct.pack("<d", value)   # double_value
+    return _bytes_field(1, str(value).encode("utf-8"))        # string_value
+
+
+class PointLayerEncoder:
+    """
+    타일 로컬 좌표(0~extent) point feature → MVT Layer
+    - 속성 key / value 는 레이어 단위로 중복 제거 (tags 인덱스 참조)
+    """
+
+    def __init__(self, name: str, extent: int = DEFAULT_EXTENT) -> None:
+        self.name = name
+        self.extent = extent
+        self._keys: Dict[str, int] = {}
+        self._values: Dict[Tuple[type, Any], int] = {}
+        self._features: List[bytes] = []
+
+    def _tag(self, key: str, value: Any) -> Tuple[int, int]:
+        key_idx = self._keys.setdefault(key, len(self._keys))
+        value_idx = self._values.setdefault((type(value), value), len(self._values))
+        return key_idx, value_idx
+
+    def add_point(self, x: int, y: int, properties: Dict[str, Any], feature_id: Optional[int] = None) -> None:
+        tags: List[int] = []
+        for key, value in properties.items():
+            # null / NaN 속성은 생략 (MVT 에는 null 값이 없음)
+            if value is None or (isinstance(value, float) and not math.isfinite(value)):
+                continue
+            tags.extend(self._tag(key, value))
+
+        geometry = (_CMD_MOVE_TO & 0x7) | (1 << 3), _zigzag(int(x)), _zigzag(int(y))
+
+        feature = b""
+        if feature_id is not None:
+            feature += _key(1, _VARINT) + _varint(feature_id)
+        if tags:
+            feature += _packed_field(2, tags)
+        feature += _key(3, _VARINT) + _varint(GEOM_POINT)
+        feature += _packed_field(4, geometry)
+        self._features.append(feature)
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    def encode(self) -> bytes:
+        """Layer 메시지 (Tile.layers 필드로 감싼 형태) → 빈 레이어면 b''"""
+        if not self._features:
+            return b""
+
+        layer = _key(15, _VARINT) + _varint(2)                   # version
+        layer += _bytes_field(1, self.name.encode("utf-8"))     # name
+        for feature in self._features:
+            layer += _bytes_field(2, feature)                   # features
+        for key in self._keys:
+            layer += _bytes_field(3, key.encode("utf-8"))       # keys
+        for (_, value) in self._values:
+            layer += _bytes_field(4, _encode_value(value))      # values
+        layer += _key(5, _VARINT) + _varint(self.extent)        # extent
+
+        return _bytes_field(3, layer)                           # Tile.layers
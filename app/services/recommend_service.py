@@ -13,6 +13,11 @@ from app.utils.preprocessing import (
     normalize_region
 )
 from app.schemas.recommendation import RecommendationAlgorithm, RecommendationResponse
+from app.services.adm_code_registry import get_adm_code_registry
+from app.services.admin_boundary import get_admin_boundary_index
+from app.services.dong_features import DongFeatureTable, get_dong_feature_table, zscore_stats
+from app.services.station_index import StationResolver
+from app.services.text_index import NgramTextIndex
 
 # 알고리즘 클래스 임포트
 from app.comparison.algorithms.cosine_similarity import CosineSimilarityAlgorithm
@@ -23,6 +28,19 @@ from app.comparison.algorithms.collaborative import CollaborativeAlgorithm
 from app.comparison.algorithms.ahp_topsis import AHPTopsisAlgorithm
 
 
+# 주유소 raw 컬럼 → 추천결과 / 센트로이드 특징 이름 (dong_stats 와 같은 출처)
+STATION_FEATURE_COLUMNS = {
+    "인구": "인구[명]",
+    "교통량": "교통량(AADT)",
+    "관광지수": "숙박업소(관광지수)",
+    "상권밀집도": "상권밀집도(비율)",
+}
+
+
+class RecommendationUnavailable(RuntimeError):
+    """추천 준비(특징 기준 / 알고리즘) 실패 — 빈 결과와 구분하기 위한 오류"""
+
+
 class RecommendationService:
     """추천 시스템 서비스 - 알고리즘 객체 관리 및 호출만 담당"""
     
@@ -32,6 +50,14 @@ class RecommendationService:
         self.feature_cols = ["인구[명]", "교통량", "숙박업소(관광지수)", "상권밀집도(비율)", "공시지가(토지단가)"]
         self.norm_cols = [f"{col}_norm" for col in self.feature_cols]
         self.algorithms = {}  # 알고리즘 객체 캐싱
+        self.text_index: Optional[NgramTextIndex] = None
+        # 센트로이드 컬럼 기준 특징 / 알고리즘 (주소 검색 주유소, 좌표 → 행정동 공통)
+        self.station_resolver: Optional[StationResolver] = None
+        self.dong_features: Optional[DongFeatureTable] = None
+        self.feature_stats: Dict[str, Any] = {}
+        self.centroid_norm_cols: List[str] = []
+        self.station_features: Optional[pd.DataFrame] = None
+        self.centroid_algorithms = {}
         self.initialize_data()
     
     def initialize_data(self):
@@ -55,12 +81,18 @@ class RecommendationService:
         available_cols = [col for col in self.feature_cols if col in self.data["gas_station"].columns]
         self.data["gas_station"] = normalize_features(self.data["gas_station"], available_cols)
         
+        # 주소 / 행정구역 검색용 n-gram 역색인 (행 위치 = iloc)
+        self.text_index = NgramTextIndex.from_frame(self.data["gas_station"], ["주소", "행정구역"])
+        
         # 센트로이드 데이터 처리
         self.process_centroids()
         
         # 알고리즘 객체 초기화
         self._initialize_algorithms()
         
+        # 센트로이드 기준 특징 / 좌표 기반 추천용 인덱스
+        self._initialize_centroid_features()
+        
         print("✅ 추천 서비스 초기화 완료")
     
     def process_centroids(self):
@@ -85,36 +117,85 @@ class RecommendationService:
             self.centroids = pd.DataFrame(columns=["usage_type", "region"] + self.norm_cols)
     
     
+    def _build_algorithms(self, norm_cols: List[str]) -> Dict[RecommendationAlgorithm, Any]:
+        """norm_cols 기준 알고리즘 객체 생성"""
+        train_data = self.data.get("recommend_result", pd.DataFrame())
+        
+        return {
+            RecommendationAlgorithm.COSINE_SIMILARITY: CosineSimilarityAlgorithm(
+                self.centroids, norm_cols
+            ),
+            RecommendationAlgorithm.EUCLIDEAN_DISTANCE: EuclideanDistanceAlgorithm(
+                self.centroids, norm_cols
+            ),
+            RecommendationAlgorithm.PEARSON_CORRELATION: PearsonCorrelationAlgorithm(
+                self.centroids, norm_cols
+            ),
+            RecommendationAlgorithm.POPULARITY: PopularityAlgorithm(
+                self.centroids, norm_cols, train_data
+            ),
+            RecommendationAlgorithm.COLLABORATIVE: CollaborativeAlgorithm(
+                self.centroids, norm_cols, train_data
+            ),
+            RecommendationAlgorithm.AHP_TOPSIS: AHPTopsisAlgorithm(
+                self.centroids, norm_cols, train_data
+            ),
+        }
+    
     def _initialize_algorithms(self):
         """모든 알고리즘 객체 초기화"""
         try:
-            train_data = self.data.get("recommend_result", pd.DataFrame())
-            
-            self.algorithms = {
-                RecommendationAlgorithm.COSINE_SIMILARITY: CosineSimilarityAlgorithm(
-                    self.centroids, self.norm_cols
-                ),
-                RecommendationAlgorithm.EUCLIDEAN_DISTANCE: EuclideanDistanceAlgorithm(
-                    self.centroids, self.norm_cols
-                ),
-                RecommendationAlgorithm.PEARSON_CORRELATION: PearsonCorrelationAlgorithm(
-                    self.centroids, self.norm_cols
-                ),
-                RecommendationAlgorithm.POPULARITY: PopularityAlgorithm(
-                    self.centroids, self.norm_cols, train_data
-                ),
-                RecommendationAlgorithm.COLLABORATIVE: CollaborativeAlgorithm(
-                    self.centroids, self.norm_cols, train_data
-                ),
-                RecommendationAlgorithm.AHP_TOPSIS: AHPTopsisAlgorithm(
-                    self.centroids, self.norm_cols, train_data
-                ),
-            }
+            self.algorithms = self._build_algorithms(self.norm_cols)
             print(f"✅ {len(self.algorithms)}개 알고리즘 초기화 완료")
         except Exception as e:
             print(f"⚠️ 알고리즘 초기화 실패: {str(e)}")
             self.algorithms = {}
     
+    def _initialize_centroid_features(self):
+        """
+        센트로이드 컬럼 기준 추천 준비 (로드 시 1회)
+        - 주유소 위도/경도 KD-tree (행정동 경계 밖 좌표의 fallback)
+        - 행정동 특징 테이블 + 센트로이드와 같은 z-score 기준 (추천결과_행단위 raw 컬럼)
+        - 주유소 행 특징도 같은 기준으로 미리 정규화 (주소 기반 추천)
+        - 센트로이드에 실제로 있는 *_norm 컬럼 기준 알고리즘 세트
+          (self.norm_cols 의 교통량 / 공시지가 컬럼은 센트로이드에 없음)
+        """
+        try:
+            gas_df = self.data["gas_station"]
+            if "위도" in gas_df.columns and "경도" in gas_df.columns:
+                self.station_resolver = StationResolver(gas_df["위도"].to_numpy(), gas_df["경도"].to_numpy())
+            
+            self.dong_features = get_dong_feature_table()
+            self.feature_stats = zscore_stats(
+                self.data.get("recommend_result", pd.DataFrame()), self.dong_features.columns
+            )
+            
+            self.centroid_norm_cols = [
+                f"{col}_norm" for col in self.dong_features.columns
+                if f"{col}_norm" in self.centroids.columns
+            ]
+            self.station_features = self._normalize_station_features(gas_df)
+            self.centroid_algorithms = self._build_algorithms(self.centroid_norm_cols)
+            print(f"✅ 센트로이드 기준 추천 준비 완료 (행정동 특징 {len(self.dong_features)}개)")
+        except Exception as e:
+            print(f"⚠️ 센트로이드 기준 추천 초기화 실패: {str(e)}")
+            self.centroid_algorithms = {}
+    
+    def _normalize_station_features(self, gas_df: pd.DataFrame) -> pd.DataFrame:
+        """주유소 raw 특징 → 센트로이드 기준 *_norm (결측은 0 = 평균)"""
+        raw = gas_df[[col for col in STATION_FEATURE_COLUMNS if col in gas_df.columns]]
+        raw = raw.apply(pd.to_numeric, errors="coerce").rename(columns=STATION_FEATURE_COLUMNS)
+        
+        features = pd.DataFrame(index=gas_df.index)
+        for col in self.centroid_norm_cols:
+            raw_col = col[: -len("_norm")]
+            if raw_col in raw.columns:
+                mean, std = self.feature_stats[raw_col]
+                features[col] = ((raw[raw_col] - mean) / std).fillna(0.0)
+            else:
+                features[col] = 0.0
+        return features
+    
     def recommend_by_query(self, 
                           query: str, 
                           algorithm: RecommendationAlgorithm = RecommendationAlgorithm.COSINE_SIMILARITY,
@@ -141,13 +222,21 @@ class RecommendationService:
                 "items": []
             }
         
+        # 초기화 실패는 "결과 없음" 과 구분되도록 오류로
+        if self.station_features is None or not self.centroid_algorithms:
+            raise RecommendationUnavailable("주소 기반 추천이 초기화되지 않았습니다.")
+        
         # 주소 검색
         gas_df = self.data["gas_station"]
-        filtered_df = gas_df[gas_df["주소"].astype(str).str.contains(query, na=False)]
+        positions = self.text_index.contains(query, ["주소"])
         
         # 검색 결과가 없으면 행정구역으로 검색
-        if filtered_df.empty:
-            filtered_df = gas_df[gas_df["행정구역"].astype(str).str.contains(query, na=False)]
+        if not len(positions):
+            positions = self.text_index.contains(query, ["행정구역"])
+        # 센트로이드 기준 특징으로 덮어씀 (같은 이름의 주유소 자체 기준 *_norm 대신)
+        filtered_df = gas_df.iloc[positions].assign(
+            **self.station_features.iloc[positions].to_dict("series")
+        )
         
         # 여전히 결과가 없으면 빈 결과 반환
         if filtered_df.empty:
@@ -165,12 +254,15 @@ class RecommendationService:
             filtered_df = filtered_df[filtered_df["권역"] == normalized_region]
         
         # 알고리즘 선택 및 실행
-        algorithm_obj = self.algorithms.get(algorithm)
+        algorithm_obj = self.centroid_algorithms.get(algorithm)
         
         if algorithm_obj is None:
             # 기본 알고리즘(코사인 유사도) 사용
             algorithm = RecommendationAlgorithm.COSINE_SIMILARITY
-            algorithm_obj = self.algorithms.get(algorithm)
+            algorithm_obj = self.centroid_algorithms.get(algorithm)
+        
+        if algorithm_obj is None:
+            raise RecommendationUnavailable(f"사용할 수 있는 추천 알고리즘이 없습니다: {algorithm}")
         
         # 추천 실행
         try:
@@ -188,6 +280,132 @@ class RecommendationService:
             "items": recommendations
         }
     
+    def resolve_location(self, lat: float, lng: float) -> Optional[Dict[str, Any]]:
+        """
+        좌표 → 행정동 (코드, 이름, 시도)
+        - 행정동 경계 STRtree point-in-polygon 우선
+        - 경계 밖(해상 등)이면 가장 가까운 주유소의 법정동코드
+        """
+        try:
+            dong = get_admin_boundary_index().lookup(lng, lat)
+        except Exception as e:
+            print(f"⚠️ 행정동 경계 조회 실패: {str(e)}")
+            dong = None
+        
+        if dong is not None:
+            return {
+                "source": "boundary",
+                "adm_cd2": dong["adm_cd2"],
+                "adm_nm": dong["adm_nm"],
+                "sido": dong["sidonm"],
+            }
+        
+        if self.station_resolver is None:
+            return None
+        
+        pos = self.station_resolver.nearest(lat, lng)
+        if pos is None:
+            return None
+        
+        station = self.data["gas_station"].iloc[pos]
+        code = station.get("법정동코드")
+        try:
+            sido = get_adm_code_registry().sido_name(code)
+        except Exception:
+            sido = None
+        return {
+            "source": "nearest_station",
+            "adm_cd2": code,
+            "adm_nm": station.get("행정구역") or None,
+            "sido": sido or station.get("권역"),
+            "station": station.get("상호"),
+        }
+    
+    def recommend_by_coordinates(self,
+                                 lat: float,
+                                 lng: float,
+                                 algorithm: RecommendationAlgorithm = RecommendationAlgorithm.COSINE_SIMILARITY,
+                                 top_k: int = 10,
+                                 region: Optional[str] = None) -> Dict[str, Any]:
+        """
+        좌표 기반 추천 (주소 문자열 검색 없음)
+        
+        Args:
+            lat, lng: 위도 / 경도
+            algorithm: 사용할 알고리즘
+            top_k: 반환할 결과 수
+            region: 권역 필터 (선택, 좌표의 시도와 다르면 빈 결과)
+            
+        Returns:
+            추천 결과 + location (해석된 행정동, 특징 출처)
+        """
+        query = f"{lat},{lng}"
+        
+        # 초기화 실패는 "결과 없음" 과 구분되도록 오류로
+        if self.dong_features is None or not self.centroid_algorithms:
+            raise RecommendationUnavailable("좌표 기반 추천이 초기화되지 않았습니다.")
+        
+        location = self.resolve_location(lat, lng)
+        
+        if location is None or not location.get("adm_cd2"):
+            return {
+                "query": query,
+                "timestamp": datetime.now(),
+                "algorithm": algorithm,
+                "count": 0,
+                "items": [],
+                "location": location
+            }
+        
+        # 행정동 특징 (인구 / 교통량 / 관광지수 / 상권밀집도, 센트로이드 기준 정규화)
+        features, feature_source = self.dong_features.features(location["adm_cd2"], self.feature_stats)
+        location = {**location, "feature_source": feature_source}
+        
+        # 권역 필터링 (양쪽 모두 normalize_region, 예: 전북 / 전북특별자치도 → 전라북도)
+        if region and normalize_region(region.strip()) != normalize_region(location.get("sido") or ""):
+            return {
+                "query": query,
+                "timestamp": datetime.now(),
+                "algorithm": algorithm,
+                "count": 0,
+                "items": [],
+                "location": location
+            }
+        
+        row = {
+            "관할주소": location.get("sido"),
+            "권역": location.get("sido"),
+            "주소": location.get("adm_nm"),
+            **features,
+        }
+        
+        # 알고리즘 선택 및 실행
+        algorithm_obj = self.centroid_algorithms.get(algorithm)
+        
+        if algorithm_obj is None:
+            # 기본 알고리즘(코사인 유사도) 사용
+            algorithm = RecommendationAlgorithm.COSINE_SIMILARITY
+            algorithm_obj = self.centroid_algorithms.get(algorithm)
+        
+        if algorithm_obj is None:
+            raise RecommendationUnavailable(f"사용할 수 있는 추천 알고리즘이 없습니다: {algorithm}")
+        
+        # 추천 실행
+        try:
+            recommendations = algorithm_obj.recommend(pd.DataFrame([row]), top_k=top_k)
+        except Exception as e:
+            print(f"⚠️ 좌표 기반 추천 실행 중 오류: {str(e)}")
+            recommendations = []
+        
+        return {
+            "query": query,
+            "timestamp": datetime.now(),
+            "algorithm": algorithm,
+            "count": len(recommendations),
+            "items": recommendations,
+            "location": location
+        }
+    
     def get_available_algorithms(self) -> List[str]:
         """사용 가능한 알고리즘 목록 반환"""
         return [algo.value for algo in self.algorithms.keys()]
@@ -0,0 +1,211 @@
+"""
+주유소 지역 계층 인덱스 (시도 → 시군구 → 읍면동)
+- station 행의 정규화된 10자리 코드(adm_cd2 → 법정동코드) 앞자리로 로드 시 1회 트리 구축
+  · 시도: 앞 2자리 / 시(구 포함 시): 앞 4자리 / 시군구: 앞 5자리 / 읍면동: 앞 8자리
+- 노드마다 station 행 위치 배열(원본 순서)을 미리 계산
+- 이름 → 노드: 코드 레지스트리 이름의 어절 접미사 전체를 색인
+  ("서울특별시 종로구 사직동" → "사직동", "종로구 사직동", ...)
+  첫 어절은 normalize_region 으로 정규화 ("서울 종로구" → "서울특별시 종로구")
+- 조회는 dict 1회 → 노드 위치 배열, 주소 문자열 부분 일치 없음
+"""
+
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from app.utils.preprocessing import normalize_region
+
+
+# 레벨별 코드 prefix 길이 (짧은 것부터 = 상위 노드부터)
+LEVEL_PREFIX = (
+    ("sido", 2),
+    ("city", 4),
+    ("sigungu", 5),
+    ("emd", 8),
+)
+
+def _pad(prefix: str) -> str:
+    return prefix.ljust(10, "0")
+
+
+class RegionNode:
+    """지역 트리 노드 (code = 레벨 길이 prefix)"""
+
+    def __init__(self, code: str, level: str, name: Optional[str], positions: np.ndarray) -> None:
+        self.code = code
+        self.level = level
+        self.name = name
+        self.positions = positions
+        self.children: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "code": _pad(self.code),
+            "level": self.level,
+            "name": self.name,
+            "count": len(self.positions),
+        }
+
+
+class RegionTree:
+    """코드 prefix 트리 + 이름 해석"""
+
+    def __init__(
+        self,
+        codes: Sequence[object],
+        name_of: Callable[[str], Optional[str]],
+        provinces: Optional[Sequence[object]] = None,
+    ) -> None:
+        """
+        codes: 행별 정규화 10자리 코드 (결측 / 형식 오류 행은 트리에서 제외)
+        name_of: 10자리 코드 → 이름 (AdmCodeRegistry.name_of)
+        provinces: 행별 권역 (시도 노드의 옛 이름 별칭용, 예: 전라북도 → 전북특별자치도 코드)
+        """
+        codes = [c if isinstance(c, str) and len(c) == 10 and c.isdigit() else None for c in codes]
+        valid = np.asarray([pos for pos, code in enumerate(codes) if code is not None], dtype=np.int64)
+
+        self.nodes: Dict[str, RegionNode] = {}
+        self._by_name: Dict[str, List[str]] = {}
+
+        for level, length in LEVEL_PREFIX:
+            prefixes = np.asarray([codes[pos][:length] for pos in valid], dtype=object)
+            if not len(prefixes):
+                break
+            keys, inverse = np.unique(prefixes.astype(str), return_inverse=True)
+            order = np.argsort(inverse, kind="stable")
+            bounds = np.cumsum(np.bincount(inverse, minlength=len(keys)))[:-1]
+
+            for key, members in zip(keys, np.split(valid[order], bounds)):
+                key = str(key)
+                name = name_of(_pad(key))
+                if level == "city" and not self._is_city(name, {codes[pos][:5] for pos in members}, name_of):
+                    continue
+                node = RegionNode(key, level, name, np.sort(members))
+                parent = self.parent_of(key)
+                if parent is not None:
+                    self.nodes[parent].children.append(key)
+                self.nodes[key] = node
+                if name:
+                    self._index_name(name, key)
+
+        if provinces is not None:
+            self._index_province_aliases(codes, provinces)
+
+    @staticmethod
+    def _is_city(name: Optional[str], sigungu: Iterable[str], name_of: Callable[[str], Optional[str]]) -> bool:
+        """
+        4자리 노드는 구를 둔 시(예: 안양시 = 만안구 41171 + 동안구 41173)만 유지
+        - 5번째 자리가 0 인 코드가 있으면 시군구 노드와 같은 지역
+        - 하위 구 이름이 시 이름으로 시작하지 않으면 폐지 코드 (예: 옛 인천 북구 2823)
+        """
+        if not name:
+            return False
+        for prefix in sigungu:
+            child = name_of(_pad(prefix)) or ""
+            if prefix[4] == "0" or not child.startswith(name + " "):
+                return False
+        return True
+
+    def _index_name(self, name: str, code: str) -> None:
+        tokens = name.split()
+        for start in range(len(tokens)):
+            key = " ".join(tokens[start:])
+            codes = self._by_name.setdefault(key, [])
+            if code not in codes:
+                codes.append(code)
+
+    def _index_province_aliases(self, codes: Sequence[Optional[str]], provinces: Sequence[object]) -> None:
+        """시도 노드별 최다 권역 값이 노드 이름과 다르면 별칭으로 등록"""
+        counters: Dict[str, Counter] = {}
+        for code, province in zip(codes, provinces):
+            if code is None or not isinstance(province, str) or not province.strip():
+                continue
+            counters.setdefault(code[:2], Counter())[province.strip()] += 1
+
+        for sido, counter in counters.items():
+            alias, _ = counter.most_common(1)[0]
+            node = self.nodes.get(sido)
+            if node is None or alias == node.name or alias in self._by_name:
+                continue
+            self._by_name[alias] = [sido]
+            # 하위 노드도 "옛 시도명 + 나머지" 로 조회 가능하게
+            for code in self._descendants(sido):
+                child = self.nodes[code]
+                if child.name and node.name and child.name.startswith(node.name + " "):
+                    full = alias + child.name[len(node.name):]
+                    self._by_name.setdefault(full, [code])
+
+    # ------------------------------------------------------------------
+    # 트리 탐색
+    # ------------------------------------------------------------------
+    def parent_of(self, code: str) -> Optional[str]:
+        for _, length in reversed(LEVEL_PREFIX):
+            if length < len(code) and code[:length] in self.nodes:
+                return code[:length]
+        return None
+
+    def _descendants(self, code: str) -> List[str]:
+        result: List[str] = []
+        stack = list(self.nodes[code].children)
+        while stack:
+            child = stack.pop()
+            result.append(child)
+            stack.extend(self.nodes[child].children)
+        return result
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, code: str) -> bool:
+        return code in self.nodes
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def resolve(self, query: str) -> List[RegionNode]:
+        """
+        지역 코드 / 이름 → 노드 목록
+        - 숫자: 0 패딩 10자리 코드가 같은 가장 상위 노드 (예: 4117000000 → 안양시)
+        - 이름: 어절 접미사 완전 일치, 동명 지역이 여럿이면 모두 (예: "북구")
+          같은 결과 안에서 상위 노드에 포함되는 하위 노드는 제외
+        """
+        query = (query or "").strip()
+        if not query:
+            return []
+
+        digits = query.replace("-", "")
+        if digits.isdigit():
+            padded = _pad(digits)[:10]
+            for _, length in LEVEL_PREFIX:
+                node = self.nodes.get(padded[:length])
+                if node is not None and _pad(node.code) == padded:
+                    return [node]
+            return []
+
+        tokens = query.replace(",", " ").split()
+        candidates = [" ".join(tokens)]
+        normalized = normalize_region(tokens[0])
+        if normalized != tokens[0]:
+            candidates.append(" ".join([normalized] + tokens[1:]))
+
+        for key in candidates:
+            codes = self._by_name.get(key)
+            if codes:
+                return [
+                    self.nodes[code] for code in codes
+                    if not any(code != other and code.startswith(other) for other in codes)
+                ]
+        return []
+
+    def positions(self, query: str) -> Optional[np.ndarray]:
+        """지역 노드들의 station 행 위치 (원본 순서), 해석 실패면 None"""
+        nodes = self.resolve(query)
+        if not nodes:
+            return None
+        if len(nodes) == 1:
+            return nodes[0].positions
+        return np.unique(np.concatenate([node.positions for node in nodes]))
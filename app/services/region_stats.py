@@ -0,0 +1,151 @@
+"""
+권역(region_code) 기준 train 통계 인덱스
+- train.csv를 1회만 읽어 시도코드(adm_cd2 앞 2자리)별 평균 + 정렬된 값 배열을 보관
+- 백분위는 정렬 배열 이분 탐색으로 계산 → /{id}/stats 요청 시 파일 I/O 없음
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.services.geoai_config import GeoAIConfig
+from app.utils.address_utils import normalize_adm_code, normalize_adm_code_series
+
+
+# 지표명 → (station 컬럼, train 컬럼)
+FEATURE_COLS: Dict[str, Tuple[str, str]] = {
+    "traffic": ("교통량", "교통량(AADT)"),
+    "tourism": ("관광지수", "숙박업소(관광지수)"),
+    "population": ("인구", "인구[명]"),
+    "commercial_density": ("상권밀집도", "상권밀집도(비율)"),
+    "parcel_300m": ("parcel_300m", "parcel_300m"),
+    "parcel_500m": ("parcel_500m", "parcel_500m"),
+}
+
+
+def _percent_change(a: Any, b: Any) -> Optional[float]:
+    if a is None or b is None or b == 0:
+        return None
+    return (float(a) - float(b)) / float(b) * 100
+
+
+class RegionStatsIndex:
+    """region_code → {지표: (평균, 정렬된 값 배열)}"""
+
+    def __init__(self, train_df: pd.DataFrame):
+        region_codes = normalize_adm_code_series(train_df["adm_cd2"]).str[:2]
+
+        self._regions: Dict[str, Dict[str, Tuple[float, np.ndarray]]] = {}
+        for region_code, group in train_df.groupby(region_codes):
+            features: Dict[str, Tuple[float, np.ndarray]] = {}
+            for name, (_, tr_col) in FEATURE_COLS.items():
+                if tr_col not in group.columns:   # 컬럼 존재 확인
+                    continue
+
+                values = np.sort(
+                    pd.to_numeric(group[tr_col], errors="coerce").dropna().to_numpy(dtype=float)
+                )
+                values.setflags(write=False)
+                features[name] = (float(group[tr_col].mean()), values)
+
+            self._regions[str(region_code)] = features
+
+    @classmethod
+    def from_csv(cls, path: Path) -> "RegionStatsIndex":
+        return cls(pd.read_csv(path))
+
+    def has_region(self, region_code: str) -> bool:
+        return region_code in self._regions
+
+    def train_mean(self, region_code: str) -> Dict[str, float]:
+        return {
+            name: mean
+            for name, (mean, _) in self._regions.get(region_code, {}).items()
+        }
+
+    def percentile(self, region_code: str, name: str, value: Any) -> Optional[float]:
+        """권역 내 value 미만 비율(%) — (arr < value).mean() * 100 과 동일"""
+        if value is None:
+            return None
+        # 문자열 → 숫자 변환 (오류 방지)
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+
+        feature = self._regions.get(region_code, {}).get(name)
+        if feature is None or len(feature[1]) == 0:
+            return None
+
+        values = feature[1]
+        return float(np.searchsorted(values, value, side="left") / len(values) * 100)
+
+    def build_payload(self, station_id: str, station: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        station 행 → /{id}/stats 응답 본문
+        - adm_cd2 없으면 빈 값 반환, 해당 권역 train 데이터가 없으면 LookupError
+        """
+        adm_raw = None
+        for key in ["adm_cd2", "법정동코드", "법정동 코드"]:
+            if station.get(key) is not None:
+                adm_raw = station.get(key)
+                break
+
+        if adm_raw is None or str(adm_raw).strip() == "" or str(adm_raw).lower() == "nan":
+            return {
+                "id": station_id,
+                "region_code": None,
+                "metrics": {},
+                "train_mean": {},
+                "relative": {},
+                "percentile": {},
+            }
+
+        region_code = normalize_adm_code(adm_raw)[:2]
+        if not self.has_region(region_code):
+            raise LookupError(f"train.csv 에 region_code={region_code} 데이터 없음")
+
+        metrics = {
+            name: station.get(st_col)
+            for name, (st_col, _) in FEATURE_COLS.items()
+        }
+        train_mean = self.train_mean(region_code)
+
+        relative = {
+            name: _percent_change(metrics[name], train_mean[name])
+            for name in FEATURE_COLS.keys()
+            if name in train_mean   # train_mean에 존재하는 지표만
+        }
+        percentiles = {
+            name: self.percentile(region_code, name, metrics[name])
+            for name in FEATURE_COLS.keys()
+            if name in train_mean
+        }
+
+        return {
+            "id": station_id,
+            "region_code": region_code,
+            "metrics": metrics,
+            "train_mean": train_mean,
+            "relative": relative,
+            "percentile": percentiles,
+        }
+
+
+_region_stats_instance: Optional[RegionStatsIndex] = None
+
+
+def get_region_stats_index() -> RegionStatsIndex:
+    """RegionStatsIndex 싱글톤 (최초 호출 시 train.csv 1회 로드)"""
+
+    global _region_stats_instance
+
+    if _region_stats_instance is None:
+        train_path = GeoAIConfig().train_csv
+        if not train_path.exists():
+            raise FileNotFoundError("train.csv 없음")
+        _region_stats_instance = RegionStatsIndex.from_csv(train_path)
+
+    return _region_stats_instance
@@ -0,0 +1,183 @@
+"""
+생성된 주유소 보고서 캐시
+- 키 = station ID + 입력(station 행 / 추천 / 분석 지표 / 필지 / 모델·라우팅 설정) 해시
+- 입력이 바뀌면 키가 바뀌므로 별도 무효화 없이 새 보고서 생성
+- 디스크(JSON 파일)에 저장 → 재시작 후에도 유지, 메모리에는 LRU 인덱스만 보관
+- TTL 초과 / 최대 개수 초과 시 오래된 항목부터 삭제
+- async 경로에서는 aget / aset (파일 I/O 를 스레드에서 실행, 이벤트 루프 블로킹 방지)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.core.config import BASE_DIR
+
+
+REPORT_CACHE_DIR = BASE_DIR / "generated_reports"
+
+_UNSAFE_CHARS = re.compile(r"[^0-9A-Za-z_-]")
+
+
+def hash_report_inputs(*parts: Any) -> str:
+    """입력 묶음 → sha256 (dict 키 순서와 무관, NaN/numpy 값은 문자열화)"""
+    encoded = json.dumps(
+        parts, sort_keys=True, ensure_ascii=False, default=str, separators=(",", ":")
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ReportCache:
+    """디스크 기반 보고서 캐시 (TTL + LRU)"""
+
+    def __init__(
+        self,
+        cache_dir: Path = REPORT_CACHE_DIR,
+        ttl: float = 7 * 24 * 60 * 60,
+        max_entries: int = 5000,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key → 파일 경로 (마지막 접근 순)
+        self._index: "OrderedDict[str, Path]" = OrderedDict()
+        self._load_index()
+
+    # ------------------------------------------------------------------
+    # 내부 유틸
+    # ------------------------------------------------------------------
+    def _load_index(self) -> None:
+        """기존 캐시 파일을 mtime 순으로 인덱스에 적재"""
+        if not self.cache_dir.exists():
+            return
+
+        files = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            self._index[path.stem] = path
+        self._evict_overflow()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _remove(self, key: str) -> None:
+        path = self._index.pop(key, None)
+        if path is not None:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _evict_overflow(self) -> None:
+        while len(self._index) > self.max_entries:
+            oldest = next(iter(self._index))
+            self._remove(oldest)
+            self.evictions += 1
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    @staticmethod
+    def make_key(station_id: str, input_hash: str) -> str:
+        """파일명으로 안전한 캐시 키"""
+        return f"{_UNSAFE_CHARS.sub('_', str(station_id))}-{input_hash[:32]}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            path = self._index.get(key)
+            if path is None:
+                self.misses += 1
+                return None
+
+            try:
+                with path.open("r", encoding="utf-8") as fp:
+                    entry = json.load(fp)
+            except Exception as e:
+                print(f"[보고서 캐시] 읽기 실패({key}): {e}")
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            if time.time() - float(entry.get("created_at", 0)) > self.ttl:
+                self._remove(key)
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._index.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: str, html: str, meta: Optional[Dict[str, Any]] = None) -> None:
+        entry = {
+            "key": key,
+            "created_at": time.time(),
+            "html": html,
+            "meta": meta or {},
+        }
+        path = self._path_for(key)
+
+        with self._lock:
+            # 여러 프로세스가 같은 키를 써도 임시 파일이 겹치지 않게 pid + uuid
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                with tmp_path.open("w", encoding="utf-8") as fp:
+                    json.dump(entry, fp, ensure_ascii=False, default=str)
+                # 동시 요청이 반쯤 쓰인 파일을 읽지 않도록 원자적 교체
+                os.replace(tmp_path, path)
+            except Exception as e:
+                print(f"[보고서 캐시] 저장 실패({key}): {e}")
+                return
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+
+            self._index[key] = path
+            self._index.move_to_end(key)
+            self._evict_overflow()
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """get 의 async 버전 (디스크 읽기를 스레드에서)"""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, html: str, meta: Optional[Dict[str, Any]] = None) -> None:
+        """set 의 async 버전 (디스크 쓰기를 스레드에서)"""
+        await asyncio.to_thread(self.set, key, html, meta)
+
+    def invalidate_station(self, station_id: str) -> int:
+        """station ID의 모든 캐시 항목 삭제 → 삭제 개수"""
+        prefix = f"{_UNSAFE_CHARS.sub('_', str(station_id))}-"
+        with self._lock:
+            keys = [key for key in self._index if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._index),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
@@ -0,0 +1,473 @@
+"""
+주유소 입지 분석 보고서 조립 파이프라인
+- station은 1회만 조회하고, 서로 독립적인 단계(추천 / 주변 필지 / 공시지가·토지이용 /
+  지도 이미지 / 분석 지표)를 동시에 실행
+- 블로킹 작업은 스레드로 분리, 단계별 타임아웃 + 소요 시간 기록
+- LLM 단계만 앞 단계 결과를 기다림 → 보고서 지연 = max(단계) + LLM
+- 입력(추천/필지/지표)이 같으면 LLMReportService 보고서 캐시에서 바로 반환
+"""
+
+import asyncio
+import inspect
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from shapely.geometry import Point
+
+from app.services.land_registry import get_land_registry
+from app.services.parcel_service import get_parcel_service
+from app.services.region_stats import get_region_stats_index
+from app.services.report_service import LLMReportService
+from app.services.station_index import make_station_id
+
+
+METERS_PER_DEGREE = 111_000
+
+# 단계별 타임아웃(초) — 초과 시 해당 단계는 빈 결과로 보고서 생성 계속
+DEFAULT_STAGE_TIMEOUTS: Dict[str, float] = {
+    "recommend": 5.0,
+    "parcels": 15.0,
+    "land": 10.0,
+    "map_images": 25.0,
+    "stats": 10.0,
+}
+
+
+# ============================================================
+# 단계별 결과 가공 유틸
+# ============================================================
+
+def build_recommend_payload(station_id: str, station: Dict[str, Any]) -> Dict[str, Any]:
+    """station 행 → /{id}/recommend 응답 본문"""
+    return {
+        "id": station_id,
+        "name": station.get("상호"),
+        "address": station.get("주소"),
+        "recommend1": station.get("recommend1"),
+        "recommend2": station.get("recommend2"),
+        "recommend3": station.get("recommend3"),
+    }
+
+
+def _classify_parcel_area(area_m2: float) -> str:
+    if area_m2 < 300:
+        return "소형"
+    if area_m2 < 1000:
+        return "중형"
+    if area_m2 < 3000:
+        return "대형"
+    return "초대형"
+
+
+def _extract_land_use(row: Dict[str, Any]) -> Optional[str]:
+    candidate_keys = [
+        "JIMOK",
+        "JIGU",
+        "USEDSGN",
+        "USE",
+        "LAND_USE",
+        "ZONING",
+        "지목",
+        "용도지역",
+    ]
+    for key in candidate_keys:
+        value = row.get(key)
+        if value:
+            return str(value)
+    return None
+
+
+def _format_recommendations_from_api_payload(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """/{id}/recommend API 응답을 보고서에서 사용하는 포맷으로 변환한다."""
+
+    if not isinstance(payload, dict):
+        return []
+
+    formatted: List[Dict[str, Any]] = []
+    for rank in range(1, 6):
+        key = f"recommend{rank}"
+        usage_value = payload.get(key)
+        if usage_value is None:
+            continue
+
+        usage_text = str(usage_value).strip()
+        if not usage_text or usage_text.lower() == "nan":
+            continue
+
+        formatted.append(
+            {
+                "type": usage_text,
+                "rank": rank,
+                "source": "station_recommend_api",
+                "description": f"추천 API 결과 순위 {rank}위",
+            }
+        )
+
+    return formatted
+
+
+def _summarise_nearby_parcels(gdf, lat: float, lng: float) -> Optional[Dict[str, Any]]:
+    if gdf is None or getattr(gdf, "empty", True):
+        return None
+
+    bucket_counter: Counter[str] = Counter()
+    total_area = 0.0
+    land_use_counter: Counter[str] = Counter()
+    closest_info: Optional[Dict[str, Any]] = None
+    station_point = Point(lng, lat)
+
+    for _, row in gdf.iterrows():
+        geometry = row.get("geometry")
+        if geometry is None or geometry.is_empty:
+            continue
+
+        try:
+            area_m2 = abs(float(geometry.area)) * (METERS_PER_DEGREE ** 2)
+        except Exception:
+            area_m2 = 0.0
+
+        if area_m2 > 0:
+            bucket_counter[_classify_parcel_area(area_m2)] += 1
+            total_area += area_m2
+
+        land_use = _extract_land_use(row)
+        if land_use:
+            land_use_counter[land_use] += 1
+
+        try:
+            distance_m = geometry.centroid.distance(station_point) * METERS_PER_DEGREE
+        except Exception:
+            distance_m = None
+
+        if distance_m is not None:
+            if not closest_info or distance_m < closest_info.get("distance_m", float("inf")):
+                closest_info = {
+                    "distance_m": float(distance_m),
+                    "label": row.get("JIBUN") or row.get("PNU") or row.get("LOTNO") or row.get("BUNJI"),
+                }
+
+    total_count = sum(bucket_counter.values())
+    if total_count == 0:
+        return None
+
+    average_area = total_area / total_count if total_count else 0
+    top_land_uses = [
+        {"use": use, "count": count}
+        for use, count in land_use_counter.most_common(3)
+    ]
+
+    return {
+        "total_count": total_count,
+        "total_area": total_area,
+        "average_area": average_area,
+        "bucket_counts": dict(bucket_counter),
+        "top_land_uses": top_land_uses,
+        "closest": closest_info,
+    }
+
+
+def _build_terrain_img_html(station_id: str) -> str:
+    terrain_png_path = f"/api/stations/{station_id}/terrain"
+
+    return f"""
+            <img src="{terrain_png_path}"
+                style="width:100%; border-radius:12px; border:1px solid #ccc;">
+        """
+
+
+def _build_report_map_html(lat: float, lng: float) -> str:
+    """카카오 지도 (정적처럼 고정)"""
+    js_key = "ef6066b015b62cbc9689dbf67268deb1"
+
+    map_html = f"""
+    <div id="report-map"
+        style="width:100%;height:100%;border-radius:12px;overflow:hidden;"></div>
+
+    <script>
+        (function () {{
+        var script = document.createElement('script');
+        script.src = "https://dapi.kakao.com/v2/maps/sdk.js?autoload=false&appkey={js_key}&libraries=services";
+        script.onload = function () {{
+            kakao.maps.load(function () {{
+            var container = document.getElementById('report-map');
+            if (!container) return;
+
+            // 화면 기본 중심
+            var center = new kakao.maps.LatLng({lat}, {lng});
+            // 🔽 인쇄할 때는 지도를 조금 위로 올려서(위도 +) 마커가 아래쪽에 보이게
+            var printCenter = new kakao.maps.LatLng({lat} + 0.0016, {lng});
+
+            var map = new kakao.maps.Map(container, {{
+                center: center,
+                level: 4
+            }});
+
+            // 커스텀 마커
+            var imageSrc = "https://absolute-beryl.vercel.app/public/marker_green.png";
+            var imageSize = new kakao.maps.Size(36, 43);
+            var imageOption = {{ offset: new kakao.maps.Point(18, 43) }};
+            var markerImage = new kakao.maps.MarkerImage(imageSrc, imageSize, imageOption);
+
+            var marker = new kakao.maps.Marker({{
+                position: center,
+                image: markerImage
+            }});
+            marker.setMap(map);
+
+            map.setDraggable(false);
+            map.setZoomable(false);
+            map.setKeyboardShortcuts(false);
+
+            // 전역에 저장해 두기
+            window.reportMap = map;
+            window.reportMapCenter = center;
+            window.reportMapPrintCenter = printCenter;
+
+            function handleBeforePrint() {{
+                if (!window.reportMap) return;
+                window.reportMap.relayout();
+                window.reportMap.setCenter(window.reportMapPrintCenter);
+            }}
+
+            function handleAfterPrint() {{
+                if (!window.reportMap) return;
+                window.reportMap.relayout();
+                window.reportMap.setCenter(window.reportMapCenter);
+            }}
+
+            window.addEventListener('beforeprint', handleBeforePrint);
+            window.addEventListener('afterprint', handleAfterPrint);
+            }});
+        }};
+        document.head.appendChild(script);
+        }})();
+
+
+    </script>
+    """
+
+    return map_html
+
+
+# ============================================================
+# 파이프라인
+# ============================================================
+
+@dataclass
+class StageResult:
+    """단계 실행 결과 + 소요 시간"""
+    name: str
+    value: Any
+    elapsed_ms: float
+    status: str = "ok"   # ok / timeout / error
+
+
+@dataclass
+class StationReport:
+    """완성된 보고서 HTML + 단계별 소요 시간(ms) + 캐시 상태(hit / miss / refresh / disabled)"""
+    html: str
+    timings: Dict[str, float] = field(default_factory=dict)
+    cache_status: str = "disabled"
+    # 단계 타임아웃 또는 LLM 폴백 문구로 생성된 경우 True (재시도 대상)
+    degraded: bool = False
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값"""
+        return ", ".join(f"{name};dur={ms:.1f}" for name, ms in self.timings.items())
+
+
+async def run_stage(
+    name: str,
+    func: Callable[[], Any],
+    timeout: Optional[float],
+    default: Any = None,
+    blocking: bool = False,
+) -> StageResult:
+    """
+    단일 단계 실행
+    - blocking=True인 동기 함수는 스레드에서 실행, 그 외에는 호출 결과가 awaitable이면 await
+    - 타임아웃/예외 시 default 값으로 대체
+    """
+    started = time.perf_counter()
+    try:
+        if blocking:
+            awaitable: Awaitable[Any] = asyncio.to_thread(func)
+        else:
+            awaitable = _call(func)
+
+        value = await asyncio.wait_for(awaitable, timeout=timeout)
+        status = "ok"
+    except asyncio.TimeoutError:
+        print(f"[보고서 단계 타임아웃] {name} ({timeout}s)")
+        value, status = default, "timeout"
+    except Exception as e:
+        print(f"[보고서 단계 오류] {name}: {e}")
+        value, status = default, "error"
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return StageResult(name=name, value=value, elapsed_ms=elapsed_ms, status=status)
+
+
+async def _call(func: Callable[[], Any]) -> Any:
+    result = func()
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+class StationReportPipeline:
+    """station 1건 → 보고서 HTML"""
+
+    def __init__(
+        self,
+        report_service: LLMReportService,
+        stage_timeouts: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.report_service = report_service
+        self.stage_timeouts = {**DEFAULT_STAGE_TIMEOUTS, **(stage_timeouts or {})}
+
+    # ------------------------------------------------------------------
+    # 개별 단계
+    # ------------------------------------------------------------------
+    def _recommend_stage(self, station_id: str, station: Dict[str, Any]) -> List[Dict[str, Any]]:
+        # 추천 결과 (/{id}/recommend API와 동일한 본문)
+        payload = build_recommend_payload(station_id, station)
+        return _format_recommendations_from_api_payload(payload)
+
+    def _parcel_stage(self, lat: float, lng: float) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        parcel_service = get_parcel_service()
+        nearby_parcels = parcel_service.get_nearby_parcels(lat, lng, radius=0.003)
+        return nearby_parcels, _summarise_nearby_parcels(nearby_parcels, lat, lng)
+
+    def _input_stage_specs(
+        self, station_id: str, station: Dict[str, Any]
+    ) -> List[Tuple[str, Callable[[], Any], Any, bool]]:
+        """보고서 캐시 키를 구성하는 입력 단계 (메모리 조회라 빠름)"""
+        return [
+            ("recommend", lambda: self._recommend_stage(station_id, station), [], False),
+            ("land", lambda: get_land_registry().build_payload(station_id, station), {}, True),
+            ("stats", lambda: get_region_stats_index().build_payload(station_id, station), {}, True),
+        ]
+
+    def _context_stage_specs(
+        self, lat: float, lng: float
+    ) -> List[Tuple[str, Callable[[], Any], Any, bool]]:
+        """캐시 miss 때만 필요한 무거운 단계 (좌표에서만 결정되므로 키에 불포함)"""
+        return [
+            ("parcels", lambda: self._parcel_stage(lat, lng), (None, None), True),
+            ("map_images", lambda: self.report_service.prepare_map_images(lat, lng), {}, False),
+        ]
+
+    async def _run_specs(
+        self, specs: List[Tuple[str, Callable[[], Any], Any, bool]]
+    ) -> Dict[str, StageResult]:
+        results = await asyncio.gather(
+            *(
+                run_stage(name, func, self.stage_timeouts.get(name), default, blocking)
+                for name, func, default, blocking in specs
+            )
+        )
+        return {result.name: result for result in results}
+
+    # ------------------------------------------------------------------
+    # 전체 조립
+    # ------------------------------------------------------------------
+    async def build(
+        self,
+        station_id: str,
+        station: Dict[str, Any],
+        lat: float,
+        lng: float,
+        refresh: bool = False,
+    ) -> StationReport:
+        """
+        1) 입력 단계 → 캐시 키 계산 → hit이면 즉시 반환 (refresh=True면 무시)
+        2) miss면 필지/지도 이미지 단계 동시 실행 → LLM → HTML → 캐시 저장
+        - 보고서 / 캐시 키는 요청 ID가 아닌 확인된 station 좌표 ID 기준
+          (최근접으로 같은 station 에 해석되는 ID들이 캐시 항목 1개를 공유)
+        """
+        started = time.perf_counter()
+        station_id = make_station_id(float(station["위도"]), float(station["경도"]))
+        stages = await self._run_specs(self._input_stage_specs(station_id, station))
+
+        combined_recommendations = stages["recommend"].value
+        land_payload = stages["land"].value
+        stats_payload = stages["stats"].value
+
+        cache_key = self.report_service.report_cache_key(
+            station_id,
+            station,
+            combined_recommendations,
+            stats_payload=stats_payload,
+            land_payload=land_payload,
+        )
+        cache_enabled = self.report_service.report_cache is not None
+
+        if cache_enabled and not refresh:
+            cached = await self.report_service.get_cached_report(cache_key)
+            if cached is not None:
+                timings = {name: result.elapsed_ms for name, result in stages.items()}
+                timings["total"] = (time.perf_counter() - started) * 1000
+                return StationReport(html=cached["html"], timings=timings, cache_status="hit")
+
+        stages.update(await self._run_specs(self._context_stage_specs(lat, lng)))
+        nearby_parcels, parcel_summary = stages["parcels"].value
+        map_images = stages["map_images"].value
+        # LLM 단계만 위 결과에 의존
+        llm_started = time.perf_counter()
+        llm_report = await self.report_service.generate_report(
+            station,
+            combined_recommendations,
+            parcel_summary=parcel_summary,
+            station_id=station_id,
+            map_images=map_images,
+            stats_payload=stats_payload,
+        )
+        llm_ms = (time.perf_counter() - llm_started) * 1000
+
+        html = self.report_service.build_report_html(
+            station=station,
+            report_date=datetime.now(),
+            map_html=_build_report_map_html(lat, lng),
+            terrain_html=_build_terrain_img_html(station_id),
+            llm_report=llm_report,
+            recommendations=combined_recommendations,
+            stats_payload=stats_payload,
+            parcel_summary=parcel_summary,
+            land_payload=land_payload,
+            nearby_parcels_available=nearby_parcels is not None and not nearby_parcels.empty,
+            map_images=map_images,
+        )
+
+        timings = {name: result.elapsed_ms for name, result in stages.items()}
+        timings["llm"] = llm_ms
+        timings["total"] = (time.perf_counter() - started) * 1000
+        print(
+            "📝 보고서 생성 완료 "
+            + " ".join(f"{name}={ms:.0f}ms" for name, ms in timings.items())
+        )
+
+        # 단계 타임아웃이나 LLM 폴백 결과는 일시적일 수 있으므로 저장하지 않음
+        degraded = bool(llm_report.get("fallback")) or any(
+            result.status == "timeout" for result in stages.values()
+        )
+
+        if not cache_enabled:
+            return StationReport(html=html, timings=timings, degraded=degraded)
+
+        if not degraded:
+            await self.report_service.store_cached_report(
+                cache_key,
+                html,
+                meta={"station_id": station_id, "timings": timings},
+            )
+
+        return StationReport(
+            html=html,
+            timings=timings,
+            cache_status="refresh" if refresh else "miss",
+            degraded=degraded,
+        )
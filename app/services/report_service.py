@@ -10,10 +10,11 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 import re
 
-import httpx
 from dotenv import load_dotenv
-import base64
-import requests
+
+from app.services.imagery_service import IMAGERY_CACHE_DIR, ImageryService
+from app.services.llm_http_client import LLMHttpClient
+from app.services.report_cache import REPORT_CACHE_DIR, ReportCache, hash_report_inputs
 
 
 load_dotenv()
@@ -49,6 +50,9 @@ class LLMReportService:
             self.temperature = 0.3
         self.routing_table = self._load_routing_table()
         self.google_maps_api_key = os.getenv("GOOGLE_MAPS_API_KEY", "").strip()
+        self.imagery = self._init_imagery_service()
+        self.report_cache = self._init_report_cache()
+        self.http = self._init_http_client()
 
     # ------------------------------------------------------------------
     # 라우팅/공통 설정
@@ -128,6 +132,115 @@ class LLMReportService:
 
         return merged
 
+    def _init_http_client(self) -> LLMHttpClient:
+        def _env_int(name: str, default: int) -> int:
+            try:
+                return int(os.getenv(name, str(default)))
+            except ValueError:
+                return default
+
+        return LLMHttpClient(
+            max_in_flight=_env_int("LLM_MAX_IN_FLIGHT", 8),
+            max_retries=_env_int("LLM_MAX_RETRIES", 3),
+            max_connections=_env_int("LLM_MAX_CONNECTIONS", 10),
+        )
+
+    def _init_imagery_service(self) -> Optional[ImageryService]:
+        if not self.google_maps_api_key:
+            return None
+
+        try:
+            max_width = int(os.getenv("IMAGERY_MAX_WIDTH", "480"))
+        except ValueError:
+            max_width = 480
+        try:
+            jpeg_quality = int(os.getenv("IMAGERY_JPEG_QUALITY", "70"))
+        except ValueError:
+            jpeg_quality = 70
+        try:
+            max_bytes = int(os.getenv("IMAGERY_CACHE_MAX_MB", "256")) * 1024 * 1024
+        except ValueError:
+            max_bytes = 256 * 1024 * 1024
+        cache_dir = os.getenv("IMAGERY_CACHE_DIR")
+
+        return ImageryService(
+            self.google_maps_api_key,
+            cache_dir=Path(cache_dir).expanduser() if cache_dir else IMAGERY_CACHE_DIR,
+            max_width=max_width,
+            jpeg_quality=jpeg_quality,
+            max_bytes=max_bytes,
+        )
+
+    def llm_metrics(self) -> Dict[str, Any]:
+        """라우트별 LLM 호출 지연 히스토그램 / 동시 호출 수"""
+        return self.http.metrics()
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+        if self.imagery is not None:
+            await self.imagery.aclose()
+
+    # ------------------------------------------------------------------
+    # 보고서 캐시
+    # ------------------------------------------------------------------
+    def _init_report_cache(self) -> Optional[ReportCache]:
+        if os.getenv("REPORT_CACHE_ENABLED", "true").lower() == "false":
+            return None
+
+        try:
+            ttl = float(os.getenv("REPORT_CACHE_TTL", str(7 * 24 * 60 * 60)))
+        except ValueError:
+            ttl = 7 * 24 * 60 * 60
+        try:
+            max_entries = int(os.getenv("REPORT_CACHE_MAX_ENTRIES", "5000"))
+        except ValueError:
+            max_entries = 5000
+        cache_dir = os.getenv("REPORT_CACHE_DIR")
+
+        return ReportCache(
+            cache_dir=Path(cache_dir).expanduser() if cache_dir else REPORT_CACHE_DIR,
+            ttl=ttl,
+            max_entries=max_entries,
+        )
+
+    def report_cache_key(
+        self,
+        station_id: str,
+        station: Dict[str, Any],
+        recommendations: List[Dict[str, Any]],
+        stats_payload: Optional[Dict[str, Any]] = None,
+        land_payload: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """station ID + 보고서 입력 해시 (API 키는 제외한 모델/라우팅 설정 포함)"""
+        route = self._resolve_route(station_id)
+        route_config = {key: value for key, value in route.items() if key != "api_key"}
+        input_hash = hash_report_inputs(
+            station,
+            recommendations,
+            stats_payload or {},
+            land_payload or {},
+            route_config,
+            # 키 유무에 따라 LLM/폴백 결과가 달라지므로 구분
+            bool(route.get("api_key")),
+        )
+        return ReportCache.make_key(station_id, input_hash)
+
+    async def get_cached_report(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        if self.report_cache is None:
+            return None
+        return await self.report_cache.aget(cache_key)
+
+    async def store_cached_report(
+        self, cache_key: str, html: str, meta: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if self.report_cache is not None:
+            await self.report_cache.aset(cache_key, html, meta)
+
+    def report_cache_stats(self) -> Dict[str, Any]:
+        if self.report_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.report_cache.stats()}
+
     @staticmethod
     def _normalise_bool(value: Any) -> bool:
         if isinstance(value, bool):
@@ -276,13 +389,13 @@ class LLMReportService:
 
         try:
             timeout_value = route_config.get("timeout", self.timeout)
-            async with httpx.AsyncClient(timeout=timeout_value) as client:
-                response = await client.post(
-                    route_config.get("base_url", self.base_url),
-                    headers=headers,
-                    json=payload,
-                )
-            response.raise_for_status()
+            # 공유 커넥션 풀 + 동시성 제한 + 429/5xx 재시도
+            response = await self.http.post_json(
+                route_config.get("base_url", self.base_url),
+                headers=headers,
+                payload=payload,
+                timeout=timeout_value,
+            )
             data = response.json()
             choices = data.get("choices", [])
             if not choices:
@@ -296,59 +409,19 @@ class LLMReportService:
     # ------------------------------------------------------------------
     # 지도/이미지 준비
     # ------------------------------------------------------------------
-    def prepare_map_images(
+    async def prepare_map_images(
         self, lat: Optional[Any], lng: Optional[Any], *, width: int = 600, height: int = 450
     ) -> Dict[str, str]:
         """LLM 및 보고서 공용으로 사용할 지도/로드뷰 이미지 Base64 묶음."""
 
-        images: Dict[str, str] = {}
-        if not lat or not lng or not self.google_maps_api_key:
-            return images
-
-        lat_f = float(lat)
-        lng_f = float(lng)
-
-        try:
-            sat_b64 = self._fetch_satellite_image_b64(
-                lat_f, lng_f, width=width, height=height, zoom=18
-            )
-            if sat_b64:
-                images["satellite"] = sat_b64
-        except Exception as exc:
-            print(f"[Satellite] 이미지 생성 실패: {exc}")
-
-        # 로드뷰가 있을 때만 시도 (metadata 기반)
-        try:
-            rv1_b64 = self._fetch_streetview_image_b64(
-                lat_f,
-                lng_f,
-                heading=0,
-                pitch=0,
-                width=width,
-                height=height,
-                fov=90,
-            )
-            if rv1_b64:
-                images["streetview1"] = rv1_b64
-        except Exception as exc:
-            print(f"[StreetView1] 이미지 생성 실패: {exc}")
+        if not lat or not lng or self.imagery is None:
+            return {}
 
         try:
-            rv2_b64 = self._fetch_streetview_image_b64(
-                lat_f,
-                lng_f,
-                heading=180,
-                pitch=0,
-                width=width,
-                height=height,
-                fov=90,
-            )
-            if rv2_b64:
-                images["streetview2"] = rv2_b64
+            return await self.imagery.prepare(float(lat), float(lng), width=width, height=height)
         except Exception as exc:
-            print(f"[StreetView2] 이미지 생성 실패: {exc}")
-
-        return images
+            print(f"[Imagery] 이미지 생성 실패: {exc}")
+            return {}
 
     def _build_headers(self, api_key: str, route_config: Dict[str, Any]) -> Dict[str, str]:
         """인증 스킴에 맞게 헤더를 구성한다."""
@@ -490,6 +563,8 @@ class LLMReportService:
             "summary": " ".join(summary_parts),
             "insights": insights,
             "actions": actions,
+            # 보고서 캐시에서 일시적 LLM 실패 결과를 저장하지 않도록 표시
+            "fallback": True,
         }
 
     # ------------------------------------------------------------------
@@ -688,7 +763,7 @@ class LLMReportService:
 
         map_images = map_images or {}
 
-        # Google Maps API를 서버에서 호출하여 위성/로드뷰 이미지를 Base64로 생성
+        # 위성/로드뷰 이미지는 prepare_map_images에서 미리 수집 (여기서는 재호출하지 않음)
         satellite_img = ""
         streetview1_img = ""
         streetview2_img = ""
@@ -712,63 +787,6 @@ class LLMReportService:
                 f'object-fit:cover; border-radius:10px;">'
             )
 
-        if lat and lng and self.google_maps_api_key:
-            lat_f = float(lat)
-            lng_f = float(lng)
-            try:
-                if not satellite_img:
-                    sat_b64 = self._fetch_satellite_image_b64(
-                        lat_f, lng_f, width=600, height=450, zoom=18
-                    )
-                    if sat_b64:
-                        satellite_img = (
-                            f'<img src="data:image/jpeg;base64,{sat_b64}" '
-                            f'alt="위성사진" style="width:100%; height:100%; '
-                            f'object-fit:cover; border-radius:10px;">'
-                        )
-            except Exception as e:
-                print(f"[Satellite] 이미지 생성 실패: {e}")
-
-            try:
-                if not streetview1_img:
-                    rv1_b64 = self._fetch_streetview_image_b64(
-                        lat_f,
-                        lng_f,
-                        heading=0,
-                        pitch=0,
-                        width=600,
-                        height=450,
-                        fov=90,
-                    )
-                    if rv1_b64:
-                        streetview1_img = (
-                            f'<img src="data:image/jpeg;base64,{rv1_b64}" '
-                            f'alt="현장사진(로드뷰1)" style="width:100%; height:100%; '
-                            f'object-fit:cover; border-radius:10px;">'
-                        )
-            except Exception as e:
-                print(f"[StreetView1] 이미지 생성 실패: {e}")
-
-            try:
-                if not streetview2_img:
-                    rv2_b64 = self._fetch_streetview_image_b64(
-                        lat_f,
-                        lng_f,
-                        heading=180,
-                        pitch=0,
-                        width=600,
-                        height=450,
-                        fov=90,
-                    )
-                    if rv2_b64:
-                        streetview2_img = (
-                            f'<img src="data:image/jpeg;base64,{rv2_b64}" '
-                            f'alt="현장사진(로드뷰2)" style="width:100%; height:100%; '
-                            f'object-fit:cover; border-radius:10px;">'
-                        )
-            except Exception as e:
-                print(f"[StreetView2] 이미지 생성 실패: {e}")
-
         # 기본값으로 terrain_html 사용 (위성사진이 없을 경우)
         if not satellite_img:
             satellite_img = (
@@ -1663,21 +1681,6 @@ class LLMReportService:
     # ------------------------------------------------------------------
     # 숫자/이미지 유틸
     # ------------------------------------------------------------------
-    def _compute_heading(
-        self, src_lat: float, src_lng: float, dst_lat: float, dst_lng: float
-    ) -> int:
-        import math
-        phi1 = math.radians(src_lat)
-        phi2 = math.radians(dst_lat)
-        d_lambda = math.radians(dst_lng - src_lng)
-
-        y = math.sin(d_lambda) * math.cos(phi2)
-        x = math.cos(phi1) * math.sin(phi2) - math.sin(phi1) * math.cos(phi2) * math.cos(d_lambda)
-
-        bearing = math.degrees(math.atan2(y, x))
-        heading = (bearing + 360.0) % 360.0
-        return int(round(heading))
-
     @staticmethod
     def _is_number(val: Any) -> bool:
         try:
@@ -1685,142 +1688,3 @@ class LLMReportService:
             return True
         except (TypeError, ValueError):
             return False
-
-    def _fetch_satellite_image_b64(
-        self,
-        lat: float,
-        lng: float,
-        width: int = 640,
-        height: int = 480,
-        zoom: int = 18,
-    ) -> Optional[str]:
-        """
-        Google Maps Static API를 호출해 위성사진을 받아서 Base64 문자열로 반환.
-        """
-        if not self.google_maps_api_key:
-            return None
-
-        base_url = "https://maps.googleapis.com/maps/api/staticmap"
-        params = {
-            "center": f"{lat},{lng}",
-            "zoom": str(zoom),
-            "size": f"{width}x{height}",
-            "maptype": "satellite",
-            "key": self.google_maps_api_key,
-        }
-
-        try:
-            r = requests.get(base_url, params=params, timeout=10)
-            r.raise_for_status()
-            return base64.b64encode(r.content).decode("utf-8")
-        except Exception as e:
-            print(f"[StaticMap] 호출 실패: {e}")
-            return None
-
-    # def _streetview_has_imagery(self, lat: float, lng: float) -> bool:
-    #     """
-    #     Street View 메타데이터를 조회해 실제 로드뷰 이미지가 있는지 확인한다.
-    #     imagery가 없으면 'Sorry, we have no imagery here.' 타일이 나오므로
-    #     그런 경우는 LLM/HTML에 전달하지 않는다.
-    #     """
-    #     if not self.google_maps_api_key:
-    #         return False
-
-    #     meta_url = "https://maps.googleapis.com/maps/api/streetview/metadata"
-    #     params = {
-    #         "location": f"{lat},{lng}",
-    #         "key": self.google_maps_api_key,
-    #     }
-
-    #     try:
-    #         r = requests.get(meta_url, params=params, timeout=5)
-    #         r.raise_for_status()
-    #         data = r.json()
-    #         return data.get("status") == "OK"
-    #     except Exception as e:
-    #         print(f"[StreetView metadata] 조회 실패: {e}")
-    #         return False
-    def _fetch_streetview_image_b64(
-        self,
-        lat: float,
-        lng: float,
-        heading: int = 0,
-        pitch: int = 0,
-        width: int = 640,
-        height: int = 480,
-        fov: int = 90,
-    ) -> Optional[str]:
-        """
-        Google Street View Static API를 호출해 로드뷰 이미지를 Base64 문자열로 반환.
-
-        - metadata API로 주변에서 pano를 찾아보고(있으면 그 좌표/ID 사용)
-        - metadata가 실패하거나 ZERO_RESULTS여도 한 번은 좌표 기준으로 그대로 요청해 본다.
-        """
-        if not self.google_maps_api_key:
-            return None
-
-        meta_url = "https://maps.googleapis.com/maps/api/streetview/metadata"
-        pano_lat = lat
-        pano_lng = lng
-        pano_id: Optional[str] = None
-
-        # 1) 메타데이터로 주변 도로 쪽 pano 찾기 (road bias)
-        try:
-            meta_params = {
-                "location": f"{lat},{lng}",
-                "radius": 120,         # 50m → 120m로 조금 더 완화
-                "source": "outdoor",   # 실외 이미지 우선
-                "key": self.google_maps_api_key,
-            }
-            r_meta = requests.get(meta_url, params=meta_params, timeout=5)
-            r_meta.raise_for_status()
-            meta = r_meta.json()
-
-            status = meta.get("status")
-            if status == "OK":
-                loc = meta.get("location") or {}
-                pano_lat = float(loc.get("lat", lat))
-                pano_lng = float(loc.get("lng", lng))
-                pano_id = meta.get("pano_id")
-            else:
-                # ❗ 여기서 바로 return 하지 않고, 그냥 원래 좌표로 Static API 한 번 호출
-                print(f"[StreetView metadata] status={status}, 원좌표로 직접 조회 시도")
-                pano_lat = lat
-                pano_lng = lng
-                pano_id = None
-        except Exception as e:
-            # 메타데이터 호출 실패 시에도 그냥 원좌표로 시도
-            print(f"[StreetView metadata] 조회 실패, 원좌표로 fallback: {e}")
-            pano_lat = lat
-            pano_lng = lng
-            pano_id = None
-
-        # 2) heading 자동 계산 옵션 (지금은 0/180 넘겨 쓰고 있으니 그대로 사용)
-        if heading is None:
-            try:
-                heading = self._compute_heading(pano_lat, pano_lng, lat, lng)
-            except Exception as e:
-                print(f"[StreetView heading] 자동 계산 실패, 기본값 0 사용: {e}")
-                heading = 0
-
-        base_url = "https://maps.googleapis.com/maps/api/streetview"
-        params = {
-            "size": f"{width}x{height}",
-            "heading": str(heading),
-            "pitch": str(pitch),
-            "fov": str(fov),
-            "key": self.google_maps_api_key,
-        }
-
-        if pano_id:
-            params["pano"] = pano_id
-        else:
-            params["location"] = f"{pano_lat},{pano_lng}"
-
-        try:
-            r = requests.get(base_url, params=params, timeout=10)
-            r.raise_for_status()
-            return base64.b64encode(r.content).decode("utf-8")
-        except Exception as e:
-            print(f"[StreetView] 호출 실패(heading={heading}): {e}")
-            return None
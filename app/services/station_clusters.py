@@ -0,0 +1,189 @@
+"""
+지도 축소(저 zoom) 구간용 주유소 계층 클러스터 (supercluster 방식)
+- 최대 zoom 부터 한 단계씩 올라가며, 이전 단계 클러스터를 화면 반경(px) 안에서 greedy 병합
+- 단계별 (중심 좌표, 개수, recommend1 히스토그램) 을 로드 시 1회 계산
+- 조회는 해당 zoom 단계의 격자 인덱스로 bbox 안 클러스터만 반환
+  → 응답 크기 / 직렬화 시간이 viewport 크기와 무관하게 거의 일정
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from app.services.station_index import StationGridIndex, make_station_id
+
+
+class _ClusterLevel:
+    """한 zoom 단계의 클러스터 배열"""
+
+    def __init__(self, x, y, counts, hist, origin):
+        self.x = x              # WebMercator 정규화 좌표 (0~1)
+        self.y = y
+        self.counts = counts    # 클러스터에 포함된 주유소 수
+        self.hist = hist        # (클러스터 수, 카테고리 수) recommend1 개수
+        self.origin = origin    # 단일 주유소면 station 행 위치, 클러스터면 -1
+
+        self.lats = _y_to_lat(y)
+        self.lngs = _x_to_lng(x)
+        self.grid: Optional[StationGridIndex] = None
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+
+def _lng_to_x(lng):
+    return np.asarray(lng, dtype=float) / 360.0 + 0.5
+
+
+def _lat_to_y(lat):
+    sin = np.sin(np.radians(np.asarray(lat, dtype=float)))
+    y = 0.5 - 0.25 * np.log((1 + sin) / (1 - sin)) / math.pi
+    return np.clip(y, 0.0, 1.0)
+
+
+def _x_to_lng(x):
+    return (np.asarray(x, dtype=float) - 0.5) * 360.0
+
+
+def _y_to_lat(y):
+    y2 = (180.0 - np.asarray(y, dtype=float) * 360.0) * math.pi / 180.0
+    return 360.0 * np.arctan(np.exp(y2)) / math.pi - 90.0
+
+
+class StationClusterIndex:
+    """zoom 단계별 사전 계산 클러스터 + bbox 조회"""
+
+    def __init__(
+        self,
+        lats,
+        lngs,
+        categories: Sequence[Any],
+        radius: float = 60,
+        extent: int = 256,
+        min_zoom: int = 0,
+        max_zoom: int = 14,
+    ) -> None:
+        self.radius = radius
+        self.extent = extent
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+
+        lats = np.asarray(lats, dtype=float)
+        lngs = np.asarray(lngs, dtype=float)
+        # 단일 주유소는 원본 좌표로 응답 (좌표 기반 id 일치)
+        self._station_lats = lats
+        self._station_lngs = lngs
+        valid = np.flatnonzero(np.isfinite(lats) & np.isfinite(lngs))
+
+        # recommend1 → 카테고리 index (결측은 히스토그램에서 제외)
+        labels = [categories[pos] for pos in valid]
+        self.categories: List[str] = sorted({str(label) for label in labels if _is_present(label)})
+        category_index = {name: i for i, name in enumerate(self.categories)}
+
+        hist = np.zeros((len(valid), len(self.categories)), dtype=np.int32)
+        for row, label in enumerate(labels):
+            if _is_present(label):
+                hist[row, category_index[str(label)]] = 1
+
+        # max_zoom + 1 단계 = 개별 주유소
+        level = _ClusterLevel(
+            _lng_to_x(lngs[valid]),
+            _lat_to_y(lats[valid]),
+            np.ones(len(valid), dtype=np.int64),
+            hist,
+            valid.astype(np.int64),
+        )
+
+        self.levels: Dict[int, _ClusterLevel] = {}
+        for zoom in range(max_zoom, min_zoom - 1, -1):
+            level = self._cluster(level, zoom)
+            # 저 zoom 일수록 셀을 넓게 (셀 수 과다 방지)
+            level.grid = StationGridIndex(level.lats, level.lngs, cell_size=max(0.05, 90.0 / 2 ** zoom))
+            self.levels[zoom] = level
+
+    def _cluster(self, prev: _ClusterLevel, zoom: int) -> _ClusterLevel:
+        """이전(zoom + 1) 단계 클러스터 → zoom 단계 클러스터"""
+        if len(prev) == 0:
+            return prev
+
+        r = self.radius / (self.extent * 2 ** zoom)
+        coords = np.column_stack([prev.x, prev.y])
+        neighbors = cKDTree(coords).query_ball_point(coords, r)
+
+        assigned = np.zeros(len(prev), dtype=bool)
+        xs, ys, counts, hists, origins = [], [], [], [], []
+
+        for i, nbrs in enumerate(neighbors):
+            if assigned[i]:
+                continue
+            members = [j for j in nbrs if not assigned[j]]
+            assigned[members] = True
+
+            if len(members) == 1:
+                xs.append(prev.x[i])
+                ys.append(prev.y[i])
+                counts.append(prev.counts[i])
+                hists.append(prev.hist[i])
+                origins.append(prev.origin[i])
+                continue
+
+            weights = prev.counts[members]
+            total = int(weights.sum())
+            xs.append(float((prev.x[members] * weights).sum() / total))
+            ys.append(float((prev.y[members] * weights).sum() / total))
+            counts.append(total)
+            hists.append(prev.hist[members].sum(axis=0))
+            origins.append(-1)
+
+        return _ClusterLevel(
+            np.asarray(xs, dtype=float),
+            np.asarray(ys, dtype=float),
+            np.asarray(counts, dtype=np.int64),
+            np.vstack(hists).astype(np.int32),
+            np.asarray(origins, dtype=np.int64),
+        )
+
+    def clamp_zoom(self, zoom: int) -> int:
+        return max(self.min_zoom, min(self.max_zoom, int(zoom)))
+
+    def query(self, lat1: float, lng1: float, lat2: float, lng2: float, zoom: int) -> List[Dict[str, Any]]:
+        """
+        bbox 안 클러스터 목록
+        - lat / lng: 클러스터 중심 (개수 가중 평균)
+        - count: 포함 주유소 수, recommend1: 카테고리별 개수
+        - count == 1 이면 해당 주유소 id (좌표 기반) 포함
+        """
+        level = self.levels[self.clamp_zoom(zoom)]
+        positions = level.grid.query(lat1, lng1, lat2, lng2)
+
+        result = []
+        for pos in positions:
+            hist = level.hist[pos]
+            origin = int(level.origin[pos])
+            if origin >= 0:
+                lat, lng = float(self._station_lats[origin]), float(self._station_lngs[origin])
+            else:
+                lat, lng = float(level.lats[pos]), float(level.lngs[pos])
+
+            item: Dict[str, Any] = {
+                "lat": round(lat, 6),
+                "lng": round(lng, 6),
+                "count": int(level.counts[pos]),
+                "recommend1": {
+                    self.categories[k]: int(hist[k]) for k in np.flatnonzero(hist)
+                },
+            }
+            if origin >= 0:
+                item["id"] = make_station_id(lat, lng)
+            result.append(item)
+        return result
+
+
+def _is_present(value: Any) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, float) and math.isnan(value):
+        return False
+    return str(value).strip() != ""
@@ -0,0 +1,141 @@
+"""
+좌표 기반 주유소 ID 공간 인덱스
+- "{위도*1e6}_{경도*1e6}" 형식 ID → station 행 위치
+- 정확히 일치하는 ID는 해시맵으로 O(1) 조회
+- 그 외에는 KD-tree 최근접 탐색으로 fallback
+- 지도 범위(bbox) 조회용 균일 격자 인덱스
+"""
+
+import math
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+COORD_ID_SCALE = 1_000_000
+
+_EPS = 1e-9
+
+
+def parse_station_id(station_id: str) -> Tuple[float, float]:
+    """좌표 기반 ID → (위도, 경도). 형식이 잘못되면 ValueError"""
+    lat_part, lng_part = str(station_id).split("_")
+    return float(lat_part) / COORD_ID_SCALE, float(lng_part) / COORD_ID_SCALE
+
+
+def make_station_id(lat: float, lng: float) -> str:
+    """(위도, 경도) → 좌표 기반 ID (프론트와 동일하게 소수점 이하 절사)"""
+    return f"{int(lat * COORD_ID_SCALE)}_{int(lng * COORD_ID_SCALE)}"
+
+
+class StationResolver:
+    """station 테이블의 위도/경도 배열 위에 구축되는 ID → 행 위치 인덱스"""
+
+    def __init__(self, lats, lngs):
+        coords = np.column_stack([
+            np.asarray(lats, dtype=float),
+            np.asarray(lngs, dtype=float),
+        ])
+
+        # 기존 idxmin 방식과 동일하게 (위도, 경도) 평면 거리 기준
+        self._tree = cKDTree(coords) if len(coords) else None
+
+        # 같은 좌표가 여러 행이면 첫 번째 행 우선 (idxmin과 동일)
+        self._id_map: Dict[str, int] = {}
+        for pos, (lat, lng) in enumerate(coords):
+            self._id_map.setdefault(make_station_id(lat, lng), pos)
+
+    def __len__(self) -> int:
+        return 0 if self._tree is None else self._tree.n
+
+    def nearest(self, lat: float, lng: float) -> Optional[int]:
+        """좌표에 가장 가까운 station 행 위치"""
+        if self._tree is None:
+            return None
+        _, pos = self._tree.query((lat, lng))
+        return int(pos)
+
+    def resolve(self, station_id: str) -> Optional[int]:
+        """좌표 기반 ID → station 행 위치 (형식 오류 시 ValueError)"""
+        pos = self._id_map.get(station_id)
+        if pos is not None:
+            return pos
+
+        lat, lng = parse_station_id(station_id)
+        return self.nearest(lat, lng)
+
+
+class StationGridIndex:
+    """
+    위도/경도 균일 격자 bbox 인덱스
+    - 셀 크기(도) 단위로 행 위치를 묶어 두고, bbox 에 걸친 셀만 확인
+    - 완전히 포함된 셀은 비교 없이 전부, 경계 셀만 좌표 비교
+    - 결과는 원본 행 순서 (기존 DataFrame 필터 + head(limit) 와 동일)
+    """
+
+    def __init__(self, lats, lngs, cell_size: float = 0.05):
+        self.cell_size = cell_size
+        self._lats = np.asarray(lats, dtype=float)
+        self._lngs = np.asarray(lngs, dtype=float)
+
+        valid = np.flatnonzero(np.isfinite(self._lats) & np.isfinite(self._lngs))
+        rows = np.floor(self._lats[valid] / cell_size).astype(np.int64)
+        cols = np.floor(self._lngs[valid] / cell_size).astype(np.int64)
+
+        # (행, 열) 기준 안정 정렬 → 셀별 위치 배열 (셀 내부는 원본 순서)
+        order = np.lexsort((cols, rows))
+        rows, cols, positions = rows[order], cols[order], valid[order]
+        boundaries = np.flatnonzero((np.diff(rows) != 0) | (np.diff(cols) != 0)) + 1
+
+        self._cells: Dict[Tuple[int, int], np.ndarray] = {}
+        for chunk_rows, chunk_cols, chunk in zip(
+            np.split(rows, boundaries), np.split(cols, boundaries), np.split(positions, boundaries)
+        ):
+            if len(chunk):
+                self._cells[(int(chunk_rows[0]), int(chunk_cols[0]))] = chunk
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self._cells.values())
+
+    def _cell_range(self, low: float, high: float) -> Tuple[int, int]:
+        return math.floor(low / self.cell_size), math.floor(high / self.cell_size)
+
+    def query(self, lat1: float, lng1: float, lat2: float, lng2: float, limit: Optional[int] = None) -> np.ndarray:
+        """lat1 <= 위도 <= lat2, lng1 <= 경도 <= lng2 인 행 위치 (원본 순서, 최대 limit개)"""
+        if lat1 > lat2 or lng1 > lng2 or not self._cells:
+            return np.empty(0, dtype=np.int64)
+
+        row0, row1 = self._cell_range(lat1, lat2)
+        col0, col1 = self._cell_range(lng1, lng2)
+
+        # bbox 가 덮는 셀 수가 실제 셀 수보다 많으면 (전국 범위 등) 존재하는 셀만 순회
+        if (row1 - row0 + 1) * (col1 - col0 + 1) > len(self._cells):
+            keys = [key for key in self._cells if row0 <= key[0] <= row1 and col0 <= key[1] <= col1]
+        else:
+            keys = [
+                (r, c)
+                for r in range(row0, row1 + 1)
+                for c in range(col0, col1 + 1)
+                if (r, c) in self._cells
+            ]
+
+        parts = []
+        for r, c in keys:
+            chunk = self._cells[(r, c)]
+            # 셀 전체가 bbox 내부면 비교 생략 (경계 부동소수 오차 여유 _EPS)
+            inner = (
+                r * self.cell_size - _EPS >= lat1 and (r + 1) * self.cell_size + _EPS <= lat2
+                and c * self.cell_size - _EPS >= lng1 and (c + 1) * self.cell_size + _EPS <= lng2
+            )
+            if not inner:
+                lats, lngs = self._lats[chunk], self._lngs[chunk]
+                chunk = chunk[(lats >= lat1) & (lats <= lat2) & (lngs >= lng1) & (lngs <= lng2)]
+            if len(chunk):
+                parts.append(chunk)
+
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+
+        result = np.sort(np.concatenate(parts))
+        return result if limit is None else result[:limit]
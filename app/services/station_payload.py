@@ -0,0 +1,258 @@
+"""
+주유소 목록 응답 포맷
+- fields= 필드 선택 (기본: 지도/목록 표시용 최소 필드, "all" 이면 전체 컬럼)
+- Accept 헤더(또는 format=)로 인코딩 선택
+  · application/json                       : 기존 형태 (행 단위 / GeoJSON)
+  · application/vnd.columnar+json          : 필드별 배열 (columnar JSON)
+  · application/msgpack                    : columnar + MessagePack (msgpack 설치 시)
+  · application/vnd.apache.arrow.stream    : Arrow IPC stream (pyarrow 설치 시)
+- GeoJSON feature 는 미리 인코딩한 bytes 조각을 이어 붙여 스트리밍 가능
+  (orjson 설치 시 orjson, 없으면 표준 json)
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성
+    msgpack = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # 선택 의존성
+    pa = None
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+# 기본 응답 필드 (원본 field*, 중복 좌표 _X/_Y, 통계 컬럼 제외)
+LEAN_STATION_FIELDS = (
+    "id",
+    "상호",
+    "상태",
+    "주소",
+    "년도",
+    "일자",
+    "행정구역",
+    "권역",
+    "recommend1",
+    "위도",
+    "경도",
+)
+
+ALL_FIELDS = {"all", "*"}
+
+JSON_MEDIA_TYPE = "application/json"
+COLUMNAR_MEDIA_TYPE = "application/vnd.columnar+json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# format= 파라미터 별칭 → media type
+FORMAT_ALIASES = {
+    "json": JSON_MEDIA_TYPE,
+    "columnar": COLUMNAR_MEDIA_TYPE,
+    "msgpack": MSGPACK_MEDIA_TYPE,
+    "arrow": ARROW_MEDIA_TYPE,
+}
+
+# 스트리밍 FeatureCollection 한 조각당 feature 수
+FEATURE_BATCH_SIZE = 500
+
+_ACCEPT_ALIASES = {
+    "application/x-msgpack": MSGPACK_MEDIA_TYPE,
+    "application/vnd.apache.arrow.file": ARROW_MEDIA_TYPE,
+}
+
+
+class PayloadFormatError(ValueError):
+    """요청한 필드 / 인코딩을 처리할 수 없음 (status_code 포함)"""
+
+    def __init__(self, message: str, status_code: int = 400) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def resolve_fields(fields: Optional[str], available: Iterable[str]) -> Optional[List[str]]:
+    """
+    fields 파라미터 → 응답 필드 목록
+    - 미지정: LEAN_STATION_FIELDS 중 존재하는 컬럼
+    - "all" / "*": None (전체 컬럼)
+    - "상호,주소,...": 지정 순서대로 (없는 컬럼이면 PayloadFormatError)
+    """
+    available = list(available)
+
+    if fields is None or not fields.strip():
+        return [name for name in LEAN_STATION_FIELDS if name in available]
+
+    if fields.strip() in ALL_FIELDS:
+        return None
+
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in available]
+    if unknown:
+        raise PayloadFormatError(f"알 수 없는 필드: {', '.join(unknown)}")
+    return list(dict.fromkeys(requested))
+
+
+def project(records: Sequence[Dict[str, Any]], fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """레코드 → 선택 필드만 남긴 새 dict (fields=None 이면 원본 그대로)"""
+    if fields is None:
+        return list(records)
+    return [{name: record.get(name) for name in fields} for record in records]
+
+
+def negotiate_format(accept: Optional[str], format_param: Optional[str] = None) -> str:
+    """format= 우선, 없으면 Accept 헤더 순서대로 지원 media type 선택 (기본 JSON)"""
+    if format_param:
+        media_type = FORMAT_ALIASES.get(format_param.lower())
+        if media_type is None:
+            raise PayloadFormatError(
+                f"지원하지 않는 format: {format_param} ({', '.join(FORMAT_ALIASES)})"
+            )
+        return _check_available(media_type)
+
+    for part in (accept or "").split(","):
+        media_type = part.split(";")[0].strip().lower()
+        media_type = _ACCEPT_ALIASES.get(media_type, media_type)
+        if media_type in (COLUMNAR_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, ARROW_MEDIA_TYPE):
+            return _check_available(media_type)
+        if media_type in (JSON_MEDIA_TYPE, "application/geo+json", "*/*"):
+            return JSON_MEDIA_TYPE
+
+    return JSON_MEDIA_TYPE
+
+
+def _check_available(media_type: str) -> str:
+    if media_type == MSGPACK_MEDIA_TYPE and msgpack is None:
+        raise PayloadFormatError("msgpack 패키지가 설치되어 있지 않습니다.", status_code=406)
+    if media_type == ARROW_MEDIA_TYPE and pa is None:
+        raise PayloadFormatError("pyarrow 패키지가 설치되어 있지 않습니다.", status_code=406)
+    return media_type
+
+
+def to_columns(records: Sequence[Dict[str, Any]], fields: Optional[List[str]]) -> Dict[str, List[Any]]:
+    """행 레코드 → 필드별 배열"""
+    if fields is None:
+        fields = list(records[0].keys()) if records else []
+    return {name: [record.get(name) for record in records] for name in fields}
+
+
+def _arrow_array(values: List[Any]):
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # 타입이 섞인 컬럼은 문자열로
+        return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+
+def encode_compact(media_type: str, records: Sequence[Dict[str, Any]], fields: Optional[List[str]]) -> bytes:
+    """columnar / msgpack / arrow 인코딩"""
+    columns = to_columns(records, fields)
+
+    if media_type == ARROW_MEDIA_TYPE:
+        table = pa.table({name: _arrow_array(values) for name, values in columns.items()})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    payload = {"count": len(records), "fields": list(columns), "columns": columns}
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return msgpack.packb(payload, use_bin_type=True)
+
+    raise PayloadFormatError(f"지원하지 않는 인코딩: {media_type}")
+
+
+def station_list_response(
+    records: Sequence[Dict[str, Any]],
+    fields: Optional[List[str]],
+    media_type: str,
+    geojson: bool = False,
+    headers: Optional[Dict[str, str]] = None,
+    encoded_features: Optional[Sequence[bytes]] = None,
+) -> Response:
+    """
+    필드 선택 + 인코딩 적용 응답
+    - JSON: geojson=True 면 FeatureCollection(좌표 제외 속성), 아니면 {"count", "items"}
+      (encoded_features 를 주면 미리 인코딩한 feature 조각을 이어 붙여 스트리밍)
+    - 그 외: 필드별 배열 (위도 / 경도 포함)
+    """
+    headers = {**(headers or {}), "Vary": "Accept"}
+
+    if media_type == JSON_MEDIA_TYPE:
+        if geojson and encoded_features is not None:
+            return StreamingResponse(
+                iter_feature_collection(encoded_features),
+                media_type=JSON_MEDIA_TYPE,
+                headers=headers,
+            )
+        if geojson:
+            content = {"type": "FeatureCollection", "features": _features(records, fields)}
+        else:
+            items = project(records, fields)
+            content = {"count": len(items), "items": items}
+        return JSONResponse(content=content, headers=headers)
+
+    if media_type == COLUMNAR_MEDIA_TYPE:
+        columns = to_columns(records, fields)
+        return JSONResponse(
+            content={"count": len(records), "fields": list(columns), "columns": columns},
+            media_type=COLUMNAR_MEDIA_TYPE,
+            headers=headers,
+        )
+
+    return Response(content=encode_compact(media_type, records, fields), media_type=media_type, headers=headers)
+
+
+def encode_json(value: Any) -> bytes:
+    """JSONResponse 와 같은 compact UTF-8 JSON (orjson 있으면 orjson)"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def iter_feature_collection(fragments: Sequence[bytes], batch_size: int = FEATURE_BATCH_SIZE) -> Iterator[bytes]:
+    """미리 인코딩한 feature 조각 → FeatureCollection bytes 조각 (batch_size 개씩)"""
+    yield b'{"type":"FeatureCollection","features":['
+    for start in range(0, len(fragments), batch_size):
+        chunk = b",".join(fragments[start:start + batch_size])
+        yield chunk if start == 0 else b"," + chunk
+    yield b"]}"
+
+
+def station_feature(item: Dict[str, Any], fields: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+    """레코드 → GeoJSON Point feature (속성은 선택 필드 중 좌표 제외), 좌표 없으면 None"""
+    try:
+        lon = float(item.get("경도"))
+        lat = float(item.get("위도"))
+    except (ValueError, TypeError):
+        return None
+
+    names = fields if fields is not None else item.keys()
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Point",
+            "coordinates": [lon, lat]
+        },
+        "properties": {
+            name: item.get(name) for name in names
+            if name not in ("경도", "위도")
+        }
+    }
+
+
+def _features(records: Sequence[Dict[str, Any]], fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """좌표 있는 레코드만 feature 로 (좌표 없는 항목은 제외)"""
+    features = []
+    for item in records:
+        feature = station_feature(item, fields)
+        if feature is not None:
+            features.append(feature)
+    return features
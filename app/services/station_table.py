@@ -0,0 +1,83 @@
+"""
+읽기 전용 주유소 테이블 스냅샷
+- 로드 시 1회 중복 컬럼 제거 후 컬럼별 numpy 배열로 고정 (write=False)
+- 요청 처리 중에는 행 단위 레코드만 만들고 전체 테이블은 복사/수정하지 않음
+- JSON 응답용 레코드(NaN/inf → None)는 최초 1회 만들어 재사용
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _to_native(value: Any) -> Any:
+    """numpy 스칼라 → 파이썬 기본 타입 (DataFrame.to_dict와 동일한 형태)"""
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _to_json_value(value: Any) -> Any:
+    """numpy 스칼라 → 기본 타입, NaN / inf / NaT → None"""
+    value = _to_native(value)
+    if value is None:
+        return None
+    if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        return None
+    if value is pd.NaT:
+        return None
+    return value
+
+
+class StationTable:
+    """컬럼 지향 읽기 전용 station 스냅샷"""
+
+    def __init__(self, df: pd.DataFrame):
+        # station.csv → rename 과정에서 생길 수 있는 중복 컬럼은 첫 번째만 유지
+        df = df.loc[:, ~df.columns.duplicated()]
+
+        self.columns: Tuple[str, ...] = tuple(df.columns)
+        self._arrays: Dict[str, np.ndarray] = {}
+        for col in self.columns:
+            arr = df[col].to_numpy(copy=True)
+            arr.setflags(write=False)
+            self._arrays[col] = arr
+
+        self._size = len(df)
+        self._json_records: Optional[List[Dict[str, Any]]] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, column: str) -> bool:
+        return column in self._arrays
+
+    def column(self, name: str) -> np.ndarray:
+        """읽기 전용 컬럼 배열 (KeyError: 컬럼 없음)"""
+        return self._arrays[name]
+
+    def record(self, pos: int) -> Dict[str, Any]:
+        """행 위치 → 레코드 dict (해당 행 값만 읽음)"""
+        return {col: _to_native(arr[pos]) for col, arr in self._arrays.items()}
+
+    def records(self, positions: Iterable[int]) -> List[Dict[str, Any]]:
+        """여러 행 위치 → 레코드 dict 리스트"""
+        return [self.record(pos) for pos in positions]
+
+    def json_records(self) -> List[Dict[str, Any]]:
+        """
+        전체 행의 JSON 직렬화 가능 레코드 (최초 1회 생성 후 재사용)
+        - 반환된 dict 는 공유 객체이므로 수정하지 말 것
+        """
+        if self._json_records is None:
+            columns = [(col, self._arrays[col].tolist()) for col in self.columns]
+            self._json_records = [
+                {col: _to_json_value(values[pos]) for col, values in columns}
+                for pos in range(self._size)
+            ]
+        return self._json_records
+
+    def json_record(self, pos: int) -> Dict[str, Any]:
+        return self.json_records()[pos]
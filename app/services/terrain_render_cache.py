@@ -0,0 +1,195 @@
+"""
+렌더링된 지형도(terrain) PNG 캐시
+- 버전 키 = station 좌표 + 필지 데이터 버전 + 스타일 버전 + 이미지 크기
+- 같은 키의 PNG가 있으면 PostGIS 조회/오버레이 없이 바로 반환
+- ETag(버전 키) / Last-Modified 로 조건부 GET(304) 지원
+- 임시 파일 → os.replace 원자적 저장, 같은 station 동시 렌더는 1회만 수행
+  (lock 은 확인된 station 좌표 ID 기준, 렌더가 끝나 대기자가 없으면 제거)
+- 캐시 전용 디렉터리(generated_maps/terrain_renders/)의 {id}_terrain_{16hex}.png 만 관리
+  → 용량 상한 초과 시 오래 안 쓴 것부터 삭제 (다른 PNG 는 건드리지 않음)
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import time
+import uuid
+from contextlib import asynccontextmanager
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
+
+from app.core.config import BASE_DIR
+
+
+TERRAIN_RENDER_DIR = BASE_DIR / "generated_maps" / "terrain_renders"
+
+_UNSAFE_CHARS = re.compile(r"[^0-9A-Za-z_-]")
+
+# 캐시가 만든 파일만 (버전 키 = sha1 앞 16자리)
+_CACHE_FILE = re.compile(r"(?P<id>[0-9A-Za-z_-]+)_terrain_(?P<version>[0-9a-f]{16})\.png")
+
+
+class TerrainRenderCache:
+    """{id}_terrain_{version}.png 파일 캐시"""
+
+    def __init__(self, out_dir: Path = TERRAIN_RENDER_DIR, max_bytes: int = 512 * 1024 * 1024):
+        self.out_dir = Path(out_dir)
+        self.max_bytes = max_bytes
+        # station 좌표 ID → [lock, 사용 중인 요청 수]
+        self._locks: Dict[str, List] = {}
+
+    # ------------------------------------------------------------------
+    # 키 / 경로
+    # ------------------------------------------------------------------
+    @staticmethod
+    def version_key(
+        lon: float,
+        lat: float,
+        parcel_version: str,
+        style_version: str,
+        width: int = 768,
+        height: int = 768,
+    ) -> str:
+        raw = f"{float(lon):.6f}|{float(lat):.6f}|{parcel_version}|{style_version}|{width}x{height}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def etag(version: str) -> str:
+        return f'"{version}"'
+
+    def _safe_id(self, station_id: str) -> str:
+        return _UNSAFE_CHARS.sub("_", str(station_id))
+
+    def path_for(self, station_id: str, version: str) -> Path:
+        return self.out_dir / f"{self._safe_id(station_id)}_terrain_{version}.png"
+
+    @asynccontextmanager
+    async def render_lock(self, station_id: str) -> AsyncIterator[None]:
+        """
+        같은 station 렌더 직렬화 (station_id 는 확인된 좌표 ID)
+        - 대기 / 보유 요청이 모두 끝나면 lock 을 제거해 dict 가 커지지 않게
+        """
+        entry = self._locks.get(station_id)
+        if entry is None:
+            entry = self._locks[station_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                self._locks.pop(station_id, None)
+
+    def _cache_files(self) -> List[Path]:
+        """캐시 디렉터리 안 {id}_terrain_{16hex}.png 파일만"""
+        return [p for p in self.out_dir.glob("*_terrain_*.png") if _CACHE_FILE.fullmatch(p.name)]
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+    def lookup(self, station_id: str, version: str) -> Optional[Path]:
+        path = self.path_for(station_id, version)
+        if not path.exists():
+            return None
+        try:
+            # LRU 기준이 되도록 접근 시각만 갱신 (mtime = Last-Modified 유지)
+            st = path.stat()
+            os.utime(path, (time.time(), st.st_mtime))
+        except OSError:
+            pass
+        return path
+
+    def store(self, station_id: str, version: str, image) -> Path:
+        """PIL 이미지 → 원자적 저장 → 같은 ID의 이전 버전 삭제 → 용량 정리"""
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(station_id, version)
+        tmp_path = path.with_name(f".{path.stem}.{uuid.uuid4().hex}.tmp")
+        try:
+            image.save(tmp_path, format="PNG")
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        safe_id = self._safe_id(station_id)
+        for old in self._cache_files():
+            if old != path and _CACHE_FILE.fullmatch(old.name).group("id") == safe_id:
+                try:
+                    old.unlink()
+                except FileNotFoundError:
+                    pass
+
+        self.evict()
+        return path
+
+    def evict(self) -> int:
+        """용량 상한 초과 시 마지막 접근(atime)이 오래된 PNG부터 삭제 → 삭제 개수"""
+        files = []
+        for p in self._cache_files():
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            files.append((st.st_atime, st.st_size, p))
+
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, p in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    # ------------------------------------------------------------------
+    # 조건부 GET
+    # ------------------------------------------------------------------
+    @staticmethod
+    def last_modified(path: Path) -> str:
+        return formatdate(path.stat().st_mtime, usegmt=True)
+
+    def is_not_modified(
+        self,
+        version: str,
+        path: Optional[Path],
+        if_none_match: Optional[str],
+        if_modified_since: Optional[str],
+    ) -> bool:
+        if if_none_match:
+            tags = {tag.strip() for tag in if_none_match.split(",")}
+            # 버전 키가 같으면 내용도 같으므로 파일 유무와 무관하게 304
+            return "*" in tags or self.etag(version) in tags or f"W/{self.etag(version)}" in tags
+
+        if if_modified_since and path is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(path.stat().st_mtime) <= int(since)
+
+        return False
+
+
+_terrain_render_cache_instance: Optional[TerrainRenderCache] = None
+
+
+def get_terrain_render_cache() -> TerrainRenderCache:
+    """TerrainRenderCache 싱글톤 (TERRAIN_CACHE_MAX_MB로 용량 상한 설정)"""
+
+    global _terrain_render_cache_instance
+
+    if _terrain_render_cache_instance is None:
+        try:
+            max_mb = float(os.getenv("TERRAIN_CACHE_MAX_MB", "512"))
+        except ValueError:
+            max_mb = 512
+        _terrain_render_cache_instance = TerrainRenderCache(max_bytes=int(max_mb * 1024 * 1024))
+
+    return _terrain_render_cache_instance
@@ -1,43 +1,123 @@
 # app/services/terrain_service.py
 import os
-import io
 import json
-import requests
-import psycopg2
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 
+import numpy as np
+import shapely
 from PIL import Image, ImageDraw
-from shapely import wkb
-from shapely.geometry import Point
+from shapely.geometry import Point, mapping
 from shapely.ops import transform as shp_transform
 from pyproj import Transformer
-from psycopg2.extras import RealDictCursor
 
-from app.services.terrain_utils import lonlat_to_webmerc
-
-VWORLD_API_KEY = os.getenv("VWORLD_API_KEY")
-
-# VWorld WMS DEM/Hillshade
-VWORLD_WMS = (
-    "https://xdworld.vworld.kr/xdworld/wms?"
-    "SERVICE=WMS&VERSION=1.1.1&REQUEST=GetMap"
-    "&LAYERS=dem"
-    "&STYLES=hillshade"
-    "&FORMAT=image/png"
-    "&SRS=EPSG:3857"
-    "&WIDTH={width}&HEIGHT={height}"
-    "&BBOX={minx},{miny},{maxx},{maxy}"
-    "&apiKey={apiKey}"
-)
+from app.db.postgis import PostGISPool, get_postgis_pool
+from app.services.hillshade_tiles import VWORLD_API_KEY, HillshadeTileCache
+from app.services.terrain_utils import ground_resolution, lonlat_to_webmerc
+
+# 반경 내 필지 + 용도지역 (커넥션별 PREPARE 후 재사용)
+PARCELS_WITHIN_SQL = """
+    SELECT
+        ST_AsBinary(geom) AS geom,
+        pnu,
+        jibun,
+        zoning_lclass,
+        zoning_mclass,
+        zoning_sclass,
+        zoning_name,
+        zoning_area,
+        zoning_notice_date
+    FROM parcels
+    WHERE ST_DWithin(
+        ST_SetSRID(geom, 5186),
+        ST_Transform(ST_SetSRID(ST_MakePoint($1, $2), 4326), 5186),
+        $3
+    )
+"""
+
+# 인터랙티브 지도용 필지 GeoJSON
+# - $4: 단순화 허용오차(m, 5186), $5: 좌표 소수 자릿수 (양자화)
+PARCELS_GEOJSON_SQL = """
+    SELECT
+        ST_AsGeoJSON(
+            ST_Transform(ST_SimplifyPreserveTopology(ST_SetSRID(geom, 5186), $4), 4326),
+            $5
+        ) AS geom_json,
+        pnu,
+        jibun,
+        zoning_lclass,
+        zoning_mclass,
+        zoning_sclass,
+        zoning_name
+    FROM parcels
+    WHERE ST_DWithin(
+        ST_SetSRID(geom, 5186),
+        ST_Transform(ST_SetSRID(ST_MakePoint($1, $2), 4326), 5186),
+        $3
+    )
+"""
+
+# draw_overlay 색상/선/라벨 등 렌더 결과가 바뀌면 올려서 PNG 캐시 무효화
+TERRAIN_STYLE_VERSION = "2"
+
+
+@lru_cache(maxsize=256)
+def _zoning_color(zoning_name, zoning_lclass):
+    """용도지역 → 색상 매핑"""
+    key = (zoning_name or zoning_lclass or "").strip()
+
+    if not key:
+        return (230, 230, 230, 60)
+
+    # 대분류 기반
+    if "상업" in key:
+        return (255, 220, 190, 90)   # 상업지역
+    if "주거" in key:
+        return (220, 235, 255, 90)   # 주거지역
+    if "공업" in key:
+        return (255, 210, 210, 90)   # 공업지역
+    if "녹지" in key:
+        return (210, 240, 210, 90)   # 녹지지역
+    if "유통" in key:
+        return (255, 240, 170, 90)   # 유통상업
+
+    # 기본
+    return (235, 235, 235, 70)
+
+
+def _parcel_label(row):
+    """지번 / 또는 PNU 뒷자리"""
+    pnu = row.get("pnu")
+    return row.get("jibun") or (pnu[-4:] if pnu else None)
 
 
 class TerrainMapService:
     """VWorld Hillshade + PostGIS parcels → PNG / HTML"""
 
-    def __init__(self, pg_dsn: str):
+    def __init__(
+        self,
+        pg_dsn: Optional[str] = None,
+        tile_cache: Optional[HillshadeTileCache] = None,
+        pool: Optional[PostGISPool] = None,
+    ):
         self.pg_dsn = pg_dsn
+        self._pool = pool
+        # hillshade는 로컬 XYZ 타일 캐시에서 mosaic
+        self.tile_cache = tile_cache or HillshadeTileCache()
+        # parcels 테이블 재적재 시 PARCEL_DATA_VERSION을 올려서 PNG 캐시 무효화
+        self.parcel_data_version = os.getenv("PARCEL_DATA_VERSION", "1")
+        self.style_version = TERRAIN_STYLE_VERSION
         # parcels(5186) → 타일(3857) 변환
         self.tr_5186_to_3857 = Transformer.from_crs(5186, 3857, always_xy=True)
+        # 버퍼(3857) → Leaflet(4326) 변환
+        self.tr_3857_to_4326 = Transformer.from_crs(3857, 4326, always_xy=True)
+
+    @property
+    def pool(self) -> PostGISPool:
+        # 공용 커넥션 풀 (첫 조회 시점에 생성 → DB 없이도 서비스 생성 가능)
+        if self._pool is None:
+            self._pool = get_postgis_pool(self.pg_dsn)
+        return self._pool
 
     # ----------------------------
     # 1) 중심점 기준 bbox 계산
@@ -47,179 +127,182 @@ class TerrainMapService:
         return (cx - meter, cy - meter, cx + meter, cy + meter)
 
     # ----------------------------
-    # 2) VWorld WMS hillshade 가져오기
+    # 2) VWorld hillshade (타일 캐시 mosaic)
     # ----------------------------
     def fetch_hillshade(self, bbox, width=768, height=768):
-        minx, miny, maxx, maxy = bbox
-
-        url = VWORLD_WMS.format(
-            width=width,
-            height=height,
-            minx=minx,
-            miny=miny,
-            maxx=maxx,
-            maxy=maxy,
-            apiKey=VWORLD_API_KEY or ""
-        )
-
+        """(hillshade 이미지, 회색으로 채운 타일 수) — 0 이 아니면 렌더 결과를 캐시하지 말 것"""
         try:
-            r = requests.get(url, timeout=5)
-            r.raise_for_status()
-            return Image.open(io.BytesIO(r.content)).convert("RGBA")
+            img, empty = self.tile_cache.mosaic(bbox, width, height)
+            if empty:
+                print(f"[HILLSHADE] 비어 있는 타일 {empty}개 (회색으로 채움)")
+            return img, empty
         except Exception as e:
             print(f"[HILLSHADE ERROR] {e}")
-            return Image.new("RGBA", (width, height), (160, 160, 160, 255))
+            # 전체 회색 (타일 수는 알 수 없으므로 1)
+            return Image.new("RGBA", (width, height), (160, 160, 160, 255)), 1
 
     # ----------------------------
     # 3) PostGIS parcels + 속성 가져오기
     #    (지번 + 용도지역 zoning_* 다 가져옴)
     # ----------------------------
     def query_parcels(self, lon, lat, radius=500):
-        conn = psycopg2.connect(self.pg_dsn)
-        try:
-            with conn.cursor() as cur:
-                sql = """
-                    SELECT
-                        ST_AsBinary(geom) AS geom,
-                        pnu,
-                        jibun,
-                        zoning_lclass,
-                        zoning_mclass,
-                        zoning_sclass,
-                        zoning_name,
-                        zoning_area,
-                        zoning_notice_date
-                    FROM parcels
-                    WHERE ST_DWithin(
-                        ST_SetSRID(geom, 5186),
-                        ST_Transform(ST_SetSRID(ST_MakePoint(%s, %s), 4326), 5186),
-                        %s
-                    )
-                """
-                cur.execute(sql, (lon, lat, radius))
-                rows = cur.fetchall()
-
-                result = []
-                for (
-                    geom_bytes,
-                    pnu,
-                    jibun,
-                    z_l,
-                    z_m,
-                    z_s,
-                    z_n,
-                    z_area,
-                    z_date
-                ) in rows:
-                    result.append({
-                        "geom": bytes(geom_bytes),
-                        "pnu": pnu,
-                        "jibun": jibun,
-                        "zoning_lclass": z_l,
-                        "zoning_mclass": z_m,
-                        "zoning_sclass": z_s,
-                        "zoning_name": z_n,
-                        "zoning_area": z_area,
-                        "zoning_notice_date": z_date,
-                    })
-                return result
-        finally:
-            conn.close()
+        rows = self.pool.fetch_prepared(
+            "terrain_parcels_within",
+            PARCELS_WITHIN_SQL,
+            ("float8", "float8", "float8"),
+            (lon, lat, radius),
+        )
+
+        result = []
+        for (
+            geom_bytes,
+            pnu,
+            jibun,
+            z_l,
+            z_m,
+            z_s,
+            z_n,
+            z_area,
+            z_date
+        ) in rows:
+            result.append({
+                "geom": bytes(geom_bytes),
+                "pnu": pnu,
+                "jibun": jibun,
+                "zoning_lclass": z_l,
+                "zoning_mclass": z_m,
+                "zoning_sclass": z_s,
+                "zoning_name": z_n,
+                "zoning_area": z_area,
+                "zoning_notice_date": z_date,
+            })
+        return result
+
+    async def query_parcels_async(self, lon, lat, radius=500):
+        return await self.pool.run_async(self.query_parcels, lon, lat, radius)
 
     # ----------------------------
     # 4) PNG 오버레이 (용도지역 색상 + 3D + 버퍼)
     # ----------------------------
+    def _parcel_rings_3857(self, parcels):
+        """
+        parcels → 외곽 링 단위 배열 (일괄 처리)
+        - shapely 2.0 from_wkb 로 WKB 일괄 디코딩
+        - 전체 좌표를 pyproj 배열 변환 1회로 5186 → 3857
+        - (Multi)Polygon 분해 → (필지 index, 외곽 링) 배열
+        """
+        wkbs = np.empty(len(parcels), dtype=object)
+        wkbs[:] = [row.get("geom") for row in parcels]
+        geoms = shapely.from_wkb(wkbs, on_invalid="ignore")
+
+        invalid = sum(1 for raw, g in zip(wkbs, geoms) if raw is not None and g is None)
+        if invalid:
+            print(f"[WKB ERROR] 디코딩 실패 {invalid}건")
+
+        def to_3857(coords):
+            x, y = self.tr_5186_to_3857.transform(coords[:, 0], coords[:, 1])
+            return np.column_stack([x, y])
+
+        geoms = shapely.transform(geoms, to_3857)
+
+        # Polygon(3) / MultiPolygon(6) 만 사용
+        keep = np.isin(shapely.get_type_id(geoms), (3, 6)) & ~shapely.is_empty(geoms)
+        parcel_idx = np.flatnonzero(keep)
+        polys, part_of = shapely.get_parts(geoms[keep], return_index=True)
+
+        return parcel_idx[part_of], shapely.get_exterior_ring(polys), polys
+
     def draw_overlay(self, base_img, bbox, lon, lat, parcels):
         minx, miny, maxx, maxy = bbox
+        width, height = base_img.width, base_img.height
         draw = ImageDraw.Draw(base_img, "RGBA")
 
         # 3857 → 픽셀 좌표
         def proj_3857_to_px(x, y):
             return (
-                int((x - minx) / (maxx - minx) * base_img.width),
-                int((maxy - y) / (maxy - miny) * base_img.height),
+                int((x - minx) / (maxx - minx) * width),
+                int((maxy - y) / (maxy - miny) * height),
             )
 
-        # 용도지역 → 색상 매핑
-        def pick_color(zoning_name, zoning_lclass):
-            key = (zoning_name or zoning_lclass or "").strip()
-
-            if not key:
-                return (230, 230, 230, 60)
-
-            # 대분류 기반
-            if "상업" in key:
-                return (255, 220, 190, 90)   # 상업지역
-            if "주거" in key:
-                return (220, 235, 255, 90)   # 주거지역
-            if "공업" in key:
-                return (255, 210, 210, 90)   # 공업지역
-            if "녹지" in key:
-                return (210, 240, 210, 90)   # 녹지지역
-            if "유통" in key:
-                return (255, 240, 170, 90)   # 유통상업
-
-            # 기본
-            return (235, 235, 235, 70)
-
-        # ---------------- 필지 loop ----------------
-        for row in parcels:
-            try:
-                geom_bytes = row.get("geom")
-                if geom_bytes is None:
-                    continue
-                g5186 = wkb.loads(geom_bytes)
-            except Exception as e:
-                print(f"[WKB ERROR] {e}")
-                continue
-
-            g3857 = shp_transform(self.tr_5186_to_3857.transform, g5186)
-            if g3857.is_empty:
-                continue
-
-            if g3857.geom_type == "Polygon":
-                polys = [g3857]
-            elif g3857.geom_type == "MultiPolygon":
-                polys = list(g3857.geoms)
-            else:
-                continue
-
-            zoning_name = row.get("zoning_name")
-            zoning_lclass = row.get("zoning_lclass")
-            pnu = row.get("pnu")
-            jibun = row.get("jibun")
+        # 같은 식의 배열 버전 (int 변환은 0 방향 절삭으로 동일)
+        def proj_3857_to_px_array(xy):
+            out = np.empty(xy.shape, dtype=np.int64)
+            out[:, 0] = ((xy[:, 0] - minx) / (maxx - minx) * width).astype(np.int64)
+            out[:, 1] = ((maxy - xy[:, 1]) / (maxy - miny) * height).astype(np.int64)
+            return out
+
+        # ---------------- 필지 (배열 일괄 처리) ----------------
+        if parcels:
+            owner, rings, polys = self._parcel_rings_3857(parcels)
+
+            # 링별 좌표 → 픽셀
+            coords, ring_of = shapely.get_coordinates(rings, return_index=True)
+            px = proj_3857_to_px_array(coords)
+
+            counts = np.bincount(ring_of, minlength=len(rings))
+            starts = np.cumsum(counts) - counts
+            has_coords = counts > 0
+            safe_starts = starts[has_coords]
+
+            # 링별 픽셀 bbox
+            x_min = np.zeros(len(rings), dtype=np.int64)
+            x_max = np.zeros(len(rings), dtype=np.int64)
+            y_min = np.zeros(len(rings), dtype=np.int64)
+            y_max = np.zeros(len(rings), dtype=np.int64)
+            if len(safe_starts):
+                x_min[has_coords] = np.minimum.reduceat(px[:, 0], safe_starts)
+                x_max[has_coords] = np.maximum.reduceat(px[:, 0], safe_starts)
+                y_min[has_coords] = np.minimum.reduceat(px[:, 1], safe_starts)
+                y_max[has_coords] = np.maximum.reduceat(px[:, 1], safe_starts)
+
+            # 캔버스 밖(그림자 1px 포함) 필지는 그리지 않음
+            visible = has_coords & (x_max >= -1) & (y_max >= -1) & (x_min <= width) & (y_min <= height)
+
+            # 라벨 후보: 충분히 크고 (25x18px 이상) 중심점이 캔버스 안
+            labels = [_parcel_label(parcels[i]) for i in owner]
+            has_label = np.fromiter((bool(label) for label in labels), dtype=bool, count=len(labels))
+            labeled = visible & has_label & ((x_max - x_min) >= 25) & ((y_max - y_min) >= 18)
+
+            label_px = np.zeros((len(rings), 2), dtype=np.int64)
+            if labeled.any():
+                centroids = shapely.get_coordinates(shapely.centroid(polys[labeled]))
+                label_px[labeled] = proj_3857_to_px_array(centroids)
+                labeled &= (
+                    (label_px[:, 0] >= 0) & (label_px[:, 0] < width)
+                    & (label_px[:, 1] >= 0) & (label_px[:, 1] < height)
+                )
 
-            fill_color = pick_color(zoning_name, zoning_lclass)
+            fill_colors = [
+                _zoning_color(parcels[i].get("zoning_name"), parcels[i].get("zoning_lclass"))
+                for i in owner
+            ]
 
-            for poly in polys:
-                coords = [proj_3857_to_px(x, y) for x, y in poly.exterior.coords]
+            # 그리기 (필지 순서 유지: 겹치는 영역의 결과가 기존과 동일)
+            flat = px.ravel()
+            for ring in np.flatnonzero(visible):
+                start, count = starts[ring], counts[ring]
+                ring_xy = flat[2 * start:2 * (start + count)]
+                coords_px = ring_xy.tolist()
 
                 # 3D 느낌: 살짝 오른쪽-아래로 그림자
-                shadow = [(x + 1, y + 1) for x, y in coords]
-                draw.polygon(shadow, fill=(0, 0, 0, 40))
+                draw.polygon((ring_xy + 1).tolist(), fill=(0, 0, 0, 40))
 
                 # 본 필지 레이어
                 draw.polygon(
-                    coords,
-                    fill=fill_color,
+                    coords_px,
+                    fill=fill_colors[ring],
                     outline=(255, 255, 255, 180),
                 )
                 # 얇은 어두운 외곽선 한 번 더
-                draw.line(coords, fill=(80, 80, 80, 160), width=1)
+                draw.line(coords_px, fill=(80, 80, 80, 160), width=1)
 
                 # 라벨링 (지번 / 또는 PNU 뒷자리)
-                centroid = poly.centroid
-                cx_px, cy_px = proj_3857_to_px(centroid.x, centroid.y)
-                label = jibun or (pnu[-4:] if pnu else None)
-
-                # 너무 작은 폴리곤엔 라벨 안 찍기
-                xs = [p[0] for p in coords]
-                ys = [p[1] for p in coords]
-                if (max(xs) - min(xs)) < 25 or (max(ys) - min(ys)) < 18:
-                    label = None
-
-                if label:
-                    draw.text((cx_px, cy_px), str(label), fill=(30, 30, 30, 220))
+                if labeled[ring]:
+                    draw.text(
+                        (int(label_px[ring, 0]), int(label_px[ring, 1])),
+                        str(labels[ring]),
+                        fill=(30, 30, 30, 220),
+                    )
 
         # ---------------- 300m / 500m 버퍼 ----------------
         cx, cy = lonlat_to_webmerc(lon, lat)  # 중심점 3857
@@ -255,77 +338,93 @@ class TerrainMapService:
         return base_img
 
     # ----------------------------
-    # 5) HTML 인터랙티브 지도용 메서드
+    # 5) 필지 GeoJSON (zoom 기준 단순화 + 좌표 양자화, 스트리밍)
     # ----------------------------
-    def generate_interactive_html(self, lon, lat, radius=500):
+    @staticmethod
+    def geojson_tolerance(lat, zoom):
         """
-        PNG terrain과 거의 동일한 시각을 Leaflet 인터랙티브 지도(HTML)로 생성
+        zoom 별 단순화 허용오차(m) / 좌표 소수 자릿수
+        - 허용오차: 화면 0.5픽셀
+        - 자릿수: 1픽셀(경도 환산)을 표현할 수 있는 최소 자릿수 (5~7)
         """
+        meters_per_px = ground_resolution(lat, zoom)
+        degrees_per_px = meters_per_px / 111320.0
+        digits = int(np.clip(np.ceil(-np.log10(degrees_per_px)), 5, 7))
+        return meters_per_px * 0.5, digits
+
+    def query_parcels_geojson(self, lon, lat, radius=500, zoom=16):
+        """PostGIS에서 단순화 + 4326 변환 + GeoJSON 직렬화까지 수행한 행 목록"""
+        tolerance, digits = self.geojson_tolerance(lat, zoom)
+        return self.pool.fetch_prepared(
+            "terrain_parcels_geojson",
+            PARCELS_GEOJSON_SQL,
+            ("float8", "float8", "float8", "float8", "int4"),
+            (lon, lat, radius, tolerance, digits),
+        )
 
-        # -----------------------------
-        # 1) parcels 가져오기
-        # -----------------------------
-        parcels = self.query_parcels(lon, lat, radius)
-
-        # -----------------------------
-        # 2) parcel → GeoJSON 변환
-        # -----------------------------
-        from shapely.geometry import mapping
-
-        geojson_features = []
-
-        # 5186 → 3857 → 4326 변환기
-        tr_3857_to_4326 = Transformer.from_crs(3857, 4326, always_xy=True)
+    async def query_parcels_geojson_async(self, lon, lat, radius=500, zoom=16):
+        return await self.pool.run_async(self.query_parcels_geojson, lon, lat, radius, zoom)
 
-        for row in parcels:
-            try:
-                geom = wkb.loads(row["geom"])
-                g3857 = shp_transform(self.tr_5186_to_3857.transform, geom)
-                g4326 = shp_transform(tr_3857_to_4326.transform, g3857)
+    @staticmethod
+    def iter_parcel_geojson(rows, batch_size=500):
+        """
+        GeoJSON FeatureCollection 을 batch_size 개 feature 단위 bytes 조각으로 생성
+        - geometry 는 PostGIS가 만든 문자열을 그대로 이어 붙임 (재파싱 없음)
+        """
+        yield b'{"type":"FeatureCollection","features":['
 
-                gj = mapping(g4326)
+        chunk = []
+        first = True
+        for geom_json, pnu, jibun, z_l, z_m, z_s, z_n in rows:
+            if not geom_json:
+                continue
+            properties = json.dumps(
+                {
+                    "pnu": pnu,
+                    "jibun": jibun,
+                    "zoning_name": z_n,
+                    "zoning_lclass": z_l,
+                    "zoning_mclass": z_m,
+                    "zoning_sclass": z_s,
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            feature = f'{{"type":"Feature","geometry":{geom_json},"properties":{properties}}}'
+            chunk.append(feature if first else "," + feature)
+            first = False
 
-                gj["properties"] = {
-                    "pnu": row.get("pnu"),
-                    "jibun": row.get("jibun"),
-                    "zoning_name": row.get("zoning_name"),
-                    "zoning_lclass": row.get("zoning_lclass"),
-                    "zoning_mclass": row.get("zoning_mclass"),
-                    "zoning_sclass": row.get("zoning_sclass"),
-                }
+            if len(chunk) >= batch_size:
+                yield "".join(chunk).encode("utf-8")
+                chunk = []
 
-                geojson_features.append(gj)
+        if chunk:
+            yield "".join(chunk).encode("utf-8")
+        yield b"]}"
 
-            except Exception as e:
-                print("[GeoJSON ERROR]", e)
-                continue
+    # ----------------------------
+    # 6) HTML 인터랙티브 지도용 메서드
+    # ----------------------------
+    def _buffer_geojson(self, lon, lat, meter):
+        cx, cy = lonlat_to_webmerc(lon, lat)
+        circle = Point(cx, cy).buffer(meter, resolution=64)
+        return mapping(shp_transform(self.tr_3857_to_4326.transform, circle))
 
-        geojson = {
-            "type": "FeatureCollection",
-            "features": geojson_features
-        }
+    def generate_interactive_html(self, lon, lat, parcels_url="parcels", zoom=16):
+        """
+        PNG terrain과 거의 동일한 시각을 Leaflet 인터랙티브 지도(HTML)로 생성
+        - 필지는 parcels_url(GeoJSON)에서 비동기로 로드 (HTML에 인라인하지 않음)
+        - 지도를 더 확대하면 해당 zoom 정밀도로 다시 로드
+        """
 
         # -----------------------------
-        # 3) 300m / 500m 버퍼 GeoJSON
+        # 1) 300m / 500m 버퍼 GeoJSON
         # -----------------------------
-        cx, cy = lonlat_to_webmerc(lon, lat)
-
-        circle500 = Point(cx, cy).buffer(500, resolution=64)
-        circle300 = Point(cx, cy).buffer(300, resolution=64)
-
-        circle500_4326 = shp_transform(
-            Transformer.from_crs(3857, 4326, always_xy=True).transform, circle500
-        )
-        circle300_4326 = shp_transform(
-            Transformer.from_crs(3857, 4326, always_xy=True).transform, circle300
-        )
-
-        from shapely.geometry import mapping as shp_mapping
-        gj_500 = shp_mapping(circle500_4326)
-        gj_300 = shp_mapping(circle300_4326)
+        gj_500 = self._buffer_geojson(lon, lat, 500)
+        gj_300 = self._buffer_geojson(lon, lat, 300)
 
         # -----------------------------
-        # 4) HTML Leaflet 페이지 구성
+        # 2) HTML Leaflet 페이지 구성
         # -----------------------------
         html = f"""
         <!DOCTYPE html>
@@ -350,7 +449,7 @@ class TerrainMapService:
             <div id="map"></div>
 
             <script>
-                var map = L.map('map').setView([{lat}, {lon}], 16);
+                var map = L.map('map').setView([{lat}, {lon}], {zoom});
 
                 // DEM hillshade
                 L.tileLayer.wms("https://xdworld.vworld.kr/xdworld/wms?", {{
@@ -362,37 +461,59 @@ class TerrainMapService:
                     apiKey: '{VWORLD_API_KEY}'
                 }}).addTo(map);
 
-                // 필지 GeoJSON
-                var parcels = {json.dumps(geojson)};
-
-                L.geoJSON(parcels, {{
-                    style: function(feature) {{
-                        var z = feature.properties.zoning_name || feature.properties.zoning_lclass || "";
-                        var color = "#dddddd";
-
-                        if (z.indexOf("상업") !== -1) color = "#ffdcbf";
-                        else if (z.indexOf("주거") !== -1) color = "#dce9ff";
-                        else if (z.indexOf("공업") !== -1) color = "#ffd2d2";
-                        else if (z.indexOf("녹지") !== -1) color = "#d2e1d2";
-                        else if (z.indexOf("유통") !== -1) color = "#fff2b3";
-
-                        return {{
-                            fillColor: color,
-                            color: "#555",
-                            weight: 1,
-                            fillOpacity: 0.5
-                        }};
-                    }},
-                    onEachFeature: function (feature, layer) {{
-                        var p = feature.properties;
-                        layer.bindPopup(
-                            "<b>지번:</b> " + (p.jibun || '-') + "<br>" +
-                            "<b>용도지역(대분류):</b> " + (p.zoning_lclass || '-') + "<br>" +
-                            "<b>용도지역(이름):</b> " + (p.zoning_name || '-') + "<br>" +
-                            "<b>PNU:</b> " + (p.pnu || '-')
-                        );
-                    }}
-                }}).addTo(map);
+                // 필지 GeoJSON (비동기 로드, 확대 시 더 정밀하게 다시 로드)
+                var parcelsLayer = null;
+                var loadedZoom = 0;
+
+                function parcelStyle(feature) {{
+                    var z = feature.properties.zoning_name || feature.properties.zoning_lclass || "";
+                    var color = "#dddddd";
+
+                    if (z.indexOf("상업") !== -1) color = "#ffdcbf";
+                    else if (z.indexOf("주거") !== -1) color = "#dce9ff";
+                    else if (z.indexOf("공업") !== -1) color = "#ffd2d2";
+                    else if (z.indexOf("녹지") !== -1) color = "#d2e1d2";
+                    else if (z.indexOf("유통") !== -1) color = "#fff2b3";
+
+                    return {{
+                        fillColor: color,
+                        color: "#555",
+                        weight: 1,
+                        fillOpacity: 0.5
+                    }};
+                }}
+
+                function bindParcelPopup(feature, layer) {{
+                    var p = feature.properties;
+                    layer.bindPopup(
+                        "<b>지번:</b> " + (p.jibun || '-') + "<br>" +
+                        "<b>용도지역(대분류):</b> " + (p.zoning_lclass || '-') + "<br>" +
+                        "<b>용도지역(이름):</b> " + (p.zoning_name || '-') + "<br>" +
+                        "<b>PNU:</b> " + (p.pnu || '-')
+                    );
+                }}
+
+                function loadParcels(zoom) {{
+                    zoom = Math.min(Math.max(zoom, 10), 20);
+                    if (zoom <= loadedZoom) return;
+                    loadedZoom = zoom;
+
+                    fetch("{parcels_url}?zoom=" + zoom)
+                        .then(function (r) {{ return r.json(); }})
+                        .then(function (data) {{
+                            if (zoom !== loadedZoom) return;
+                            if (parcelsLayer) map.removeLayer(parcelsLayer);
+                            parcelsLayer = L.geoJSON(data, {{
+                                style: parcelStyle,
+                                onEachFeature: bindParcelPopup
+                            }}).addTo(map);
+                            parcelsLayer.bringToBack();
+                        }})
+                        .catch(function (e) {{ console.error("필지 로드 실패", e); }});
+                }}
+
+                loadParcels({zoom});
+                map.on("zoomend", function () {{ loadParcels(map.getZoom()); }});
 
                 // 버퍼 500m/300m
                 L.geoJSON({json.dumps(gj_500)}, {{
@@ -30,3 +30,22 @@ def lonlat_to_webmerc(lon: float, lat: float):
     x = lon * origin_shift / 180.0
     y = math.log(math.tan((90 + lat) * math.pi / 360.0)) * 6378137
     return x, y
+
+def webmerc_to_lonlat(x: float, y: float):
+    """EPSG:3857 meter → 경위도"""
+    origin_shift = 2 * math.pi * 6378137 / 2.0
+    lon = x / origin_shift * 180.0
+    lat = math.degrees(2 * math.atan(math.exp(y / 6378137)) - math.pi / 2)
+    return lon, lat
+
+def webmerc_to_global_px(x: float, y: float, zoom: int, tile_size: int = TILE_SIZE):
+    """EPSG:3857 meter → 해당 zoom의 전역 픽셀 좌표 (좌상단 원점)"""
+    origin_shift = 2 * math.pi * 6378137 / 2.0
+    world_px = tile_size * (2 ** zoom)
+    px = (x + origin_shift) / (2 * origin_shift) * world_px
+    py = (origin_shift - y) / (2 * origin_shift) * world_px
+    return px, py
+
+def ground_resolution(lat: float, zoom: int, tile_size: int = 256):
+    """해당 위도 / zoom 에서 화면 1픽셀이 덮는 거리(m) (Leaflet 기본 256px 타일 기준)"""
+    return math.cos(math.radians(lat)) * 2 * math.pi * 6378137 / (tile_size * (2 ** zoom))
@@ -0,0 +1,178 @@
+"""
+주유소 텍스트 검색용 n-gram 역색인
+- 로드 시 1회: 필드별 문자열을 소문자화 후 1~3글자 n-gram → 행 위치 posting list
+  (한글은 음절 단위 문자열이므로 글자 n-gram 이 그대로 음절 n-gram)
+- 조회: 검색어의 n-gram posting 을 짧은 것부터 교집합 → 후보만 실제 부분 문자열 확인
+  → 비용이 테이블 크기가 아니라 posting / 결과 크기에 비례
+- 부분 문자열 의미는 str.contains(regex=False) 와 동일, 결과는 원본 행 순서
+- rank=True 면 완전 일치 > 접두 일치 > 어절 시작 일치 > 포함 순 정렬
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+MAX_GRAM = 3
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+def _to_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and math.isnan(value):
+        return ""
+    return str(value)
+
+
+class NgramTextIndex:
+    """필드별 1~3-gram posting list 기반 부분 문자열 검색"""
+
+    def __init__(self, columns: Dict[str, Sequence[Any]], max_gram: int = MAX_GRAM) -> None:
+        self.max_gram = max_gram
+        self._texts: Dict[str, List[str]] = {}
+        self._lowered: Dict[str, List[str]] = {}
+        self._present: Dict[str, np.ndarray] = {}
+        self._postings: Dict[str, Dict[str, np.ndarray]] = {}
+        self._size = 0
+
+        for field, values in columns.items():
+            texts = [_to_text(v) for v in values]
+            lowered = [text.lower() for text in texts]
+            self._size = max(self._size, len(texts))
+
+            postings: Dict[str, List[int]] = {}
+            for pos, text in enumerate(lowered):
+                grams = {
+                    text[i:i + n]
+                    for n in range(1, max_gram + 1)
+                    for i in range(len(text) - n + 1)
+                }
+                for gram in grams:
+                    postings.setdefault(gram, []).append(pos)
+
+            self._texts[field] = texts
+            self._lowered[field] = lowered
+            self._present[field] = np.array(
+                [pos for pos, value in enumerate(values) if _to_text(value) or isinstance(value, str)],
+                dtype=np.int64,
+            )
+            self._postings[field] = {
+                gram: np.asarray(positions, dtype=np.int64) for gram, positions in postings.items()
+            }
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, fields: Iterable[str], max_gram: int = MAX_GRAM) -> "NgramTextIndex":
+        """DataFrame 의 존재하는 컬럼만 색인 (행 위치 = iloc 위치)"""
+        return cls(
+            {field: df[field].tolist() for field in fields if field in df.columns},
+            max_gram=max_gram,
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, field: str) -> bool:
+        return field in self._postings
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self._postings)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _candidates(self, field: str, needle: str) -> np.ndarray:
+        """needle(소문자) 의 n-gram posting 교집합 (필요조건만 만족하는 후보)"""
+        postings = self._postings[field]
+        n = min(len(needle), self.max_gram)
+        grams = {needle[i:i + n] for i in range(len(needle) - n + 1)}
+
+        lists = []
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting is None:
+                return _EMPTY
+            lists.append(posting)
+
+        lists.sort(key=len)
+        result = lists[0]
+        for posting in lists[1:]:
+            result = np.intersect1d(result, posting, assume_unique=True)
+            if not len(result):
+                break
+        return result
+
+    def contains(self, query: str, fields: Optional[Sequence[str]] = None, case: bool = True) -> np.ndarray:
+        """fields 중 하나라도 query 를 포함하는 행 위치 (오름차순)"""
+        fields = [f for f in (fields or self.fields) if f in self._postings]
+        query = _to_text(query)
+
+        parts = []
+        for field in fields:
+            if not query:
+                # 빈 검색어는 값이 있는 모든 행 (str.contains("") 와 동일)
+                parts.append(self._present[field])
+                continue
+
+            candidates = self._candidates(field, query.lower())
+            if case:
+                texts = self._texts[field]
+                matched = [pos for pos in candidates if query in texts[pos]]
+            else:
+                needle = query.lower()
+                lowered = self._lowered[field]
+                matched = [pos for pos in candidates if needle in lowered[pos]]
+            parts.append(np.asarray(matched, dtype=np.int64))
+
+        if not parts:
+            return _EMPTY
+        if len(parts) == 1:
+            return parts[0]
+        return np.unique(np.concatenate(parts))
+
+    def contains_all(self, terms: Sequence[str], fields: Optional[Sequence[str]] = None, case: bool = True) -> np.ndarray:
+        """모든 검색어를 포함하는 행 위치 (검색어별 결과 교집합)"""
+        result: Optional[np.ndarray] = None
+        for term in terms:
+            positions = self.contains(term, fields, case=case)
+            result = positions if result is None else np.intersect1d(result, positions, assume_unique=True)
+            if not len(result):
+                break
+        return _EMPTY if result is None else result
+
+    def _rank(self, positions: np.ndarray, query: str, fields: Sequence[str]) -> np.ndarray:
+        """완전 일치(0) > 접두 일치(1) > 어절 시작 일치(2) > 포함(3), 같은 점수는 원본 순서"""
+        needle = query.lower()
+
+        def score(pos: int) -> int:
+            best = 3
+            for field in fields:
+                text = self._lowered[field][pos]
+                if text == needle:
+                    return 0
+                if text.startswith(needle):
+                    best = min(best, 1)
+                elif (" " + needle) in text:
+                    best = min(best, 2)
+            return best
+
+        return np.asarray(sorted(positions.tolist(), key=lambda pos: (score(pos), pos)), dtype=np.int64)
+
+    def search(
+        self,
+        query: str,
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        rank: bool = False,
+        case: bool = True,
+    ) -> np.ndarray:
+        """contains + (선택) 접두 일치 우선 정렬 + limit"""
+        fields = [f for f in (fields or self.fields) if f in self._postings]
+        positions = self.contains(query, fields, case=case)
+        if rank and query:
+            positions = self._rank(positions, query, fields)
+        return positions if limit is None else positions[:limit]
@@ -0,0 +1,232 @@
+"""
+지도용 벡터 타일(MVT) 서비스
+- stations: 메모리 StationTable 에서 타일 범위 주유소만 골라 point 레이어 인코딩
+- parcels: PostGIS ST_AsMVT (공용 커넥션 풀, PREPARE 재사용)
+- {tile_dir}/{layer}/{version}/{z}/{x}/{y}.pbf 디스크 캐시 (데이터가 있는 타일만)
+  → 데이터 버전이 바뀌면 경로가 달라져 자동으로 새로 생성
+  → 빈 타일은 저장하지 않음 (임의 z/x/y 요청으로 파일이 무한히 늘지 않게,
+    stations 는 메모리 범위 검사만으로 디스크 접근 없이 빈 타일 판정)
+"""
+
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import BASE_DIR
+from app.db.postgis import PostGISPool, get_postgis_pool
+from app.services.mvt_encoder import DEFAULT_EXTENT, PointLayerEncoder
+from app.services.station_index import make_station_id
+from app.services.station_table import StationTable
+from app.services.terrain_utils import lonlat_to_webmerc, tile_to_lonlat_bounds, webmerc_to_global_px
+
+
+VECTOR_TILE_DIR = BASE_DIR / "generated_tiles"
+
+# 레이어별 zoom 범위 (범위 밖은 빈 타일)
+LAYER_ZOOMS = {
+    "stations": (5, 20),
+    "parcels": (14, 20),
+}
+
+# 주유소 point 속성 (GeoJSON / map API 와 같은 컬럼명 사용)
+STATION_TILE_COLUMNS = ("상호", "상태", "주소", "년도", "recommend1")
+
+# 타일 경계 밖 여유 (extent 기준 픽셀, 경계에 걸친 마커 잘림 방지)
+TILE_BUFFER = 64
+
+PARCELS_MVT_SQL = """
+    WITH bounds AS (
+        SELECT ST_TileEnvelope($1, $2, $3) AS geom
+    ),
+    mvtgeom AS (
+        SELECT
+            ST_AsMVTGeom(
+                ST_Transform(ST_SetSRID(p.geom, 5186), 3857),
+                bounds.geom,
+                4096,
+                64,
+                true
+            ) AS geom,
+            p.pnu,
+            p.jibun,
+            p.zoning_name,
+            p.zoning_lclass
+        FROM parcels p, bounds
+        WHERE ST_SetSRID(p.geom, 5186) && ST_Transform(bounds.geom, 5186)
+    )
+    SELECT ST_AsMVT(mvtgeom.*, 'parcels', 4096, 'geom') FROM mvtgeom
+"""
+
+
+def validate_tile(layer: str, z: int, x: int, y: int) -> None:
+    """ValueError: 알 수 없는 레이어 / 잘못된 타일 좌표"""
+    if layer not in LAYER_ZOOMS:
+        raise ValueError(f"알 수 없는 레이어: {layer}")
+    if not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        raise ValueError(f"잘못된 타일 좌표: {z}/{x}/{y}")
+
+
+class VectorTileService:
+    """레이어별 MVT 생성 + 디스크 캐시"""
+
+    def __init__(
+        self,
+        tile_dir: Path = VECTOR_TILE_DIR,
+        pool: Optional[PostGISPool] = None,
+        parcel_data_version: Optional[str] = None,
+    ) -> None:
+        self.tile_dir = Path(tile_dir)
+        self._pool = pool
+        self.parcel_data_version = parcel_data_version or os.getenv("PARCEL_DATA_VERSION", "1")
+        # StationTable 객체별 (버전, 위도, 경도) — 스냅샷이 바뀌면 새로 계산
+        self._station_cache: Dict[int, Tuple[str, np.ndarray, np.ndarray]] = {}
+
+    @property
+    def pool(self) -> PostGISPool:
+        if self._pool is None:
+            self._pool = get_postgis_pool()
+        return self._pool
+
+    # ------------------------------------------------------------------
+    # 디스크 캐시
+    # ------------------------------------------------------------------
+    def tile_path(self, layer: str, version: str, z: int, x: int, y: int) -> Path:
+        return self.tile_dir / layer / version / str(z) / str(x) / f"{y}.pbf"
+
+    def _read(self, path: Path) -> Optional[bytes]:
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, path: Path, content: bytes) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[VECTOR TILE] 캐시 저장 실패 {path}: {e}")
+
+    # ------------------------------------------------------------------
+    # stations
+    # ------------------------------------------------------------------
+    def _station_arrays(self, stations: StationTable) -> Tuple[str, np.ndarray, np.ndarray]:
+        cached = self._station_cache.get(id(stations))
+        if cached is None:
+            lats = np.asarray(stations.column("위도"), dtype=float)
+            lngs = np.asarray(stations.column("경도"), dtype=float)
+            digest = hashlib.sha1(lats.tobytes() + lngs.tobytes()).hexdigest()[:12]
+            cached = (digest, lats, lngs)
+            self._station_cache = {id(stations): cached}
+        return cached
+
+    def station_version(self, stations: StationTable) -> str:
+        return self._station_arrays(stations)[0]
+
+    def station_positions(self, stations: StationTable, z: int, x: int, y: int) -> np.ndarray:
+        """타일 bbox(+여유) 안 주유소 행 위치"""
+        _, lats, lngs = self._station_arrays(stations)
+
+        min_lon, min_lat, max_lon, max_lat = tile_to_lonlat_bounds(x, y, z)
+        pad_lon = (max_lon - min_lon) * TILE_BUFFER / DEFAULT_EXTENT
+        pad_lat = (max_lat - min_lat) * TILE_BUFFER / DEFAULT_EXTENT
+        return np.flatnonzero(
+            (lngs >= min_lon - pad_lon) & (lngs <= max_lon + pad_lon)
+            & (lats >= min_lat - pad_lat) & (lats <= max_lat + pad_lat)
+        )
+
+    def encode_station_tile(
+        self, stations: StationTable, z: int, x: int, y: int, positions: Optional[np.ndarray] = None
+    ) -> bytes:
+        """타일 bbox(+여유) 안 주유소 → point 레이어"""
+        _, lats, lngs = self._station_arrays(stations)
+        extent = DEFAULT_EXTENT
+        if positions is None:
+            positions = self.station_positions(stations, z, x, y)
+
+        encoder = PointLayerEncoder("stations", extent=extent)
+        columns = [col for col in STATION_TILE_COLUMNS if col in stations]
+        for pos in positions:
+            lat, lng = float(lats[pos]), float(lngs[pos])
+            # 전역 픽셀(tile_size=extent) → 타일 로컬 좌표
+            gx, gy = webmerc_to_global_px(*lonlat_to_webmerc(lng, lat), z, extent)
+            properties: Dict[str, Any] = {"id": make_station_id(lat, lng)}
+            for col in columns:
+                value = stations.column(col)[pos]
+                properties[col] = value.item() if isinstance(value, np.generic) else value
+            encoder.add_point(int(gx - x * extent), int(gy - y * extent), properties, feature_id=int(pos))
+
+        return encoder.encode()
+
+    # ------------------------------------------------------------------
+    # parcels
+    # ------------------------------------------------------------------
+    def encode_parcel_tile(self, z: int, x: int, y: int) -> bytes:
+        rows = self.pool.fetch_prepared(
+            "vector_tile_parcels",
+            PARCELS_MVT_SQL,
+            ("int4", "int4", "int4"),
+            (z, x, y),
+        )
+        if not rows or rows[0][0] is None:
+            return b""
+        return bytes(rows[0][0])
+
+    # ------------------------------------------------------------------
+    # 진입점
+    # ------------------------------------------------------------------
+    def get_tile(self, layer: str, z: int, x: int, y: int, stations: Optional[StationTable] = None) -> bytes:
+        """
+        레이어 타일 bytes (빈 타일은 b'')
+        - 캐시 hit → 파일 그대로, miss → 인코딩 후 저장 (빈 타일은 저장하지 않음)
+        - ValueError: 알 수 없는 레이어 / 잘못된 타일 좌표
+        """
+        validate_tile(layer, z, x, y)
+
+        min_zoom, max_zoom = LAYER_ZOOMS[layer]
+        if not (min_zoom <= z <= max_zoom):
+            return b""
+
+        positions = None
+        if layer == "stations":
+            if stations is None or len(stations) == 0:
+                return b""
+            positions = self.station_positions(stations, z, x, y)
+            if not len(positions):
+                return b""
+            version = self.station_version(stations)
+        else:
+            version = self.parcel_data_version
+
+        path = self.tile_path(layer, version, z, x, y)
+        cached = self._read(path)
+        if cached is not None:
+            return cached
+
+        if layer == "stations":
+            content = self.encode_station_tile(stations, z, x, y, positions)
+        else:
+            content = self.encode_parcel_tile(z, x, y)
+
+        if content:
+            self._write(path, content)
+        return content
+
+
+_vector_tile_service_instance: Optional[VectorTileService] = None
+
+
+def get_vector_tile_service() -> VectorTileService:
+    """VectorTileService 싱글톤"""
+
+    global _vector_tile_service_instance
+
+    if _vector_tile_service_instance is None:
+        _vector_tile_service_instance = VectorTileService()
+
+    return _vector_tile_service_instance
@@ -1,5 +1,10 @@
 # app/utils/address_utils.py
 
+from typing import Any, Optional
+
+import pandas as pd
+
+
 def extract_sidocode(adm_cd2: str | int) -> str:
     """
     adm_cd2 (법정동 코드 10자리)에서 시도코드 2자리 추출
@@ -8,3 +13,30 @@ def extract_sidocode(adm_cd2: str | int) -> str:
     if len(adm_cd2) < 2:
         return None
     return adm_cd2[:2]
+
+
+def normalize_adm_code(value: Any) -> Optional[str]:
+    """
+    adm_cd2 / 법정동코드 → 10자리 문자열
+    - float 형태 ".0" 제거, 숫자만 남김, 8자리는 "00" 보정, 부족하면 0 패딩
+    """
+    if value is None:
+        return None
+
+    s = str(value).strip()
+    if s.endswith(".0"):
+        s = s[:-2]
+    s = "".join(ch for ch in s if ch.isdigit())
+    return s.ljust(10, "0")[:10]
+
+
+def normalize_adm_code_series(series: pd.Series) -> pd.Series:
+    """normalize_adm_code의 벡터화 버전 (행 단위 apply 없이 str 연산만 사용)"""
+    return (
+        series.astype(str)
+        .str.strip()
+        .str.replace(r"\.0$", "", regex=True)
+        .str.replace(r"\D", "", regex=True)
+        .str.ljust(10, "0")
+        .str[:10]
+    )
@@ -9,6 +9,9 @@ import re
 import os
 from typing import Dict, List, Tuple, Optional, Union, Any
 from app.core.config import get_settings, DATA_DIR
+from app.services.adm_code_registry import BJD_PATH, get_adm_code_registry
+from app.services.admin_boundary import get_admin_boundary_index
+from app.utils.address_utils import normalize_adm_code_series
 settings = get_settings()
 
 def load_gas_station_data() -> pd.DataFrame:
@@ -65,47 +68,22 @@ def load_gas_station_data() -> pd.DataFrame:
         df = df[df["업종"] == "주유소"].copy()
 
         # -----------------------------
-        # 4) 법정동 코드 10자리 정규화 함수
+        # 4) 법정동 코드 10자리 정규화 (벡터화)
         # -----------------------------
-        def normalize_code(code):
-            if code is None:
-                return None
-
-            s = str(code).strip()
-
-            if s.endswith(".0"):
-                s = s[:-2]
-
-            s = "".join(c for c in s if c.isdigit())
-
-            if len(s) == 8:
-                s = s + "00"
-
-            if len(s) < 10:
-                s = s.ljust(10, "0")
-
-            return s[:10]
-
-        # 법정동코드 정규화
         if "법정동코드" in df.columns:
-            df["법정동코드"] = df["법정동코드"].apply(normalize_code)
+            df["법정동코드"] = normalize_adm_code_series(df["법정동코드"])
         else:
             df["법정동코드"] = None
 
+        # 코드가 없는 행은 행정동 경계(point-in-polygon)로 보완
+        df = fill_missing_adm_codes(df)
+
         # -----------------------------
-        # 5) 법정동 전체 코드 로드 + 조인
+        # 5) 법정동 코드 레지스트리로 법정동명 매핑
         # -----------------------------
-        bjd_path = DATA_DIR / "법정동_코드_전체자료.csv"
-        if bjd_path.exists():
+        if BJD_PATH.exists():
             try:
-                df_bjd = pd.read_csv(bjd_path, dtype=str)
-                df_bjd["법정동코드"] = df_bjd["법정동코드"].apply(normalize_code)
-
-                df = df.merge(
-                    df_bjd[["법정동코드", "법정동명"]],
-                    how="left",
-                    on="법정동코드",
-                )
+                df["법정동명"] = get_adm_code_registry().names_of(df["법정동코드"])
 
                 # 이미 행정구역이 있으면 덮어쓰지 않음
                 if "행정구역" not in df.columns:
@@ -135,6 +113,30 @@ def load_gas_station_data() -> pd.DataFrame:
         raise
 
 
+def fill_missing_adm_codes(df: pd.DataFrame) -> pd.DataFrame:
+    """법정동코드 결측 / 형식 오류 행 → 위도·경도로 행정동 경계 조회 후 채움"""
+    if "위도" not in df.columns or "경도" not in df.columns:
+        return df
+
+    codes = df["법정동코드"].fillna("").astype(str)
+    missing = ~codes.str.fullmatch(r"\d{10}") | (codes == "0000000000")
+    if not missing.any():
+        return df
+
+    try:
+        filled = get_admin_boundary_index().codes_at(
+            df.loc[missing, "경도"].to_numpy(),
+            df.loc[missing, "위도"].to_numpy(),
+        )
+        df = df.copy()
+        df.loc[missing, "법정동코드"] = filled
+        print(f"📍 행정동 경계로 법정동코드 보완: {sum(code is not None for code in filled)}/{int(missing.sum())}개 행")
+    except Exception as e:
+        print(f"⚠️ 행정동 경계 기반 코드 보완 실패: {e}")
+
+    return df
+
+
 def load_population_data() -> pd.DataFrame:
     """인구수 데이터 로드"""
     try:
@@ -0,0 +1,42 @@
+"""
+만료 시간(TTL) + 최대 크기(LRU)를 갖는 메모리 캐시
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """단일 이벤트 루프/프로세스 내에서 공유하는 간단한 TTL + LRU 캐시"""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._store: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        item = self._store.get(key)
+        if item is None:
+            return default
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._store[key]
+            return default
+
+        self._store.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._store[key] = (time.monotonic() + self.ttl, value)
+        self._store.move_to_end(key)
+
+        while len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        self._store.clear()
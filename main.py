@@ -3,9 +3,15 @@
 메인 애플리케이션 진입점
 """
 
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.endpoints import stations, usage_types, ml_recommend
+from fastapi.responses import JSONResponse
+from app.api.endpoints import stations, usage_types, ml_recommend, recommend, tiles
+from app.api.dependencies import close_shared_clients
+from app.db.postgis import close_postgis_pools, postgis_status
+from app.services.land_registry import get_land_registry
 from app.core.config import get_settings
 
 from dotenv import load_dotenv
@@ -26,6 +32,33 @@ app = FastAPI(
 app.include_router(stations.router)
 app.include_router(usage_types.router)
 app.include_router(ml_recommend.router)
+app.include_router(recommend.router)
+app.include_router(tiles.router)
+
+
+# 시작 시 PNU 필지 레지스트리 1회 적재 (요청 시 CSV 재로딩 방지)
+@app.on_event("startup")
+async def warm_up_registries():
+    get_land_registry()
+
+
+# 종료 시 공유 HTTP / PostGIS 커넥션 풀 정리
+@app.on_event("shutdown")
+async def shutdown_shared_clients():
+    await close_shared_clients()
+    close_postgis_pools()
+
+
+# PostGIS 커넥션 풀 헬스 체크 + 포화 지표
+@app.get("/health/db")
+async def health_db():
+    status = await asyncio.to_thread(postgis_status)
+    # DSN 미설정(풀 없음)도 비정상으로 간주
+    ok = bool(status) and all(pool["health"]["ok"] for pool in status.values())
+    return JSONResponse(
+        status_code=200 if ok else 503,
+        content={"ok": ok, "pools": status},
+    )
 
 
 """
@@ -60,7 +93,9 @@ def read_root():
             "api/stations/search": "주소 기반 검색",
             "api/stations/{id}": "개별 주유소 상세 정보",
             "api/stations/cases": "활용 사례 카드",
+            "api/recommend": "주소 / 좌표 기반 추천 (POST)",
             "api/ml-recommend": "ML 기반 추천 시스템",
+            "tiles/{layer}/{z}/{x}/{y}.pbf": "벡터 타일 (stations / parcels)",
         },
     }
 
@@ -0,0 +1,76 @@
+"""
+Hillshade 타일 사전 수집 스크립트
+- station.csv 전체 주유소 좌표 기준 terrain bbox(±500m)를 덮는 XYZ 타일을 미리 받아 둠
+- 이미 캐시에 있는 타일은 건너뜀 → 중단 후 재실행하면 이어서 수집
+- 이후 /{id}/terrain 렌더는 네트워크 없이 로컬 타일 mosaic만 사용
+
+사용 예)
+    python scripts/prefetch_hillshade_tiles.py
+    python scripts/prefetch_hillshade_tiles.py --zoom 16 --workers 8 --meter 500
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.config import get_settings
+from app.services.hillshade_tiles import DEFAULT_TILE_ZOOM, HILLSHADE_TILE_DIR, HillshadeTileCache, collect_tiles
+
+
+def load_station_points(path: str):
+    """station.csv → (lon, lat) 목록 (좌표 없는 행 제외)"""
+    df = pd.read_csv(path, low_memory=False)
+    df = df.loc[:, ~df.columns.duplicated()]
+    lats = pd.to_numeric(df["위도"], errors="coerce")
+    lngs = pd.to_numeric(df["경도"], errors="coerce")
+    valid = lats.notna() & lngs.notna()
+    return list(zip(lngs[valid].tolist(), lats[valid].tolist()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hillshade 타일 사전 수집")
+    parser.add_argument("--station-file", default=get_settings().GAS_STATION_FILE)
+    parser.add_argument("--tile-dir", default=str(HILLSHADE_TILE_DIR))
+    parser.add_argument("--zoom", type=int, default=DEFAULT_TILE_ZOOM)
+    parser.add_argument("--meter", type=int, default=500, help="주유소 중심 bbox 반경(m)")
+    parser.add_argument("--workers", type=int, default=4, help="동시 다운로드 수")
+    parser.add_argument("--batch", type=int, default=200, help="진행 상황 출력 단위(타일 수)")
+    args = parser.parse_args()
+
+    cache = HillshadeTileCache(
+        tile_dir=Path(args.tile_dir),
+        zoom=args.zoom,
+        max_workers=args.workers,
+        offline=False,
+    )
+
+    print("📂 station.csv 로드")
+    points = load_station_points(args.station_file)
+    tiles = sorted(collect_tiles(cache, points, meter=args.meter))
+    missing = [tile for tile in tiles if not cache.has_tile(tile)]
+    print(f"🧭 주유소 {len(points)}개 → 타일 {len(tiles)}개 (캐시 없음 {len(missing)}개)")
+
+    started = time.perf_counter()
+    fetched = failed = 0
+    for i in range(0, len(missing), args.batch):
+        ok, ng = cache.ensure_tiles(missing[i:i + args.batch])
+        fetched += ok
+        failed += ng
+        elapsed = time.perf_counter() - started
+        done = min(i + args.batch, len(missing))
+        print(f"✅ 진행중... {done}/{len(missing)} (실패 {failed}, {done / elapsed:.1f} 타일/초)")
+
+    elapsed = time.perf_counter() - started
+    print("🎉 Hillshade 타일 수집 완료")
+    print(f"   받은 타일 {fetched}개 / 실패 {failed}개 / 기존 캐시 {len(tiles) - len(missing)}개 / {elapsed:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+주유소 입지 분석 보고서 일괄 사전 생성 스크립트
+- /{id}/report 와 동일한 StationReportPipeline(generate_report + build_report_html) 사용
+- 결과는 보고서 캐시에 저장 (선택: --output-dir 에 HTML 파일도 저장)
+- LLM 동시 호출 수 제한 + 초당 요청 수 제한 + 실패 시 지수 백오프 재시도
+- 체크포인트 파일로 중단 후 이어서 실행
+
+사용 예)
+    python scripts/pregenerate_reports.py --region 광주광역시 --concurrency 4 --rate 1
+    python scripts/pregenerate_reports.py --region 29 --limit 100
+    python scripts/pregenerate_reports.py            # 전체 주유소
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.api.dependencies import close_shared_clients, get_geo_service, get_report_service
+from app.services.geo_service import GeoService
+from app.services.report_cache import REPORT_CACHE_DIR
+from app.services.report_pipeline import StationReportPipeline
+from app.services.station_index import make_station_id, parse_station_id
+from app.utils.address_utils import normalize_adm_code
+
+
+DEFAULT_CHECKPOINT = REPORT_CACHE_DIR / "pregenerate_checkpoint.json"
+
+
+# ============================================================
+# 대상 주유소 선택
+# ============================================================
+
+def select_station_ids(service: GeoService, region: Optional[str]) -> List[str]:
+    """
+    보고서 대상 좌표 ID 목록 (중복 좌표는 1회만)
+    - region 미지정: 전체
+    - 지역 트리 코드 / 이름: /region/{code} 와 같은 노드 (예: 29 → 광주광역시)
+    - 트리 노드가 아닌 숫자: 법정동코드 앞자리 일치 (로더가 adm_cd2 를 법정동코드로 정규화)
+    - 그 외: 주소 기반 지역 검색
+    - 대상이 없으면 ValueError (잘못된 --region 이 조용히 0건 실행되지 않게)
+    """
+    stations = service.stations
+    if stations is None:
+        raise RuntimeError("station.csv 로드 실패")
+
+    positions = service.find_region_positions(region) if region else None
+    if positions is not None:
+        rows = stations.records(positions)
+    elif region and region.isdigit():
+        codes = stations.column("법정동코드") if "법정동코드" in stations else []
+        positions = [
+            pos for pos, code in enumerate(codes)
+            if (normalize_adm_code(code) or "").startswith(region)
+        ]
+        rows = stations.records(positions)
+    elif region:
+        rows = service.search_by_address(region, limit=len(stations))
+    else:
+        rows = stations.records(range(len(stations)))
+
+    ids: Dict[str, None] = {}
+    for row in rows:
+        try:
+            ids.setdefault(make_station_id(float(row["위도"]), float(row["경도"])), None)
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    if not ids:
+        raise ValueError(f"대상 주유소가 없습니다 (--region {region!r})")
+    return list(ids)
+
+
+# ============================================================
+# 체크포인트
+# ============================================================
+
+class Checkpoint:
+    """완료/실패 station ID 기록 (원자적 저장)"""
+
+    def __init__(self, path: Path, resume: bool = True):
+        self.path = path
+        self.done: Dict[str, str] = {}
+        self.failed: Dict[str, str] = {}
+        if resume and path.exists():
+            with path.open("r", encoding="utf-8") as fp:
+                data = json.load(fp)
+            self.done = data.get("done", {})
+            self.failed = data.get("failed", {})
+
+    def mark_done(self, station_id: str, status: str) -> None:
+        self.done[station_id] = status
+        self.failed.pop(station_id, None)
+
+    def mark_failed(self, station_id: str, error: str) -> None:
+        self.failed[station_id] = error
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            json.dump({"done": self.done, "failed": self.failed}, fp, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+# ============================================================
+# 속도 제한
+# ============================================================
+
+class RateLimiter:
+    """초당 rate 회 이하로 시작 시점을 분산"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if self.interval <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# ============================================================
+# 실행
+# ============================================================
+
+async def generate_one(
+    station_id: str,
+    service: GeoService,
+    pipeline: StationReportPipeline,
+    limiter: RateLimiter,
+    args: argparse.Namespace,
+) -> Tuple[str, float]:
+    """보고서 1건 생성 (재시도 포함) → (캐시 상태, 소요 시간 ms)"""
+    lat, lng = parse_station_id(station_id)
+    station = service.find_station_by_coord_id(station_id)
+    if station is None:
+        raise RuntimeError("station 없음")
+
+    last_error = "unknown"
+    for attempt in range(args.retries + 1):
+        await limiter.wait()
+        started = time.perf_counter()
+        try:
+            report = await pipeline.build(station_id, station, lat, lng, refresh=args.refresh)
+        except Exception as e:
+            report, last_error = None, str(e)
+        else:
+            if not report.degraded:
+                if args.output_dir:
+                    out_path = Path(args.output_dir) / f"{station_id}.html"
+                    out_path.write_text(report.html, encoding="utf-8")
+                return report.cache_status, (time.perf_counter() - started) * 1000
+            last_error = "LLM 폴백 또는 단계 타임아웃"
+
+        if attempt < args.retries:
+            # 지수 백오프 + 지터
+            delay = args.backoff * (2 ** attempt) * (0.5 + random.random())
+            print(f"🔁 {station_id} 재시도 {attempt + 1}/{args.retries} ({delay:.1f}s 후): {last_error}")
+            await asyncio.sleep(delay)
+
+    raise RuntimeError(last_error)
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    service = get_geo_service()
+    report_service = get_report_service()
+    pipeline = StationReportPipeline(report_service)
+
+    checkpoint = Checkpoint(Path(args.checkpoint), resume=not args.no_resume)
+    station_ids = select_station_ids(service, args.region)
+    pending = [sid for sid in station_ids if sid not in checkpoint.done]
+    already_done = len(station_ids) - len(pending)
+    if args.limit:
+        pending = pending[: args.limit]
+
+    print(
+        f"🚀 보고서 사전 생성: 대상 {len(station_ids)}개 / 체크포인트 완료 {already_done}개 / "
+        f"이번 실행 {len(pending)}개 (동시 {args.concurrency}, 초당 {args.rate})"
+    )
+
+    if args.output_dir:
+        Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    limiter = RateLimiter(args.rate)
+    counts: Dict[str, int] = {"generated": 0, "cached": 0, "failed": 0}
+    latencies: List[float] = []
+    started = time.perf_counter()
+    completed = 0
+
+    async def worker(station_id: str) -> None:
+        nonlocal completed
+        async with semaphore:
+            try:
+                status, elapsed_ms = await generate_one(station_id, service, pipeline, limiter, args)
+            except Exception as e:
+                checkpoint.mark_failed(station_id, str(e))
+                counts["failed"] += 1
+                print(f"❌ {station_id} 실패: {e}")
+            else:
+                checkpoint.mark_done(station_id, status)
+                counts["cached" if status == "hit" else "generated"] += 1
+                latencies.append(elapsed_ms)
+
+            completed += 1
+            if completed % args.checkpoint_every == 0:
+                checkpoint.save()
+                elapsed = time.perf_counter() - started
+                print(f"✅ 진행중... {completed}/{len(pending)} ({completed / elapsed * 60:.1f}건/분)")
+
+    try:
+        await asyncio.gather(*(worker(sid) for sid in pending))
+    finally:
+        checkpoint.save()
+        await close_shared_clients()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "total": len(pending),
+        **counts,
+        "elapsed_sec": round(elapsed, 1),
+        "per_minute": round(completed / elapsed * 60, 2) if elapsed > 0 else 0.0,
+        "latency_p50_ms": round(_percentile(latencies, 0.5), 1),
+        "latency_p95_ms": round(_percentile(latencies, 0.95), 1),
+        "cache": report_service.report_cache_stats(),
+        "llm": report_service.llm_metrics()["routes"],
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="주유소 보고서 일괄 사전 생성")
+    parser.add_argument("--region", help="지역명(주소 검색) 또는 adm_cd2 앞자리 코드. 미지정 시 전체")
+    parser.add_argument("--limit", type=int, default=0, help="이번 실행에서 생성할 최대 개수 (0=제한 없음)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 보고서 생성 수 (LLM 동시 호출 수)")
+    parser.add_argument("--rate", type=float, default=1.0, help="초당 보고서 생성 시작 수 (0=제한 없음)")
+    parser.add_argument("--retries", type=int, default=3, help="실패 시 재시도 횟수")
+    parser.add_argument("--backoff", type=float, default=2.0, help="재시도 기본 대기(초), 시도마다 2배")
+    parser.add_argument("--refresh", action="store_true", help="캐시를 무시하고 다시 생성")
+    parser.add_argument("--output-dir", help="HTML 파일도 저장할 디렉터리 (선택)")
+    parser.add_argument("--checkpoint", default=str(DEFAULT_CHECKPOINT), help="체크포인트 파일 경로")
+    parser.add_argument("--checkpoint-every", type=int, default=10, help="N건마다 체크포인트 저장")
+    parser.add_argument("--no-resume", action="store_true", help="체크포인트 무시하고 처음부터")
+    args = parser.parse_args(argv)
+    args.concurrency = max(1, args.concurrency)
+    args.checkpoint_every = max(1, args.checkpoint_every)
+    return args
+
+
+def main():
+    args = parse_args()
+    try:
+        summary = asyncio.run(run(args))
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print("🎉 보고서 사전 생성 완료")
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+PointLayerEncoder 출력 검증 (외부 protobuf 없이 최소 디코더로 round-trip)
+"""
+
+import struct
+from typing import Any, Dict, List, Tuple
+
+from app.services.mvt_encoder import DEFAULT_EXTENT, GEOM_POINT, PointLayerEncoder
+
+
+def _read_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    result, shift = 0, 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _fields(buf: bytes) -> List[Tuple[int, Any]]:
+    """protobuf 메시지 → (필드 번호, 값) 목록 (varint / fixed64 / bytes 만)"""
+    out, pos = [], 0
+    while pos < len(buf):
+        key, pos = _read_varint(buf, pos)
+        field, wire_type = key >> 3, key & 0x7
+        if wire_type == 0:
+            value, pos = _read_varint(buf, pos)
+        elif wire_type == 1:
+            value, pos = buf[pos:pos + 8], pos + 8
+        elif wire_type == 2:
+            length, pos = _read_varint(buf, pos)
+            value, pos = buf[pos:pos + length], pos + length
+        else:
+            raise AssertionError(f"unexpected wire type {wire_type}")
+        out.append((field, value))
+    return out
+
+
+def _packed(buf: bytes) -> List[int]:
+    values, pos = [], 0
+    while pos < len(buf):
+        value, pos = _read_varint(buf, pos)
+        values.append(value)
+    return values
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def _decode_value(buf: bytes) -> Any:
+    (field, value), = _fields(buf)
+    if field == 1:
+        return value.decode("utf-8")
+    if field == 3:
+        return struct.unpack("<d", value)[0]
+    if field == 5:
+        return value
+    if field == 6:
+        return _unzigzag(value)
+    if field == 7:
+        return bool(value)
+    raise AssertionError(f"unexpected value field {field}")
+
+
+def _decode_tile(tile: bytes) -> Dict[str, Any]:
+    (field, layer_buf), = _fields(tile)
+    assert field == 3  # Tile.layers
+
+    layer: Dict[str, Any] = {"features": [], "keys": [], "values": []}
+    raw_features = []
+    for field, value in _fields(layer_buf):
+        if field == 15:
+            layer["version"] = value
+        elif field == 1:
+            layer["name"] = value.decode("utf-8")
+        elif field == 2:
+            raw_features.append(value)
+        elif field == 3:
+            layer["keys"].append(value.decode("utf-8"))
+        elif field == 4:
+            layer["values"].append(_decode_value(value))
+        elif field == 5:
+            layer["extent"] = value
+
+    for raw in raw_features:
+        feature: Dict[str, Any] = {"id": None, "properties": {}}
+        for field, value in _fields(raw):
+            if field == 1:
+                feature["id"] = value
+            elif field == 2:
+                tags = _packed(value)
+                feature["properties"] = {
+                    layer["keys"][k]: layer["values"][v] for k, v in zip(tags[::2], tags[1::2])
+                }
+            elif field == 3:
+                feature["type"] = value
+            elif field == 4:
+                command, x, y = _packed(value)
+                feature["command"] = command
+                feature["point"] = (_unzigzag(x), _unzigzag(y))
+        layer["features"].append(feature)
+    return layer
+
+
+def test_round_trip():
+    encoder = PointLayerEncoder("stations")
+    encoder.add_point(10, 4095, {"상호": "행복주유소", "년도": 2021, "score": 0.5, "open": False}, feature_id=7)
+    encoder.add_point(-64, 4160, {"상호": "행복주유소", "delta": -3, "empty": None, "nan": float("nan")})
+    layer = _decode_tile(encoder.encode())
+
+    assert layer["name"] == "stations"
+    assert layer["version"] == 2
+    assert layer["extent"] == DEFAULT_EXTENT
+    # 같은 key / value 는 레이어 안에서 1회만
+    assert layer["keys"].count("상호") == 1
+    assert layer["values"].count("행복주유소") == 1
+
+    first, second = layer["features"]
+    assert first["id"] == 7
+    assert first["type"] == GEOM_POINT
+    assert first["command"] == (1 | (1 << 3))  # MoveTo x1
+    assert first["point"] == (10, 4095)
+    assert first["properties"] == {"상호": "행복주유소", "년도": 2021, "score": 0.5, "open": False}
+
+    assert second["id"] is None
+    # 타일 버퍼 영역의 음수 / extent 초과 좌표
+    assert second["point"] == (-64, 4160)
+    # None / NaN 속성은 생략
+    assert second["properties"] == {"상호": "행복주유소", "delta": -3}
+
+
+def test_bool_and_int_values_are_distinct():
+    encoder = PointLayerEncoder("s")
+    encoder.add_point(0, 0, {"a": True, "b": 1})
+    layer = _decode_tile(encoder.encode())
+    assert layer["features"][0]["properties"] == {"a": True, "b": 1}
+    assert type(layer["features"][0]["properties"]["a"]) is bool
+
+
+def test_byte_output_is_stable():
+    encoder = PointLayerEncoder("s")
+    encoder.add_point(1, 2, {})
+    expected = bytes.fromhex(
+        "1a11"            # Tile.layers (17 bytes)
+        "7802"            # version = 2
+        "0a0173"          # name = "s"
+        "1207"            # feature (7 bytes)
+        "1801"            #   type = POINT
+        "2203090204"      #   geometry = MoveTo(1), zigzag(1), zigzag(2)
+        "288020"          # extent = 4096
+    )
+    assert encoder.encode() == expected
+
+
+def test_empty_layer_encodes_to_empty_bytes():
+    assert PointLayerEncoder("stations").encode() == b""
@@ -0,0 +1,94 @@
+"""
+RegionTree 이름 / 코드 해석 검증 (합성 코드 레지스트리)
+"""
+
+import numpy as np
+import pytest
+
+from app.services.region_index import RegionTree
+
+
+NAMES = {
+    "1100000000": "서울특별시",
+    "1111000000": "서울특별시 종로구",
+    "1111051500": "서울특별시 종로구 청운효자동",
+    "2600000000": "부산광역시",
+    "2632000000": "부산광역시 북구",
+    "2632010100": "부산광역시 북구 구포동",
+    "2900000000": "광주광역시",
+    "2917000000": "광주광역시 북구",
+    "2917010100": "광주광역시 북구 중흥동",
+    "4100000000": "경기도",
+    "4117000000": "경기도 안양시",
+    "4117100000": "경기도 안양시 만안구",
+    "4117110100": "경기도 안양시 만안구 안양동",
+    "4117300000": "경기도 안양시 동안구",
+    "4117310100": "경기도 안양시 동안구 비산동",
+}
+
+# 행 위치 = 인덱스 (결측 / 형식 오류 행 포함)
+CODES = [
+    "1111051500",   # 0 종로구
+    "2632010100",   # 1 부산 북구
+    "2917010100",   # 2 광주 북구
+    None,           # 3
+    "4117110100",   # 4 만안구
+    "4117310100",   # 5 동안구
+    "2917010100",   # 6 광주 북구
+    "41173",        # 7 형식 오류
+    "4117310100",   # 8 동안구
+]
+
+
+@pytest.fixture(scope="module")
+def tree() -> RegionTree:
+    return RegionTree(CODES, NAMES.get)
+
+
+def _codes(nodes):
+    return sorted(node.code for node in nodes)
+
+
+def test_same_name_resolves_to_all_regions(tree):
+    # 동명 시군구 → 부산 북구 + 광주 북구
+    nodes = tree.resolve("북구")
+    assert _codes(nodes) == ["26320", "29170"]
+    assert all(node.level == "sigungu" for node in nodes)
+    np.testing.assert_array_equal(tree.positions("북구"), [1, 2, 6])
+
+
+def test_qualified_name_with_short_sido(tree):
+    # 첫 어절은 normalize_region (광주 → 광주광역시)
+    assert _codes(tree.resolve("광주 북구")) == ["29170"]
+    np.testing.assert_array_equal(tree.positions("광주광역시 북구"), [2, 6])
+
+
+def test_padded_code_resolves_to_city_node(tree):
+    # 4117000000 → 구를 둔 시(안양시) 노드, 하위 구 행 모두
+    node, = tree.resolve("4117000000")
+    assert node.level == "city"
+    assert node.name == "경기도 안양시"
+    assert sorted(node.children) == ["41171", "41173"]
+    np.testing.assert_array_equal(tree.positions("4117000000"), [4, 5, 8])
+    assert _codes(tree.resolve("안양시")) == ["4117"]
+
+
+def test_codes_at_each_level(tree):
+    assert tree.resolve("41")[0].level == "sido"
+    assert tree.resolve("4117300000")[0].level == "sigungu"
+    assert tree.resolve("4117310100")[0].level == "emd"
+    np.testing.assert_array_equal(tree.positions("4117300000"), [5, 8])
+
+
+def test_sigungu_without_gu_has_no_city_node(tree):
+    # 종로구(1111) 는 5번째 자리가 0 → 4자리 시 노드 없음
+    assert "1111" not in tree
+    node, = tree.resolve("1111000000")
+    assert node.level == "sigungu"
+
+
+def test_unknown_queries(tree):
+    assert tree.resolve("") == []
+    assert tree.resolve("없는구") == []
+    assert tree.resolve("9900000000") == []
+    assert tree.positions("없는구") is None
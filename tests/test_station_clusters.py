@@ -0,0 +1,64 @@
+"""
+StationClusterIndex 단계별 보존 검증 (합성 좌표)
+"""
+
+import numpy as np
+import pytest
+
+from app.services.station_clusters import StationClusterIndex
+from app.services.station_index import make_station_id
+
+
+N = 500
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    lats = rng.uniform(33.0, 38.5, N)
+    lngs = rng.uniform(125.0, 130.0, N)
+    # 좁은 영역 밀집 + 같은 좌표 중복
+    lats[:50] = 37.5 + rng.normal(0, 0.001, 50)
+    lngs[:50] = 127.0 + rng.normal(0, 0.001, 50)
+    lats[50:53], lngs[50:53] = 35.0, 128.0
+    # 좌표 결측 행은 제외
+    lats[60], lngs[61] = np.nan, np.nan
+    categories = [None if i % 7 == 0 else ("공장", "숙박시설", "판매시설")[i % 3] for i in range(N)]
+    return lats, lngs, categories
+
+
+@pytest.fixture(scope="module")
+def index(data):
+    return StationClusterIndex(*data, max_zoom=12)
+
+
+def test_counts_sum_to_n_at_every_zoom(data, index):
+    lats, lngs, categories = data
+    valid = np.isfinite(lats) & np.isfinite(lngs)
+    labelled = sum(1 for ok, c in zip(valid, categories) if ok and c is not None)
+
+    for zoom in range(index.min_zoom, index.max_zoom + 1):
+        level = index.levels[zoom]
+        assert int(level.counts.sum()) == int(valid.sum())
+        assert int(level.hist.sum()) == labelled
+
+        # 전체 bbox 조회도 같은 합
+        items = index.query(-85, -180, 85, 180, zoom)
+        assert len(items) == len(level)
+        assert sum(item["count"] for item in items) == int(valid.sum())
+
+
+def test_clusters_merge_as_zoom_decreases(index):
+    sizes = [len(index.levels[zoom]) for zoom in range(index.min_zoom, index.max_zoom + 1)]
+    assert sizes == sorted(sizes)
+    assert sizes[0] < sizes[-1]
+
+
+def test_single_station_items_keep_original_coordinates(data, index):
+    lats, lngs, _ = data
+    ids = {make_station_id(lat, lng) for lat, lng in zip(lats, lngs) if np.isfinite(lat) and np.isfinite(lng)}
+    items = index.query(-85, -180, 85, 180, index.max_zoom)
+    singles = [item for item in items if item["count"] == 1]
+    assert singles
+    assert all(item["id"] in ids for item in singles)
+    assert all("id" not in item for item in items if item["count"] > 1)
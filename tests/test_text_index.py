@@ -0,0 +1,83 @@
+"""
+NgramTextIndex.contains ↔ pandas str.contains(regex=False) 일치 검증
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.text_index import NgramTextIndex
+
+
+ADDRESSES = [
+    "서울특별시 종로구 사직로 161",
+    "서울특별시 중구 세종대로 110",
+    "부산광역시 북구 만덕대로 155",
+    "광주광역시 북구 우치로 77",
+    "경기도 안양시 만안구 안양로 300",
+    "경기도 안양시 동안구 시민대로 235",
+    "전북특별자치도 전주시완산구 노송광장로 10",
+    "Seoul Gangnam-gu Teheran-ro 152",
+    "",
+    None,
+    float("nan"),
+]
+
+
+@pytest.fixture(scope="module")
+def frame() -> pd.DataFrame:
+    rng = random.Random(0)
+    rows = ADDRESSES + [rng.choice(ADDRESSES[:8])[rng.randrange(5):] for _ in range(200)]
+    return pd.DataFrame({"주소": rows})
+
+
+@pytest.fixture(scope="module")
+def index(frame) -> NgramTextIndex:
+    return NgramTextIndex.from_frame(frame, ["주소"])
+
+
+def _expected(frame: pd.DataFrame, query: str, case: bool = True) -> np.ndarray:
+    mask = frame["주소"].str.contains(query, case=case, regex=False, na=False)
+    return np.flatnonzero(mask.to_numpy())
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "구",                     # 1글자
+        "북",
+        "로 1",                   # 공백 포함 3글자
+        "북구",
+        "안양시 만안구",          # 3글자 초과
+        "서울특별시 종로구 사직로",
+        "특별자치도 전주",
+        "없는주소",
+        "Teheran",
+    ],
+)
+def test_contains_matches_str_contains(frame, index, query):
+    np.testing.assert_array_equal(index.contains(query, ["주소"]), _expected(frame, query))
+
+
+def test_contains_case_insensitive(frame, index):
+    np.testing.assert_array_equal(
+        index.contains("gangnam", ["주소"], case=False), _expected(frame, "gangnam", case=False)
+    )
+    assert len(index.contains("gangnam", ["주소"])) == 0
+
+
+def test_contains_random_substrings(frame, index):
+    rng = random.Random(1)
+    texts = [text for text in ADDRESSES if isinstance(text, str) and text]
+    for _ in range(300):
+        text = rng.choice(texts)
+        start = rng.randrange(len(text))
+        query = text[start:start + rng.randint(1, 8)]
+        np.testing.assert_array_equal(index.contains(query, ["주소"]), _expected(frame, query))
+
+
+def test_empty_query_returns_rows_with_values(frame, index):
+    # str.contains("") 는 결측(None / NaN)만 제외
+    np.testing.assert_array_equal(index.contains("", ["주소"]), _expected(frame, ""))